@@ -6,11 +6,11 @@ import io
 import time
 from utils.data_fetcher import StockDataFetcher
 from utils.chart_generator import ChartGenerator
-from utils.news_sentiment import NewsSentimentAnalyzer
 from utils.enhanced_backtesting import EnhancedBacktestingEngine
 from utils.help_system import help_system
 from ml.adaptive_strategy import AdaptiveStrategyEngine
 from database.models import init_database, get_db_session
+from config import config
 
 # Configure page
 st.set_page_config(
@@ -533,11 +533,26 @@ def main():
                         # Fetch news sentiment if enabled
                         news_data = None
                         sentiment_summary = None
-                        if show_news:
+                        if show_news and config.ENABLE_NEWS_SENTIMENT:
                             try:
                                 with st.spinner("🔄 Analyzing news sentiment..."):
+                                    # Imported on first use: the NLP and HTTP stack is only loaded
+                                    # by processes that actually show news
+                                    from utils.news_sentiment import NewsSentimentAnalyzer
+                                    from utils.news_ingestion import news_pipeline
                                     news_analyzer = NewsSentimentAnalyzer()
-                                    news_data = news_analyzer.get_stock_news(stock_symbol, limit=15)
+                                    
+                                    # Read from the background-ingested store; analyze live only
+                                    # for symbols the pipeline hasn't picked up yet
+                                    try:
+                                        news_pipeline.add_symbol(stock_symbol)
+                                        news_pipeline.start()
+                                        news_data = news_pipeline.store.get_news(stock_symbol, limit=15)
+                                    except Exception as e:
+                                        print(f"News store unavailable, fetching live: {e}")
+                                        news_data = None
+                                    if not news_data:
+                                        news_data = news_analyzer.get_stock_news(stock_symbol, limit=15)
                                     
                                     if news_data:
                                         sentiment_summary = news_analyzer.get_overall_sentiment(news_data)
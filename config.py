@@ -32,10 +32,35 @@ class Config:
     
     PRICE_REFRESH_INTERVAL = 60
     NEWS_REFRESH_INTERVAL = 300
+    NEWS_WATCHLIST = [
+        symbol.strip().upper()
+        for symbol in os.getenv('NEWS_WATCHLIST', 'AAPL,GOOGL,MSFT,AMZN,TSLA,META,NVDA,NFLX').split(',')
+        if symbol.strip()
+    ]
+    NEWS_INGESTION_WORKERS = int(os.getenv('NEWS_INGESTION_WORKERS', 8))
     
-    ENABLE_NEWS_SENTIMENT = True
+    # Symbols added from the dashboard (beyond NEWS_WATCHLIST): cap and idle expiry
+    NEWS_MAX_EXTRA_SYMBOLS = int(os.getenv('NEWS_MAX_EXTRA_SYMBOLS', 24))
+    NEWS_SYMBOL_IDLE_SECONDS = int(os.getenv('NEWS_SYMBOL_IDLE_SECONDS', 6 * 3600))
+    
+    # Scraper budgets: bytes read per page, CPU seconds per extraction, extraction processes
+    SCRAPER_MAX_BYTES = int(os.getenv('SCRAPER_MAX_BYTES', 1_000_000))
+    SCRAPER_EXTRACT_CPU_SECONDS = float(os.getenv('SCRAPER_EXTRACT_CPU_SECONDS', 2.0))
+    SCRAPER_EXTRACT_WORKERS = int(os.getenv('SCRAPER_EXTRACT_WORKERS', 2))
+    
+    ENABLE_NEWS_SENTIMENT = os.getenv('ENABLE_NEWS_SENTIMENT', 'True').lower() == 'true'
     ENABLE_BACKTESTING = True
     ENABLE_ML_FEATURES = True
     ENABLE_REAL_TIME_LEARNING = True
+    # Run continuous-learning adaptation in a separate process, off the dashboard's CPU
+    LEARNING_PROCESS_ISOLATED = os.getenv('LEARNING_PROCESS_ISOLATED', 'True').lower() == 'true'
+    
+    MODEL_REGISTRY_DIR = os.getenv('MODEL_REGISTRY_DIR', './model_registry')
+    # Registry retention: versions kept per key and training-window keys kept per symbol
+    MODEL_REGISTRY_MAX_VERSIONS = int(os.getenv('MODEL_REGISTRY_MAX_VERSIONS', 3))
+    MODEL_REGISTRY_MAX_KEYS_PER_SYMBOL = int(os.getenv('MODEL_REGISTRY_MAX_KEYS_PER_SYMBOL', 4))
+    
+    # Cold-import seconds allowed per start-up module (python -m utils.import_budget)
+    IMPORT_TIME_BUDGET = float(os.getenv('IMPORT_TIME_BUDGET', 2.0))
 
 config = Config()
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Database models for the professional trading platform
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean, JSON, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -110,6 +110,51 @@ class MarketData(Base):
     sma_20 = Column(Float)
     sma_50 = Column(Float)
 
+class NewsArticle(Base):
+    """Model for deduplicated, sentiment-scored news articles"""
+    __tablename__ = 'news_articles'
+    
+    id = Column(Integer, primary_key=True)
+    article_key = Column(String(255), nullable=False, unique=True, index=True)  # Provider id or URL
+    title = Column(Text, nullable=False)
+    summary = Column(Text)
+    link = Column(Text)
+    source = Column(String(100))
+    published = Column(DateTime, nullable=False, index=True)
+    sentiment_score = Column(Float, nullable=False)
+    sentiment_label = Column(String(10), nullable=False)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+class NewsMention(Base):
+    """Model linking a news article to each symbol it is relevant to"""
+    __tablename__ = 'news_mentions'
+    __table_args__ = (UniqueConstraint('article_id', 'symbol', name='uq_news_mention'),)
+    
+    id = Column(Integer, primary_key=True)
+    article_id = Column(Integer, nullable=False, index=True)
+    symbol = Column(String(20), nullable=False, index=True)
+    relevance = Column(Float, nullable=False)
+    published = Column(DateTime, nullable=False, index=True)  # Copied from the article for per-symbol range queries
+
+class SentimentBucket(Base):
+    """Model for per-symbol news sentiment aggregated into hourly/daily buckets"""
+    __tablename__ = 'sentiment_buckets'
+    __table_args__ = (UniqueConstraint('symbol', 'resolution', 'bucket_start', name='uq_sentiment_bucket'),)
+    
+    id = Column(Integer, primary_key=True)
+    symbol = Column(String(20), nullable=False)
+    resolution = Column(String(10), nullable=False)  # 'hour' or 'day'
+    bucket_start = Column(DateTime, nullable=False, index=True)
+    
+    # Running aggregates, updated incrementally as articles arrive
+    article_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    relevance_sum = Column(Float, nullable=False, default=0.0)
+    weighted_score_sum = Column(Float, nullable=False, default=0.0)  # sum of relevance * score
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 # Database setup functions
 def get_database_url():
     """Get database URL from configuration"""
@@ -4,30 +4,175 @@ Adaptive Trading Strategy Engine with Machine Learning and Self-Learning Capabil
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, r2_score
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import joblib
 import json
+import hashlib
+import os
+from ml.model_registry import ModelRegistry, model_registry
+from ml.trade_ledger import TradeLedger
+from constants import SUPPORTED_MARKETS
+
+MODEL_ATTRIBUTES = ['price_predictor', 'signal_classifier', 'risk_assessor',
+                    'price_scaler', 'signal_scaler', 'risk_scaler']
+
+# Estimator type and default hyperparameters for each model
+MODEL_CLASSES = {
+    'price': RandomForestRegressor,
+    'signal': GradientBoostingRegressor,
+    'risk': RandomForestRegressor
+}
+DEFAULT_MODEL_PARAMS = {
+    'price': {'n_estimators': 100},
+    'signal': {'n_estimators': 100},
+    'risk': {'n_estimators': 50}
+}
+
+# Registry name of the shared cross-symbol model and the market of each known symbol
+POOLED_MODEL_NAME = 'POOLED'
+SYMBOL_MARKETS = {symbol: market for market, symbols in SUPPORTED_MARKETS.items() for symbol in symbols}
+
+# Fixed model-input schema emitted by build_feature_matrix (column order matters)
+FEATURE_SCHEMA = [
+    'price_change', 'price_change_abs', 'high_low_pct', 'open_close_pct',
+    'price_vs_sma_5', 'price_vs_sma_10', 'price_vs_sma_20', 'price_vs_sma_50',
+    'volatility_5', 'volatility_20', 'volatility_ratio',
+    'volume_ratio', 'price_volume',
+    'rsi', 'rsi_momentum', 'macd_pct', 'macd_momentum',
+    'price_momentum_5', 'price_momentum_10',
+    'resistance_strength', 'support_strength',
+    'trend_strength', 'market_regime',
+    'bb_position', 'bb_squeeze',
+    'news_sentiment', 'news_volume'
+]
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_SCHEMA)}
+
+# Stored with every model bundle; bundles built against another schema are not loaded
+FEATURE_SCHEMA_HASH = hashlib.sha1(json.dumps(FEATURE_SCHEMA).encode()).hexdigest()[:12]
+
+# Bars of history needed for the last row's features to be fully defined
+FEATURE_LOOKBACK = 64
+
+def build_feature_matrix(data: pd.DataFrame) -> np.ndarray:
+    """
+    Build the model-input features as a contiguous float32 matrix
+    
+    Only the columns in FEATURE_SCHEMA are materialized; intermediate series
+    (moving averages, volume averages) never become DataFrame columns.
+    
+    Args:
+        data: Historical data with OHLCV, RSI and MACD columns (optionally
+            news_sentiment/news_volume)
+        
+    Returns:
+        Array of shape (len(data), len(FEATURE_SCHEMA)), NaN where undefined
+    """
+    close = data['Close']
+    high, low = data['High'], data['Low']
+    out = np.empty((len(data), len(FEATURE_SCHEMA)), dtype=np.float32)
+    
+    def put(name, values):
+        out[:, FEATURE_INDEX[name]] = np.asarray(values, dtype=np.float64)
+    
+    # Price-based features
+    price_change = close.pct_change()
+    put('price_change', price_change)
+    put('price_change_abs', price_change.abs())
+    put('high_low_pct', (high - low) / close)
+    put('open_close_pct', (close - data['Open']) / data['Open'])
+    
+    # Moving averages and trends
+    for window in [5, 10, 20, 50]:
+        put(f'price_vs_sma_{window}', close / close.rolling(window=window).mean() - 1)
+    
+    # Volatility features
+    volatility_5 = price_change.rolling(5).std()
+    volatility_20 = price_change.rolling(20).std()
+    put('volatility_5', volatility_5)
+    put('volatility_20', volatility_20)
+    put('volatility_ratio', volatility_5 / volatility_20)
+    
+    # Volume features
+    volume_ratio = data['Volume'] / data['Volume'].rolling(10).mean()
+    put('volume_ratio', volume_ratio)
+    put('price_volume', price_change * volume_ratio)
+    
+    # Technical momentum
+    put('rsi', data['RSI'])
+    put('rsi_momentum', data['RSI'].diff())
+    put('macd_pct', data['MACD'] / close)
+    put('macd_momentum', data['MACD'].diff())
+    put('price_momentum_5', close.pct_change(5))
+    put('price_momentum_10', close.pct_change(10))
+    
+    # Support/Resistance levels
+    put('resistance_strength', high.rolling(20).max() / close - 1)
+    put('support_strength', 1 - low.rolling(20).min() / close)
+    
+    # Market regime detection
+    trend_strength = (close / close.rolling(50).mean() - 1).rolling(10).mean()
+    put('trend_strength', trend_strength)
+    put('market_regime', np.where(trend_strength > 0.02, 1, np.where(trend_strength < -0.02, -1, 0)))
+    
+    # Bollinger Band position (neutral when bands are not available)
+    upper = data['BB_Upper'] if 'BB_Upper' in data.columns else data.get('BB_upper')
+    lower = data['BB_Lower'] if 'BB_Lower' in data.columns else data.get('BB_lower')
+    if upper is not None and lower is not None:
+        put('bb_position', (close - lower) / (upper - lower))
+        put('bb_squeeze', (upper - lower) / close)
+    else:
+        put('bb_position', np.full(len(data), 0.5))
+        put('bb_squeeze', np.zeros(len(data)))
+    
+    # News sentiment (joined by utils.sentiment_series; neutral when absent)
+    for name in ['news_sentiment', 'news_volume']:
+        put(name, data[name] if name in data.columns else np.zeros(len(data)))
+    
+    # Infinite ratios (zero volume, flat bands) are treated as undefined
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+def holdout_mask(block_lengths: List[int], test_size: float = 0.2) -> np.ndarray:
+    """
+    Mark the most recent rows of each time-ordered block as the test set
+    
+    Args:
+        block_lengths: Rows per block (one block per symbol when pooling)
+        test_size: Fraction of each block held out
+        
+    Returns:
+        Boolean mask over the stacked rows, True for test rows
+    """
+    mask = np.zeros(sum(block_lengths), dtype=bool)
+    end = 0
+    for length in block_lengths:
+        end += length
+        mask[end - int(np.ceil(length * test_size)):end] = True
+    return mask
+
+def build_model(model_name: str, params: Optional[Dict] = None):
+    """Create an unfitted estimator for a model, applying hyperparameter overrides"""
+    model_params = {**DEFAULT_MODEL_PARAMS[model_name], **(params or {}), 'random_state': 42}
+    return MODEL_CLASSES[model_name](**model_params)
 
 class AdaptiveStrategyEngine:
     """Advanced ML-based trading strategy that learns and adapts in real-time"""
     
-    def __init__(self, learning_rate: float = 0.01, adaptation_threshold: float = 0.05):
+    def __init__(self, learning_rate: float = 0.01, adaptation_threshold: float = 0.05,
+                 registry: Optional[ModelRegistry] = None):
         self.learning_rate = learning_rate
         self.adaptation_threshold = adaptation_threshold
         
-        # ML Models for different aspects
-        self.price_predictor = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.signal_classifier = GradientBoostingRegressor(n_estimators=100, random_state=42)
-        self.risk_assessor = RandomForestRegressor(n_estimators=50, random_state=42)
+        # Registry used to share trained models between engine instances
+        self.registry = registry if registry is not None else model_registry
+        self.is_trained = False
         
-        # Scalers for feature normalization
-        self.price_scaler = StandardScaler()
-        self.signal_scaler = StandardScaler()
-        self.risk_scaler = StandardScaler()
+        # ML Models and scalers for different aspects
+        self.model_params = {}
+        self._build_models()
         
         # Strategy state tracking
         self.strategy_weights = {
@@ -41,88 +186,183 @@ class AdaptiveStrategyEngine:
         self.performance_history = []
         self.adaptation_log = []
         self.trade_outcomes = []
+        self.trade_ledger = TradeLedger(self.strategy_weights.keys())
         
         # Model performance metrics
         self.model_accuracy = {'price': 0.0, 'signal': 0.0, 'risk': 0.0}
         
-    def prepare_features(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Prepare comprehensive feature set for ML models"""
-        df = data.copy()
+        # Market/symbol encoding when serving a pooled cross-symbol model
+        self.pooled_encoding = None
+        
+        # Active model-input columns (FEATURE_SCHEMA minus pruned features)
+        self.feature_columns = list(FEATURE_SCHEMA)
+        
+        # Registry entry the current models came from (or were stored under)
+        self.registry_key = None
+        self.registry_version = None
+        self.last_training_results = {}
         
-        # Price-based features
-        df['price_change'] = df['Close'].pct_change()
-        df['price_change_abs'] = df['price_change'].abs()
-        df['high_low_pct'] = (df['High'] - df['Low']) / df['Close']
-        df['open_close_pct'] = (df['Close'] - df['Open']) / df['Open']
+    def _build_models(self, model_params: Optional[Dict] = None):
+        """Create fresh (unfitted) models and scalers"""
+        self.model_params = model_params or {}
+        self.price_predictor = build_model('price', self.model_params.get('price'))
+        self.signal_classifier = build_model('signal', self.model_params.get('signal'))
+        self.risk_assessor = build_model('risk', self.model_params.get('risk'))
         
-        # Moving averages and trends
-        for window in [5, 10, 20, 50]:
-            df[f'sma_{window}'] = df['Close'].rolling(window=window).mean()
-            df[f'price_vs_sma_{window}'] = df['Close'] / df[f'sma_{window}'] - 1
+        # Scalers for feature normalization
+        self.price_scaler = StandardScaler()
+        self.signal_scaler = StandardScaler()
+        self.risk_scaler = StandardScaler()
         
-        # Volatility features
-        df['volatility_5'] = df['price_change'].rolling(5).std()
-        df['volatility_20'] = df['price_change'].rolling(20).std()
-        df['volatility_ratio'] = df['volatility_5'] / df['volatility_20']
+    def build_training_set(self, data: pd.DataFrame) -> Tuple[np.ndarray, Dict[str, np.ndarray], List[str]]:
+        """
+        Build the feature matrix and per-model targets used for training
         
-        # Volume features
-        df['volume_sma_10'] = df['Volume'].rolling(10).mean()
-        df['volume_ratio'] = df['Volume'] / df['volume_sma_10']
-        df['price_volume'] = df['price_change'] * df['volume_ratio']
+        Args:
+            data: Historical data with technical indicators
+            
+        Returns:
+            Tuple of (float32 feature matrix, targets keyed by model name, feature names)
+            
+        Raises:
+            ValueError: If there is not enough data after preprocessing
+        """
+        features = build_feature_matrix(data)
+        feature_rows = np.isfinite(features).all(axis=1)
         
-        # Technical momentum
-        df['rsi_momentum'] = df['RSI'].diff()
-        df['macd_momentum'] = df['MACD'].diff()
-        df['price_momentum_5'] = df['Close'].pct_change(5)
-        df['price_momentum_10'] = df['Close'].pct_change(10)
+        if feature_rows.sum() < 50:
+            raise ValueError('Insufficient data for training')
         
-        # Support/Resistance levels
-        df['resistance_strength'] = df['High'].rolling(20).max() / df['Close'] - 1
-        df['support_strength'] = 1 - df['Low'].rolling(20).min() / df['Close']
+        # Prepare target variables
+        close = data['Close'].to_numpy(dtype=np.float64)
+        future_return_1 = np.full(len(close), np.nan)
+        future_return_1[:-1] = close[1:] / close[:-1] - 1  # Next period return
+        
+        targets = {
+            'price': future_return_1,
+            'signal': np.where(future_return_1 > 0.01, 1, np.where(future_return_1 < -0.01, -1, 0)),
+            'risk': features[:, FEATURE_INDEX['volatility_20']].astype(np.float64)
+        }
         
-        # Market regime detection
-        df['trend_strength'] = (df['Close'] / df['sma_50'] - 1).rolling(10).mean()
-        df['market_regime'] = np.where(df['trend_strength'] > 0.02, 1, 
-                                     np.where(df['trend_strength'] < -0.02, -1, 0))
+        # Remove rows with NaN features or targets
+        valid = feature_rows & np.isfinite(future_return_1)
         
-        # Bollinger Band position
-        if 'BB_upper' in df.columns and 'BB_lower' in df.columns:
-            df['bb_position'] = (df['Close'] - df['BB_lower']) / (df['BB_upper'] - df['BB_lower'])
-            df['bb_squeeze'] = (df['BB_upper'] - df['BB_lower']) / df['Close']
+        if valid.sum() < 30:
+            raise ValueError('Insufficient data after preprocessing')
         
-        return df
+        columns = [FEATURE_INDEX[name] for name in self.feature_columns]
+        X = np.ascontiguousarray(features[valid][:, columns])
+        targets = {name: target[valid] for name, target in targets.items()}
+        
+        return X, targets, list(self.feature_columns)
     
-    def train_models(self, data: pd.DataFrame) -> Dict:
-        """Train all ML models on historical data"""
+    def train_models(self, data: pd.DataFrame, symbol: Optional[str] = None,
+                     prune_threshold: Optional[float] = None) -> Dict:
+        """
+        Train all ML models on historical data
+        
+        Args:
+            data: Historical data with technical indicators
+            symbol: Stock ticker symbol; when given, a model already trained on the
+                same symbol and data window is reused from the registry
+            prune_threshold: When set, features whose mean importance falls below
+                this value are dropped and the models are refitted without them
+            
+        Returns:
+            Training results
+        """
+        # Tuned hyperparameters for this symbol, if a search has been run
+        model_params = {}
+        if symbol and self.registry is not None:
+            model_params = self.registry.load_hyperparameters(symbol) or {}
+        
+        registry_key = None
+        if symbol:
+            # Pruned models are stored apart from unpruned ones trained on the same window
+            variant_params = dict(model_params)
+            if prune_threshold is not None:
+                variant_params['prune_threshold'] = prune_threshold
+            variant = ModelRegistry.params_digest(variant_params) if variant_params else None
+            registry_key = ModelRegistry.make_key(symbol, data, variant=variant)
+        
+        if registry_key and self.registry is not None:
+            cached = self.registry.load(registry_key)
+            if cached is not None and self._bundle_matches_schema(cached, registry_key):
+                self._apply_model_bundle(cached)
+                self.registry_key = registry_key
+                self.registry_version = self.registry.latest_version(registry_key)
+                return {**cached['training_results'], 'loaded_from_registry': True}
+        
+        # Fresh estimators so models shared through the registry are never refitted;
+        # pruning starts from the full schema and only narrows this bundle's columns
+        self._build_models(model_params)
+        self.pooled_encoding = None
+        self.feature_columns = list(FEATURE_SCHEMA)
         
-        # Prepare features
-        df = self.prepare_features(data)
-        df = df.dropna()
+        try:
+            X, targets, price_features = self.build_training_set(data)
+        except ValueError as e:
+            return {'status': 'error', 'message': str(e)}
         
-        if len(df) < 50:
-            return {'status': 'error', 'message': 'Insufficient data for training'}
+        price_accuracy, signal_accuracy, risk_accuracy = self._fit_models(X, targets)
         
-        # Feature columns for different models
-        price_features = [col for col in df.columns if col not in 
-                         ['Open', 'High', 'Low', 'Close', 'Volume', 'Date']]
+        pruned_features = []
+        if prune_threshold is not None:
+            pruned_features = self.prune_features(prune_threshold)
+            if pruned_features:
+                X, targets, price_features = self.build_training_set(data)
+                self._build_models(model_params)
+                price_accuracy, signal_accuracy, risk_accuracy = self._fit_models(X, targets)
         
-        # Prepare target variables
-        df['future_return_1'] = df['Close'].pct_change().shift(-1)  # Next period return
-        df['future_return_5'] = df['Close'].pct_change(5).shift(-5)  # 5-period return
-        df['signal_target'] = np.where(df['future_return_1'] > 0.01, 1, 
-                                     np.where(df['future_return_1'] < -0.01, -1, 0))
-        
-        # Remove rows with NaN targets
-        df = df.dropna()
+        training_results = {
+            'status': 'success',
+            'samples_trained': len(X),
+            'price_model_accuracy': price_accuracy,
+            'signal_model_accuracy': signal_accuracy,
+            'risk_model_accuracy': risk_accuracy,
+            'features_used': len(price_features),
+            'features_pruned': pruned_features,
+            'training_date': datetime.now().isoformat()
+        }
         
-        if len(df) < 30:
-            return {'status': 'error', 'message': 'Insufficient data after preprocessing'}
+        self.is_trained = True
+        self.last_training_results = training_results
+        
+        if registry_key and self.registry is not None:
+            try:
+                self.registry_key = registry_key
+                self.registry_version = self.registry.save(registry_key, self._model_bundle(training_results), {
+                    'symbol': symbol,
+                    'samples_trained': len(X),
+                    'model_accuracy': self.model_accuracy,
+                    'model_params': model_params,
+                    'feature_schema_hash': FEATURE_SCHEMA_HASH
+                })
+            except Exception as e:
+                print(f"Failed to store models in registry: {e}")
         
-        X = df[price_features].values
+        return training_results
+    
+    def _fit_models(self, X: np.ndarray, targets: Dict[str, np.ndarray],
+                    test_mask: Optional[np.ndarray] = None) -> Tuple[float, float, float]:
+        """
+        Fit the price, signal and risk models and return their test R² scores
+        
+        Args:
+            X: Time-ordered feature matrix
+            targets: Targets keyed by model name
+            test_mask: Rows to hold out (the most recent 20% if None); never
+                shuffled, so the models are scored on data after their training window
+            
+        Returns:
+            Tuple of (price, signal, risk) test R² scores
+        """
+        test_mask = holdout_mask([len(X)]) if test_mask is None else test_mask
+        X_train, X_test = X[~test_mask], X[test_mask]
         
         # Train price prediction model
-        y_price = df['future_return_1'].values
-        X_train, X_test, y_train, y_test = train_test_split(X, y_price, test_size=0.2, random_state=42)
+        y_price = targets['price']
+        y_train, y_test = y_price[~test_mask], y_price[test_mask]
         
         X_train_scaled = self.price_scaler.fit_transform(X_train)
         X_test_scaled = self.price_scaler.transform(X_test)
@@ -133,8 +373,8 @@ class AdaptiveStrategyEngine:
         self.model_accuracy['price'] = max(0, price_accuracy)
         
         # Train signal classification model
-        y_signal = df['signal_target'].values
-        X_train, X_test, y_train, y_test = train_test_split(X, y_signal, test_size=0.2, random_state=42)
+        y_signal = targets['signal']
+        y_train, y_test = y_signal[~test_mask], y_signal[test_mask]
         
         X_train_scaled = self.signal_scaler.fit_transform(X_train)
         X_test_scaled = self.signal_scaler.transform(X_test)
@@ -145,9 +385,8 @@ class AdaptiveStrategyEngine:
         self.model_accuracy['signal'] = max(0, signal_accuracy)
         
         # Train risk assessment model
-        df['volatility_target'] = df['volatility_20']
-        y_risk = df['volatility_target'].values
-        X_train, X_test, y_train, y_test = train_test_split(X, y_risk, test_size=0.2, random_state=42)
+        y_risk = targets['risk']
+        y_train, y_test = y_risk[~test_mask], y_risk[test_mask]
         
         X_train_scaled = self.risk_scaler.fit_transform(X_train)
         X_test_scaled = self.risk_scaler.transform(X_test)
@@ -157,34 +396,239 @@ class AdaptiveStrategyEngine:
         risk_accuracy = r2_score(y_test, risk_pred)
         self.model_accuracy['risk'] = max(0, risk_accuracy)
         
+        return price_accuracy, signal_accuracy, risk_accuracy
+    
+    def feature_importances(self) -> Dict[str, float]:
+        """Mean normalized feature importance of the fitted models, by feature name"""
+        importances = np.zeros(len(self.feature_columns))
+        for model in (self.price_predictor, self.signal_classifier, self.risk_assessor):
+            model_importances = model.feature_importances_[:len(self.feature_columns)]
+            total = model_importances.sum()
+            if total > 0:
+                importances += model_importances / total
+        
+        importances /= 3
+        return dict(zip(self.feature_columns, importances.tolist()))
+    
+    def prune_features(self, min_importance: float = 0.01, min_features: int = 8) -> List[str]:
+        """
+        Drop low-importance features from the model-input schema
+        
+        The models must be refitted afterwards since their input width changes.
+        
+        Args:
+            min_importance: Features with mean importance below this are dropped
+            min_features: Never keep fewer than this many features
+            
+        Returns:
+            Names of the dropped features
+        """
+        importances = self.feature_importances()
+        ranked = sorted(importances, key=importances.get, reverse=True)
+        keep = set(ranked[:min_features]) | {name for name, value in importances.items() if value >= min_importance}
+        
+        dropped = [name for name in self.feature_columns if name not in keep]
+        self.feature_columns = [name for name in self.feature_columns if name in keep]
+        return dropped
+    
+    def train_pooled(self, datasets: Dict[str, pd.DataFrame]) -> Dict:
+        """
+        Train one shared set of models on a stacked feature matrix across many symbols
+        
+        Args:
+            datasets: Historical data with technical indicators keyed by symbol
+            
+        Returns:
+            Training results
+        """
+        symbols = sorted(datasets)
+        registry_key = None
+        if self.registry is not None and symbols:
+            window_digest = ModelRegistry.params_digest(
+                {symbol: ModelRegistry.make_key(symbol, datasets[symbol]) for symbol in symbols}
+            )
+            registry_key = f"{POOLED_MODEL_NAME}__{len(symbols)}_{window_digest}"
+            cached = self.registry.load(registry_key)
+            if cached is not None and self._bundle_matches_schema(cached, registry_key):
+                self._apply_model_bundle(cached)
+                return {**cached['training_results'], 'loaded_from_registry': True}
+        
+        encoding = {'markets': list(SUPPORTED_MARKETS), 'symbols': symbols}
+        self._build_models()
+        self.pooled_encoding = encoding
+        self.feature_columns = list(FEATURE_SCHEMA)
+        
+        blocks, target_blocks, skipped = [], [], {}
+        schema = None
+        for symbol in symbols:
+            try:
+                X, targets, features = self.build_training_set(datasets[symbol])
+            except ValueError as e:
+                skipped[symbol] = str(e)
+                continue
+            
+            # Every symbol must share the feature layout of the first one
+            schema = schema or features
+            if features != schema:
+                skipped[symbol] = 'Feature columns differ from pooled schema'
+                continue
+            
+            symbol_columns = np.repeat(self._symbol_encoding(symbol).reshape(1, -1), len(X), axis=0)
+            blocks.append(np.hstack([X, symbol_columns]))
+            target_blocks.append(targets)
+        
+        if not blocks:
+            self.pooled_encoding = None
+            return {'status': 'error', 'message': 'Insufficient data for pooled training', 'skipped': skipped}
+        
+        X = np.vstack(blocks)
+        targets = {name: np.concatenate([t[name] for t in target_blocks]) for name in MODEL_CLASSES}
+        
+        # Hold out the latest bars of every symbol, not the last symbols in the stack
+        test_mask = holdout_mask([len(block) for block in blocks])
+        price_accuracy, signal_accuracy, risk_accuracy = self._fit_models(X, targets, test_mask)
+        
         training_results = {
             'status': 'success',
-            'samples_trained': len(df),
+            'pooled': True,
+            'symbols_trained': len(blocks),
+            'symbols_skipped': skipped,
+            'samples_trained': len(X),
             'price_model_accuracy': price_accuracy,
             'signal_model_accuracy': signal_accuracy,
             'risk_model_accuracy': risk_accuracy,
-            'features_used': len(price_features),
+            'features_used': X.shape[1],
             'training_date': datetime.now().isoformat()
         }
         
+        self.is_trained = True
+        self.last_training_results = training_results
+        
+        if registry_key:
+            try:
+                self.registry_key = registry_key
+                self.registry_version = self.registry.save(registry_key, self._model_bundle(training_results), {
+                    'symbol': POOLED_MODEL_NAME,
+                    'symbols': symbols,
+                    'samples_trained': len(X),
+                    'model_accuracy': self.model_accuracy,
+                    'feature_schema_hash': FEATURE_SCHEMA_HASH
+                })
+            except Exception as e:
+                print(f"Failed to store pooled models in registry: {e}")
+        
         return training_results
     
-    def generate_adaptive_signals(self, data: pd.DataFrame) -> Dict:
-        """Generate trading signals using adaptive ML models"""
-        
-        # Prepare features for latest data point
-        df = self.prepare_features(data)
-        latest_features = df.iloc[-1]
-        
-        # Get feature columns
-        feature_cols = [col for col in df.columns if col not in 
-                       ['Open', 'High', 'Low', 'Close', 'Volume', 'Date']]
+    def _symbol_encoding(self, symbol: Optional[str]) -> np.ndarray:
+        """Market one-hot columns plus a symbol id for the pooled models"""
+        markets = self.pooled_encoding['markets']
+        symbols = self.pooled_encoding['symbols']
+        
+        encoding = np.zeros(len(markets) + 1)
+        market = SYMBOL_MARKETS.get(symbol)
+        if market in markets:
+            encoding[markets.index(market)] = 1.0
+        encoding[-1] = symbols.index(symbol) if symbol in symbols else -1
+        
+        return encoding
+    
+    def load_latest_models(self, symbol: str, allow_pooled: bool = True) -> bool:
+        """Reuse the most recently trained registry models for a symbol, else the pooled model"""
+        if self.registry is None:
+            return False
+        
+        key = self.registry.latest_key_for_symbol(symbol)
+        if key is None and allow_pooled:
+            key = self.registry.latest_key_for_symbol(POOLED_MODEL_NAME)
+        version = self.registry.latest_version(key) if key else None
+        bundle = self.registry.load(key, version) if key else None
+        if bundle is None or not self._bundle_matches_schema(bundle, key):
+            return False
+        
+        self._apply_model_bundle(bundle)
+        if 'strategy_weights' in bundle:
+            self.strategy_weights = dict(bundle['strategy_weights'])
+        self.registry_key, self.registry_version = key, version
+        return True
+    
+    def refresh_models(self, symbol: str) -> bool:
+        """Load the symbol's newest registry models if they differ from the ones in use"""
+        if self.registry is None:
+            return False
+        
+        key = self.registry.latest_key_for_symbol(symbol)
+        if key is None or (key, self.registry.latest_version(key)) == (self.registry_key, self.registry_version):
+            return False
+        return self.load_latest_models(symbol, allow_pooled=False)
+    
+    def publish_models(self, symbol: str, metadata: Optional[Dict] = None) -> Optional[int]:
+        """
+        Store the current models and strategy weights as a new registry version
         
-        X_latest = latest_features[feature_cols].values.reshape(1, -1)
+        Args:
+            symbol: Stock ticker symbol the models serve
+            metadata: Extra JSON-serializable information about the update
+            
+        Returns:
+            The new version number, or None if there is nothing to publish
+        """
+        if self.registry is None or not self.is_trained:
+            return None
+        
+        key = self.registry_key or self.registry.latest_key_for_symbol(symbol)
+        if self.pooled_encoding:
+            # Never overwrite the shared pooled model with one symbol's adaptations
+            key = f"{ModelRegistry._safe_symbol(symbol)}__{POOLED_MODEL_NAME.lower()}"
+        if key is None:
+            return None
+        
+        self.registry_version = self.registry.save(key, self._model_bundle(self.last_training_results), {
+            'symbol': symbol,
+            'model_accuracy': self.model_accuracy,
+            'strategy_weights': self.strategy_weights,
+            'feature_schema_hash': FEATURE_SCHEMA_HASH,
+            **(metadata or {})
+        })
+        self.registry_key = key
+        return self.registry_version
+    
+    def _model_bundle(self, training_results: Optional[Dict] = None) -> Dict:
+        """Collect fitted models, scalers and accuracy into one bundle"""
+        bundle = {name: getattr(self, name) for name in MODEL_ATTRIBUTES}
+        bundle['model_accuracy'] = dict(self.model_accuracy)
+        bundle['model_params'] = self.model_params
+        bundle['pooled_encoding'] = self.pooled_encoding
+        bundle['feature_columns'] = list(self.feature_columns)
+        bundle['feature_schema_hash'] = FEATURE_SCHEMA_HASH
+        bundle['strategy_weights'] = dict(self.strategy_weights)
+        bundle['training_results'] = training_results or {}
+        return bundle
+    
+    @staticmethod
+    def _bundle_matches_schema(bundle: Dict, key: str) -> bool:
+        """Whether a stored bundle was trained on the current feature schema"""
+        if bundle.get('feature_schema_hash') == FEATURE_SCHEMA_HASH:
+            return True
+        print(f"Ignoring models {key}: trained on a different feature schema")
+        return False
+    
+    def _apply_model_bundle(self, bundle: Dict):
+        """Install models, scalers and accuracy from a bundle"""
+        for name in MODEL_ATTRIBUTES:
+            setattr(self, name, bundle[name])
+        self.model_accuracy = dict(bundle['model_accuracy'])
+        self.model_params = bundle.get('model_params', {})
+        self.pooled_encoding = bundle.get('pooled_encoding')
+        self.feature_columns = list(bundle.get('feature_columns', FEATURE_SCHEMA))
+        self.last_training_results = bundle.get('training_results', {})
+        self.is_trained = True
+    
+    def generate_adaptive_signals(self, data: pd.DataFrame, symbol: Optional[str] = None) -> Dict:
+        """Generate trading signals using adaptive ML models"""
         
-        # Handle missing values
-        if np.isnan(X_latest).any():
-            X_latest = np.nan_to_num(X_latest, nan=0.0)
+        # Compact features for the latest data point (only the trailing window is needed)
+        features = build_feature_matrix(data.tail(FEATURE_LOOKBACK))
+        X_latest = self._model_inputs(features[-1:], symbol)
         
         try:
             # Get predictions from all models
@@ -244,6 +688,83 @@ class AdaptiveStrategyEngine:
                 'reasons': ['Using fallback strategy due to prediction error']
             }
     
+    def generate_adaptive_signals_batch(self, data: pd.DataFrame, start: int = 0,
+                                        symbol: Optional[str] = None) -> Dict:
+        """
+        Score every bar from `start` onward with one prediction call per model
+        
+        Features are computed once for the whole frame; each row only uses data
+        up to its own bar, so row k is the signal for the bar at position start + k.
+        
+        Args:
+            data: Historical data with technical indicators
+            start: Position of the first bar to score
+            symbol: Stock ticker symbol (needed for pooled models)
+            
+        Returns:
+            Dictionary of per-bar arrays: signal, strength, confidence,
+            price_prediction, signal_raw and risk_level
+        """
+        X = self._model_inputs(build_feature_matrix(data)[start:], symbol)
+        n = len(X)
+        
+        confidence = (
+            self.model_accuracy['price'] * 0.4 +
+            self.model_accuracy['signal'] * 0.4 +
+            self.model_accuracy['risk'] * 0.2
+        )
+        
+        try:
+            if n == 0:
+                raise ValueError('No bars to score')
+            
+            price_prediction = self.price_predictor.predict(self.price_scaler.transform(X))
+            signal_strength = self.signal_classifier.predict(self.signal_scaler.transform(X))
+            risk_assessment = self.risk_assessor.predict(self.risk_scaler.transform(X))
+            
+        except Exception as e:
+            return {
+                'signal': np.full(n, 'HOLD', dtype=object),
+                'strength': np.zeros(n),
+                'confidence': np.full(n, 0.1),
+                'error': f'ML prediction failed: {str(e)}',
+                'fallback': True
+            }
+        
+        final_signal_strength = (
+            price_prediction * self.strategy_weights['technical'] +
+            signal_strength * self.strategy_weights['momentum'] +
+            risk_assessment * self.strategy_weights['volatility']
+        )
+        
+        # Same thresholds as generate_adaptive_signals
+        buy = (final_signal_strength > 0.01) & (confidence > 0.3)
+        sell = (final_signal_strength < -0.01) & (confidence > 0.3)
+        
+        return {
+            'signal': np.where(buy, 'BUY', np.where(sell, 'SELL', 'HOLD')).astype(object),
+            'strength': np.where(buy | sell, np.minimum(5, np.abs(final_signal_strength) * 10), 0.0),
+            'confidence': np.full(n, confidence),
+            'price_prediction': price_prediction,
+            'signal_raw': signal_strength,
+            'risk_level': risk_assessment
+        }
+    
+    def _model_inputs(self, features: np.ndarray, symbol: Optional[str] = None) -> np.ndarray:
+        """Select the active feature columns, fill missing values and append the pooled encoding"""
+        X = features[:, [FEATURE_INDEX[name] for name in self.feature_columns]]
+        
+        # Handle missing values
+        if np.isnan(X).any():
+            X = np.nan_to_num(X, nan=0.0)
+        
+        # Pooled models also take the market/symbol encoding
+        if self.pooled_encoding:
+            encoding = self._symbol_encoding(symbol)
+            X = np.hstack([X, np.broadcast_to(encoding, (len(X), len(encoding)))])
+        
+        return X
+    
     def _generate_signal_reasons(self, price_pred: float, signal_strength: float, risk_level: float) -> List[str]:
         """Generate human-readable reasons for the trading signal"""
         reasons = []
@@ -267,52 +788,73 @@ class AdaptiveStrategyEngine:
         
         return reasons
     
-    def adapt_strategy(self, recent_performance: List[Dict]) -> Dict:
-        """Adapt strategy weights based on recent performance"""
+    def record_trade_outcome(self, profit_loss: float, timestamp=None, strategy: Optional[str] = None):
+        """
+        Record a closed trade in the engine's trade ledger
+        
+        Args:
+            profit_loss: Realized profit/loss of the trade
+            timestamp: Close time of the trade (datetime or numeric step)
+            strategy: Strategy to credit (dominant strategy at close time if None)
+        """
+        strategy = strategy or max(self.strategy_weights, key=self.strategy_weights.get)
+        self.trade_ledger.record(strategy, profit_loss, timestamp)
+    
+    def adapt_strategy(self, recent_performance: Optional[List[Dict]] = None) -> Dict:
+        """
+        Adapt strategy weights based on recent performance
         
-        if len(recent_performance) < 10:
+        Args:
+            recent_performance: Trade dicts with 'profit_loss' to analyze; when None the
+                decayed statistics of the engine's trade ledger are used instead
+            
+        Returns:
+            Adaptation results
+        """
+        if recent_performance is None:
+            ledger = self.trade_ledger
+            performance_analyzed = ledger.size
+        else:
+            # Trade lists are scored without decay over the last 20 trades, crediting
+            # each one to the currently dominant strategy
+            ledger = TradeLedger(self.strategy_weights.keys(), half_life=None)
+            dominant = max(self.strategy_weights, key=self.strategy_weights.get)
+            profits = [trade['profit_loss'] for trade in recent_performance[-20:]
+                       if trade.get('profit_loss') is not None]
+            ledger.record_many([dominant] * len(profits), profits, [0.0] * len(profits))
+            performance_analyzed = len(recent_performance)
+        
+        if performance_analyzed < 10:
             return {'status': 'insufficient_data', 'adaptations': []}
         
-        # Analyze performance by strategy component
-        strategy_performance = {strategy: [] for strategy in self.strategy_weights.keys()}
+        # Per-strategy statistics as arrays aligned with the ledger's strategy ids
+        stats = ledger.statistics()
+        names = ledger.strategies
+        old_weights = np.array([self.strategy_weights[name] for name in names])
         
-        for trade in recent_performance[-20:]:  # Last 20 trades
-            if trade.get('profit_loss') is not None:
-                # Attribute performance to dominant strategy at time of trade
-                dominant = max(self.strategy_weights, key=self.strategy_weights.get)
-                strategy_performance[dominant].append(trade['profit_loss'])
+        evaluated = stats['effective_count'] >= 3
+        increase = evaluated & (stats['success_rate'] > 0.6) & (stats['avg_profit'] > 0)
+        decrease = evaluated & ~increase & ((stats['success_rate'] < 0.4) | (stats['avg_profit'] < 0))
         
-        adaptations = []
+        new_weights = old_weights.copy()
+        new_weights[increase] = np.minimum(0.6, old_weights[increase] + self.learning_rate)
+        new_weights[decrease] = np.maximum(0.1, old_weights[decrease] - self.learning_rate)
         
-        # Adjust weights based on performance
-        for strategy, profits in strategy_performance.items():
-            if len(profits) >= 3:
-                avg_profit = np.mean(profits)
-                success_rate = len([p for p in profits if p > 0]) / len(profits)
-                
-                if success_rate > 0.6 and avg_profit > 0:
-                    # Increase weight for successful strategy
-                    old_weight = self.strategy_weights[strategy]
-                    self.strategy_weights[strategy] = min(0.6, old_weight + self.learning_rate)
-                    adaptations.append(f"Increased {strategy} weight from {old_weight:.3f} to {self.strategy_weights[strategy]:.3f}")
-                
-                elif success_rate < 0.4 or avg_profit < 0:
-                    # Decrease weight for unsuccessful strategy
-                    old_weight = self.strategy_weights[strategy]
-                    self.strategy_weights[strategy] = max(0.1, old_weight - self.learning_rate)
-                    adaptations.append(f"Decreased {strategy} weight from {old_weight:.3f} to {self.strategy_weights[strategy]:.3f}")
+        adaptations = []
+        for i in np.flatnonzero(increase | decrease):
+            verb = "Increased" if increase[i] else "Decreased"
+            adaptations.append(f"{verb} {names[i]} weight from {old_weights[i]:.3f} to {new_weights[i]:.3f}")
         
         # Normalize weights to sum to 1
-        total_weight = sum(self.strategy_weights.values())
-        for strategy in self.strategy_weights:
-            self.strategy_weights[strategy] /= total_weight
+        new_weights /= new_weights.sum()
+        self.strategy_weights = {name: float(weight) for name, weight in zip(names, new_weights)}
         
         # Log adaptation
         adaptation_record = {
             'timestamp': datetime.now().isoformat(),
             'adaptations': adaptations,
             'new_weights': self.strategy_weights.copy(),
-            'performance_analyzed': len(recent_performance)
+            'performance_analyzed': performance_analyzed
         }
         
         self.adaptation_log.append(adaptation_record)
@@ -324,7 +866,8 @@ class AdaptiveStrategyEngine:
             'adaptation_count': len(adaptations)
         }
     
-    def retrain_if_needed(self, new_data: pd.DataFrame, performance_threshold: float = 0.3) -> bool:
+    def retrain_if_needed(self, new_data: pd.DataFrame, performance_threshold: float = 0.3,
+                          symbol: Optional[str] = None) -> bool:
         """Retrain models if performance drops below threshold"""
         
         current_avg_accuracy = np.mean(list(self.model_accuracy.values()))
@@ -333,7 +876,7 @@ class AdaptiveStrategyEngine:
             print(f"Model accuracy ({current_avg_accuracy:.3f}) below threshold ({performance_threshold})")
             print("Initiating model retraining...")
             
-            retraining_results = self.train_models(new_data)
+            retraining_results = self.train_models(new_data, symbol=symbol)
             
             if retraining_results['status'] == 'success':
                 print(f"Retraining completed. New accuracy: {np.mean(list(self.model_accuracy.values())):.3f}")
@@ -345,7 +888,7 @@ class AdaptiveStrategyEngine:
         return False
     
     def save_strategy(self, filepath: str):
-        """Save the trained strategy to disk"""
+        """Save the trained strategy to disk as a single bundle"""
         strategy_data = {
             'strategy_weights': self.strategy_weights,
             'model_accuracy': self.model_accuracy,
@@ -354,36 +897,37 @@ class AdaptiveStrategyEngine:
             'adaptation_threshold': self.adaptation_threshold
         }
         
-        # Save models
-        joblib.dump(self.price_predictor, f"{filepath}_price_model.pkl")
-        joblib.dump(self.signal_classifier, f"{filepath}_signal_model.pkl")
-        joblib.dump(self.risk_assessor, f"{filepath}_risk_model.pkl")
+        # Models, scalers and strategy state in one uncompressed (memory-mappable) file
+        bundle = self._model_bundle()
+        bundle['strategy_data'] = strategy_data
+        joblib.dump(bundle, f"{filepath}_strategy.joblib")
+    
+    def load_strategy(self, filepath: str, mmap_mode: Optional[str] = 'r'):
+        """
+        Load a trained strategy from disk
         
-        # Save scalers
-        joblib.dump(self.price_scaler, f"{filepath}_price_scaler.pkl")
-        joblib.dump(self.signal_scaler, f"{filepath}_signal_scaler.pkl")
-        joblib.dump(self.risk_scaler, f"{filepath}_risk_scaler.pkl")
+        Only bundles written by save_strategy for the current feature schema are
+        accepted; the legacy per-model pickles were fitted on a different feature
+        layout and must be retrained.
         
-        # Save strategy data
-        with open(f"{filepath}_strategy.json", 'w') as f:
-            json.dump(strategy_data, f, indent=2)
-    
-    def load_strategy(self, filepath: str):
-        """Load a trained strategy from disk"""
+        Returns:
+            True if the strategy was loaded
+        """
         try:
-            # Load models
-            self.price_predictor = joblib.load(f"{filepath}_price_model.pkl")
-            self.signal_classifier = joblib.load(f"{filepath}_signal_model.pkl")
-            self.risk_assessor = joblib.load(f"{filepath}_risk_model.pkl")
-            
-            # Load scalers
-            self.price_scaler = joblib.load(f"{filepath}_price_scaler.pkl")
-            self.signal_scaler = joblib.load(f"{filepath}_signal_scaler.pkl")
-            self.risk_scaler = joblib.load(f"{filepath}_risk_scaler.pkl")
+            bundle_path = f"{filepath}_strategy.joblib"
+            if not os.path.exists(bundle_path):
+                if os.path.exists(f"{filepath}_price_model.pkl"):
+                    print(f"Cannot load legacy strategy {filepath}: its models predate the current "
+                          f"feature schema, retrain and save it again")
+                else:
+                    print(f"No saved strategy found at {bundle_path}")
+                return False
             
-            # Load strategy data
-            with open(f"{filepath}_strategy.json", 'r') as f:
-                strategy_data = json.load(f)
+            bundle = joblib.load(bundle_path, mmap_mode=mmap_mode)
+            if not self._bundle_matches_schema(bundle, bundle_path):
+                return False
+            self._apply_model_bundle(bundle)
+            strategy_data = bundle['strategy_data']
             
             self.strategy_weights = strategy_data['strategy_weights']
             self.model_accuracy = strategy_data['model_accuracy']
@@ -394,4 +938,4 @@ class AdaptiveStrategyEngine:
             return True
         except Exception as e:
             print(f"Failed to load strategy: {e}")
-            return False
\ No newline at end of file
+            return False
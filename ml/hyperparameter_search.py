@@ -0,0 +1,159 @@
+"""
+Hyperparameter Search for Adaptive Strategy Models using time-series cross-validation
+"""
+import os
+import time
+import shutil
+import tempfile
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics import r2_score
+
+from ml.adaptive_strategy import AdaptiveStrategyEngine, build_model
+from ml.model_registry import ModelRegistry, model_registry
+
+# Search space per model (learning_rate only applies to gradient boosting)
+PARAM_GRID = {
+    'price': {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [4, 8, None]
+    },
+    'signal': {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [2, 3, 5],
+        'learning_rate': [0.05, 0.1]
+    },
+    'risk': {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [4, 8, None]
+    }
+}
+
+# Fold matrices, loaded once per worker process by the pool initializer
+_FOLD_CACHE = {}
+
+
+def _load_fold_cache(cache_path: str):
+    """Pool initializer: memory-map the shared fold matrices"""
+    global _FOLD_CACHE
+    _FOLD_CACHE = joblib.load(cache_path, mmap_mode='r')
+
+
+def _score_candidate(model_name: str, params: Dict) -> Tuple[str, Dict, float]:
+    """Mean out-of-fold R² of one hyperparameter candidate"""
+    target = _FOLD_CACHE['targets'][model_name]
+    scores = []
+
+    for fold in _FOLD_CACHE['folds']:
+        model = build_model(model_name, params)
+        model.fit(fold['X_train'], target[fold['train_idx']])
+        predictions = model.predict(fold['X_test'])
+        scores.append(r2_score(target[fold['test_idx']], predictions))
+
+    return model_name, params, float(np.mean(scores))
+
+
+def expand_grid(grid: Dict[str, List]) -> List[Dict]:
+    """Expand a parameter grid into the list of all combinations"""
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+class HyperparameterTuner:
+    """Parallel hyperparameter search for the adaptive strategy models"""
+
+    def __init__(self, n_splits: int = 4, max_workers: Optional[int] = None,
+                 param_grid: Optional[Dict] = None, registry: Optional[ModelRegistry] = None):
+        self.n_splits = n_splits
+        self.max_workers = max_workers or os.cpu_count()
+        self.param_grid = param_grid or PARAM_GRID
+        self.registry = registry if registry is not None else model_registry
+
+    def build_fold_cache(self, X: np.ndarray, targets: Dict[str, np.ndarray]) -> Dict:
+        """
+        Split chronologically and scale each fold once for reuse by every candidate
+
+        Args:
+            X: Feature matrix in time order
+            targets: Target arrays keyed by model name
+
+        Returns:
+            Dictionary with scaled fold matrices, fold indices and targets
+        """
+        folds = []
+        for train_idx, test_idx in TimeSeriesSplit(n_splits=self.n_splits).split(X):
+            scaler = StandardScaler()
+            folds.append({
+                'train_idx': train_idx,
+                'test_idx': test_idx,
+                'X_train': scaler.fit_transform(X[train_idx]),
+                'X_test': scaler.transform(X[test_idx])
+            })
+
+        return {'folds': folds, 'targets': targets}
+
+    def tune(self, symbol: str, data: pd.DataFrame, models: Optional[List[str]] = None) -> Dict:
+        """
+        Search hyperparameters for one symbol and store the best configuration
+
+        Args:
+            symbol: Stock ticker symbol
+            data: Historical data with technical indicators
+            models: Model names to tune (all models if None)
+
+        Returns:
+            Best parameters and scores per model
+        """
+        started = time.time()
+        models = models or list(self.param_grid)
+
+        try:
+            X, targets, features = AdaptiveStrategyEngine(registry=self.registry).build_training_set(data)
+        except ValueError as e:
+            return {'status': 'error', 'message': str(e)}
+
+        candidates = [(name, params) for name in models for params in expand_grid(self.param_grid[name])]
+
+        cache_dir = tempfile.mkdtemp(prefix='hparam_folds_')
+        try:
+            cache_path = os.path.join(cache_dir, 'folds.joblib')
+            joblib.dump(self.build_fold_cache(X, targets), cache_path)
+
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_load_fold_cache,
+                                     initargs=(cache_path,)) as pool:
+                results = list(pool.map(_score_candidate, *zip(*candidates)))
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        best_params, best_scores = {}, {}
+        for name, params, score in results:
+            if name not in best_scores or score > best_scores[name]:
+                best_params[name], best_scores[name] = params, score
+
+        search_results = {
+            'status': 'success',
+            'symbol': symbol,
+            'best_params': best_params,
+            'cv_scores': best_scores,
+            'candidates_evaluated': len(candidates),
+            'cv_splits': self.n_splits,
+            'samples': len(X),
+            'features_used': len(features),
+            'duration_seconds': round(time.time() - started, 2),
+            'tuning_date': datetime.now().isoformat()
+        }
+
+        if self.registry is not None:
+            search_results['registry_version'] = self.registry.save_hyperparameters(
+                symbol, best_params, {k: v for k, v in search_results.items() if k != 'best_params'}
+            )
+
+        return search_results
@@ -0,0 +1,325 @@
+"""
+Versioned Model Registry for trained adaptive strategy artifacts
+"""
+import os
+import re
+import json
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import joblib
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking
+    fcntl = None
+
+from config import config
+
+
+class ModelRegistry:
+    """Stores versioned model bundles keyed by symbol and training data window"""
+
+    FORMAT_VERSION = 3
+    INDEX_FILE = 'index.json'
+    LOCK_FILE = 'index.lock'
+    HYPERPARAMS_FILE = 'hyperparameters.json'
+
+    def __init__(self, root_dir: Optional[str] = None, max_cached: int = 16,
+                 max_versions: Optional[int] = None, max_keys_per_symbol: Optional[int] = None):
+        self.root_dir = root_dir or config.MODEL_REGISTRY_DIR
+        self.max_cached = max_cached
+
+        # Retention: every retrain on a new data window creates a key, so old ones are pruned on save
+        self.max_versions = max_versions or config.MODEL_REGISTRY_MAX_VERSIONS
+        self.max_keys_per_symbol = max_keys_per_symbol or config.MODEL_REGISTRY_MAX_KEYS_PER_SYMBOL
+
+        # In-process cache shared by every engine using this registry
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _safe_symbol(symbol: str) -> str:
+        """Make a ticker symbol safe for use in file names"""
+        return re.sub(r'[^A-Za-z0-9_-]', '_', symbol.upper())
+
+    @staticmethod
+    def make_key(symbol: str, data: pd.DataFrame, variant: Optional[str] = None) -> str:
+        """
+        Build a registry key from a symbol and the window of data used for training
+
+        Args:
+            symbol: Stock ticker symbol
+            data: Training data (its first/last index and length define the window)
+            variant: Optional suffix distinguishing model configurations
+
+        Returns:
+            Filesystem-safe registry key
+        """
+        safe_symbol = ModelRegistry._safe_symbol(symbol)
+
+        if len(data) == 0:
+            key = f"{safe_symbol}__empty"
+        else:
+            start, end = data.index[0], data.index[-1]
+            if hasattr(start, 'strftime'):
+                start, end = start.strftime('%Y%m%d%H%M'), end.strftime('%Y%m%d%H%M')
+            key = f"{safe_symbol}__{start}_{end}_{len(data)}"
+
+        return f"{key}__{variant}" if variant else key
+
+    @staticmethod
+    def params_digest(params: Dict) -> str:
+        """Short stable digest of a hyperparameter configuration"""
+        encoded = json.dumps(params, sort_keys=True, default=str).encode()
+        return hashlib.sha1(encoded).hexdigest()[:10]
+
+    def save(self, key: str, bundle: Dict, metadata: Optional[Dict] = None) -> int:
+        """
+        Store a model bundle as a new version under the given key
+
+        Older versions of the key beyond max_versions, and the symbol's least
+        recently written keys beyond max_keys_per_symbol, are deleted.
+
+        Args:
+            key: Registry key (see make_key)
+            bundle: Dictionary of models, scalers and strategy state
+            metadata: Extra JSON-serializable information (symbol, metrics, ...)
+
+        Returns:
+            Version number assigned to the bundle
+        """
+        with self._write_lock():
+            index = self._read_index()
+            entry = index.setdefault(key, {'latest': 0, 'versions': {}})
+            version = entry['latest'] + 1
+
+            key_dir = os.path.join(self.root_dir, key)
+            os.makedirs(key_dir, exist_ok=True)
+            filename = os.path.join(key, f"v{version}.joblib")
+
+            # Uncompressed so that large arrays can be memory-mapped on load
+            joblib.dump({'format_version': self.FORMAT_VERSION, 'bundle': bundle},
+                        os.path.join(self.root_dir, filename))
+
+            entry['latest'] = version
+            entry['versions'][str(version)] = {
+                'file': filename,
+                'created_at': datetime.now().isoformat(),
+                'metadata': metadata or {}
+            }
+            removed = self._apply_retention(index, key)
+            self._write_index(index)
+
+            # Files go only after the index no longer points at them
+            for removed_key, removed_version, path in removed:
+                self._cache.pop((removed_key, removed_version), None)
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                elif os.path.exists(path):
+                    os.remove(path)
+
+            self._remember((key, version), bundle)
+            return version
+
+    def _apply_retention(self, index: Dict, key: str) -> List:
+        """
+        Drop old versions and keys from the index
+
+        Args:
+            index: Registry index (modified in place)
+            key: Key just written; it is always kept
+
+        Returns:
+            (key, version, path) of every removed version file or key directory
+        """
+        removed = []
+        entry = index[key]
+        for version in sorted(entry['versions'], key=int)[:-self.max_versions]:
+            info = entry['versions'].pop(version)
+            removed.append((key, int(version), os.path.join(self.root_dir, info['file'])))
+
+        prefix = key.split('__', 1)[0] + '__'
+        symbol_keys = sorted(
+            (other for other, other_entry in index.items()
+             if other.startswith(prefix) and other != key and other_entry['latest']),
+            key=lambda other: index[other]['versions'][str(index[other]['latest'])]['created_at'],
+            reverse=True
+        )
+        for old_key in symbol_keys[self.max_keys_per_symbol - 1:]:
+            old_entry = index.pop(old_key)
+            removed.extend((old_key, int(version), os.path.join(self.root_dir, old_key))
+                           for version in old_entry['versions'])
+        return removed
+
+    def load(self, key: str, version: Optional[int] = None,
+             mmap_mode: Optional[str] = 'r') -> Optional[Dict]:
+        """
+        Load a model bundle, from memory if another engine already loaded it
+
+        Args:
+            key: Registry key
+            version: Version to load (latest if None)
+            mmap_mode: joblib memory-map mode for the large arrays
+
+        Returns:
+            The stored bundle or None if not found
+        """
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if not entry or not entry['latest']:
+                return None
+
+            version = version or entry['latest']
+            if (key, version) in self._cache:
+                self._cache.move_to_end((key, version))
+                return self._cache[(key, version)]
+
+            info = entry['versions'].get(str(version))
+            if info is None:
+                return None
+
+            try:
+                stored = joblib.load(os.path.join(self.root_dir, info['file']), mmap_mode=mmap_mode)
+            except Exception as e:
+                print(f"Failed to load model bundle {key} v{version}: {e}")
+                return None
+
+            if stored.get('format_version') != self.FORMAT_VERSION:
+                return None
+
+            self._remember((key, version), stored['bundle'])
+            return stored['bundle']
+
+    def latest_key_for_symbol(self, symbol: str) -> Optional[str]:
+        """Return the most recently written key for a symbol"""
+        prefix = f"{self._safe_symbol(symbol)}__"
+
+        with self._lock:
+            index = self._read_index()
+            candidates = [
+                (entry['versions'][str(entry['latest'])]['created_at'], key)
+                for key, entry in index.items()
+                if key.startswith(prefix) and entry['latest']
+            ]
+
+        return max(candidates)[1] if candidates else None
+
+    def latest_version(self, key: str) -> Optional[int]:
+        """Latest version number stored under a key"""
+        entry = self._read_index().get(key)
+        return entry['latest'] if entry and entry['latest'] else None
+
+    def list_versions(self, key: str) -> List[Dict]:
+        """List stored versions and their metadata for a key"""
+        entry = self._read_index().get(key, {})
+        return [
+            {'version': int(version), **info}
+            for version, info in sorted(entry.get('versions', {}).items(), key=lambda kv: int(kv[0]))
+        ]
+
+    def save_hyperparameters(self, symbol: str, params: Dict, metadata: Optional[Dict] = None) -> int:
+        """
+        Store the best hyperparameter configuration found for a symbol
+
+        Args:
+            symbol: Stock ticker symbol
+            params: Hyperparameters keyed by model name ('price', 'signal', 'risk')
+            metadata: Extra JSON-serializable information (scores, search space, ...)
+
+        Returns:
+            Version number assigned to the configuration
+        """
+        with self._write_lock():
+            all_params = self._read_json(self.HYPERPARAMS_FILE)
+            entry = all_params.setdefault(self._safe_symbol(symbol), {'latest': 0, 'versions': {}})
+            version = entry['latest'] + 1
+
+            entry['latest'] = version
+            entry['versions'][str(version)] = {
+                'params': params,
+                'created_at': datetime.now().isoformat(),
+                'metadata': metadata or {}
+            }
+            self._write_json(self.HYPERPARAMS_FILE, all_params)
+            return version
+
+    def load_hyperparameters(self, symbol: str) -> Optional[Dict]:
+        """Return the latest tuned hyperparameters for a symbol, if any"""
+        entry = self._read_json(self.HYPERPARAMS_FILE).get(self._safe_symbol(symbol))
+        if not entry or not entry['latest']:
+            return None
+        return entry['versions'][str(entry['latest'])]['params']
+
+    def clear_cache(self):
+        """Drop the in-memory bundle cache"""
+        with self._lock:
+            self._cache.clear()
+
+    @contextmanager
+    def _write_lock(self):
+        """
+        Serialize read-modify-write of the registry files across threads and processes
+
+        The learning process and the dashboard share one registry, so version
+        allocation happens under an exclusive flock on LOCK_FILE.
+        """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            os.makedirs(self.root_dir, exist_ok=True)
+            with open(os.path.join(self.root_dir, self.LOCK_FILE), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _remember(self, cache_key, bundle: Dict):
+        """Keep a bundle in the bounded in-memory cache"""
+        self._cache[cache_key] = bundle
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    def _read_index(self) -> Dict:
+        """Read the registry index from disk"""
+        return self._read_json(self.INDEX_FILE)
+
+    def _write_index(self, index: Dict):
+        """Atomically write the registry index to disk"""
+        self._write_json(self.INDEX_FILE, index)
+
+    def _read_json(self, filename: str) -> Dict:
+        """Read a JSON file from the registry directory"""
+        path = os.path.join(self.root_dir, filename)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to read model registry file {filename}: {e}")
+            return {}
+
+    def _write_json(self, filename: str, payload: Dict):
+        """Atomically write a JSON file to the registry directory"""
+        os.makedirs(self.root_dir, exist_ok=True)
+        path = os.path.join(self.root_dir, filename)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+
+# Global model registry shared by all adaptive strategy engines in the process
+model_registry = ModelRegistry()
@@ -7,21 +7,34 @@ from sklearn.preprocessing import StandardScaler
 from typing import Dict, List, Tuple, Optional
 import joblib
 import os
+import time
+import hashlib
+import shutil
+import tempfile
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
 # Try to import RL dependencies, fallback if not available
 try:
     import gym
-    from gym import spaces
+    import torch
+    from gym import spaces, Env
     from stable_baselines3 import PPO, A2C, DQN
+    from stable_baselines3.common.callbacks import BaseCallback
     from stable_baselines3.common.env_util import make_vec_env
-    from stable_baselines3.common.vec_env import DummyVecEnv
+    from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv
     HAS_RL_DEPS = True
 except ImportError:
     HAS_RL_DEPS = False
     # Create dummy classes for compatibility
     class Env:
         pass
+    class VecEnv:
+        pass
+    class BaseCallback:
+        pass
     class spaces:
         @staticmethod
         def Discrete(n):
@@ -30,11 +43,68 @@ except ImportError:
         def Box(low, high, shape, dtype):
             return None
 
+# Market columns in each observation row
+OBSERVATION_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'RSI', 'MACD', 'SMA_20']
+
+# Rolling-normalized observation tensors, cached per dataset
+NORMALIZATION_WINDOW = 50
+_observation_cache = OrderedDict()
+_OBSERVATION_CACHE_SIZE = 32
+
+def build_observation_tensor(data: pd.DataFrame, normalize: bool = True,
+                             window: int = NORMALIZATION_WINDOW) -> np.ndarray:
+    """
+    Market observation rows for a whole episode as a contiguous float32 matrix
+    
+    With normalize=True each column is z-scored against its own trailing rolling
+    window (no look-ahead), so prices, volume and indicators share one scale.
+    The result is computed once per dataset and cached.
+    
+    Args:
+        data: Historical data with OBSERVATION_COLUMNS
+        normalize: Apply rolling z-score normalization
+        window: Rolling window length for normalization
+        
+    Returns:
+        Array of shape (len(data), len(OBSERVATION_COLUMNS))
+    """
+    frame = data[OBSERVATION_COLUMNS]
+    if not normalize:
+        return frame.to_numpy(dtype=np.float32)
+    
+    key = (hashlib.sha1(np.ascontiguousarray(frame.to_numpy(dtype=np.float64)).tobytes()).hexdigest(), window)
+    if key in _observation_cache:
+        _observation_cache.move_to_end(key)
+        return _observation_cache[key]
+    
+    rolling = frame.rolling(window, min_periods=2)
+    normalized = (frame - rolling.mean()) / rolling.std()
+    tensor = np.ascontiguousarray(
+        np.nan_to_num(normalized.to_numpy(dtype=np.float32), nan=0.0, posinf=0.0, neginf=0.0)
+    )
+    tensor.setflags(write=False)
+    
+    _observation_cache[key] = tensor
+    while len(_observation_cache) > _OBSERVATION_CACHE_SIZE:
+        _observation_cache.popitem(last=False)
+    
+    return tensor
+
+def _window_view(padded: np.ndarray, n_windows: int, lookback_window: int) -> np.ndarray:
+    """Read-only (n_windows, lookback, features) view where window k covers rows [k, k + lookback)"""
+    row_stride, col_stride = padded.strides
+    return np.lib.stride_tricks.as_strided(
+        padded, shape=(n_windows, lookback_window, padded.shape[1]),
+        strides=(row_stride, row_stride, col_stride), writeable=False
+    )
+
 class TradingEnvironment(Env if HAS_RL_DEPS else object):
     """Custom Trading Environment for Reinforcement Learning"""
     
     def __init__(self, data: pd.DataFrame, initial_balance: float = 10000, 
-                 lookback_window: int = 20, transaction_cost: float = 0.001):
+                 lookback_window: int = 20, transaction_cost: float = 0.001,
+                 normalize: bool = False, include_portfolio_state: bool = True,
+                 observations: Optional[np.ndarray] = None):
         if HAS_RL_DEPS:
             super(TradingEnvironment, self).__init__()
         
@@ -42,6 +112,18 @@ class TradingEnvironment(Env if HAS_RL_DEPS else object):
         self.initial_balance = initial_balance
         self.lookback_window = lookback_window
         self.transaction_cost = transaction_cost
+        self.include_portfolio_state = include_portfolio_state
+        
+        # Convert the frame once: market rows as a contiguous float32 matrix with
+        # zero rows in front, so every lookback window (padded or not) is a strided view.
+        # Precomputed rows (a slice of a longer series) keep the normalization warm
+        market = build_observation_tensor(self.data, normalize=normalize) if observations is None else observations
+        n_rows, n_features = market.shape
+        self._market = np.zeros((n_rows + lookback_window, n_features), dtype=np.float32)
+        self._market[lookback_window:] = market
+        self._windows = _window_view(self._market, n_rows + 1, lookback_window)
+        self._close = self.data['Close'].to_numpy(dtype=np.float64)
+        self._n_rows = n_rows
         
         # Environment state
         self.current_step = 0
@@ -55,10 +137,10 @@ class TradingEnvironment(Env if HAS_RL_DEPS else object):
         # Action space: 0=Hold, 1=Buy, 2=Sell
         self.action_space = spaces.Discrete(3)
         
-        # Observation space: OHLCV + technical indicators + portfolio state
+        # Observation space: OHLCV + technical indicators (+ portfolio state)
         self.observation_space = spaces.Box(
             low=-np.inf, high=np.inf, 
-            shape=(lookback_window * 8 + 3,), dtype=np.float32
+            shape=(lookback_window * 8 + (3 if include_portfolio_state else 0),), dtype=np.float32
         )
         
         # Performance tracking
@@ -83,41 +165,45 @@ class TradingEnvironment(Env if HAS_RL_DEPS else object):
     
     def _get_observation(self):
         """Get current observation state"""
-        # Get lookback window data
-        start = max(0, self.current_step - self.lookback_window)
-        end = self.current_step
-        
-        if end > len(self.data):
-            end = len(self.data)
-            start = max(0, end - self.lookback_window)
-        
-        frame = self.data.iloc[start:end]
-        
-        # Normalize price data
-        if len(frame) < self.lookback_window:
-            # Pad with zeros if not enough data
-            padding = np.zeros((self.lookback_window - len(frame), 8))
-            obs_data = np.vstack([padding, frame[['Open', 'High', 'Low', 'Close', 'Volume', 
-                                               'RSI', 'MACD', 'SMA_20']].values])
-        else:
-            obs_data = frame[['Open', 'High', 'Low', 'Close', 'Volume', 
-                            'RSI', 'MACD', 'SMA_20']].values
+        # Window ending before the current step (zero padded at the start of the data)
+        window = self._windows[min(self.current_step, self._n_rows)]
+        if not self.include_portfolio_state:
+            return window.reshape(-1).copy()
         
-        # Flatten the observation
-        obs = obs_data.flatten()
+        obs = np.empty(window.size + 3, dtype=np.float32)
+        obs[:window.size] = window.reshape(-1)
         
         # Add portfolio state
-        portfolio_state = np.array([
+        obs[window.size:] = (
             self.balance / self.initial_balance,
             self.shares_held,
             self.net_worth / self.initial_balance
-        ])
+        )
         
-        return np.concatenate([obs, portfolio_state]).astype(np.float32)
+        return obs
+    
+    def market_observations(self, start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """
+        Market part of the observations for steps [start, end) as one matrix
+        
+        Without portfolio state these are exactly the observations an episode
+        will see, so a position-independent policy can be evaluated in one pass.
+        
+        Args:
+            start: First step (current step if None)
+            end: Step after the last one (the final step of the episode if None)
+            
+        Returns:
+            Array of shape (end - start, lookback_window * 8)
+        """
+        start = self.current_step if start is None else start
+        end = len(self.data) - 1 if end is None else end
+        steps = np.arange(start, max(end, start + 1))
+        return self._windows[np.minimum(steps, self._n_rows)].reshape(len(steps), -1)
     
     def step(self, action):
         """Execute one step in the environment"""
-        current_price = self.data.iloc[self.current_step]['Close']
+        current_price = self._close[self.current_step]
         
         # Execute action
         reward = 0
@@ -195,19 +281,384 @@ class TradingEnvironment(Env if HAS_RL_DEPS else object):
         return -1  # Penalty for invalid sell
 
 
+class BatchedTradingEnv(VecEnv if HAS_RL_DEPS else object):
+    """
+    Vectorized trading environment stepping many episodes at once
+    
+    Each of the n_envs slots runs an episode on one of the datasets (e.g. one per
+    symbol) starting at a random time offset. All slots share one padded float32
+    market matrix, and portfolio state is kept in arrays so a step is a handful of
+    NumPy operations. Trading rules and rewards match TradingEnvironment.
+    """
+    
+    def __init__(self, datasets: List[pd.DataFrame], n_envs: int = 8, initial_balance: float = 10000,
+                 lookback_window: int = 20, transaction_cost: float = 0.001,
+                 min_episode_length: int = 50, seed: Optional[int] = None,
+                 normalize: bool = False, include_portfolio_state: bool = True,
+                 observations: Optional[List[Optional[np.ndarray]]] = None):
+        self.initial_balance = initial_balance
+        self.lookback_window = lookback_window
+        self.transaction_cost = transaction_cost
+        self.min_episode_length = min_episode_length
+        self.include_portfolio_state = include_portfolio_state
+        self.rng = np.random.default_rng(seed)
+        
+        # Concatenate datasets, each preceded by lookback_window zero rows
+        blocks, closes, bases, lengths = [], [], [], []
+        offset = 0
+        for data, precomputed in zip(datasets, observations or [None] * len(datasets)):
+            market = build_observation_tensor(data, normalize=normalize) if precomputed is None else precomputed
+            padding = np.zeros((lookback_window, market.shape[1]), dtype=np.float32)
+            blocks.extend([padding, market])
+            closes.extend([np.zeros(lookback_window), data['Close'].to_numpy(dtype=np.float64)])
+            bases.append(offset)
+            lengths.append(len(market))
+            offset += lookback_window + len(market)
+        
+        self._market = np.ascontiguousarray(np.vstack(blocks))
+        self._windows = _window_view(self._market, len(self._market) - lookback_window + 1, lookback_window)
+        self._close = np.concatenate(closes)
+        self._bases = np.array(bases)
+        self._lengths = np.array(lengths)
+        
+        # Per-slot episode and portfolio state
+        self.dataset_ids = np.zeros(n_envs, dtype=np.int64)
+        self.steps = np.zeros(n_envs, dtype=np.int64)
+        self.balance = np.zeros(n_envs)
+        self.shares_held = np.zeros(n_envs)
+        self.net_worth = np.zeros(n_envs)
+        self.max_net_worth = np.zeros(n_envs)
+        self.prev_net_worth = np.full(n_envs, np.nan)
+        self._actions = np.zeros(n_envs, dtype=np.int64)
+        
+        obs_size = lookback_window * len(OBSERVATION_COLUMNS) + (3 if include_portfolio_state else 0)
+        observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=(obs_size,), dtype=np.float32)
+        action_space = spaces.Discrete(3)
+        if HAS_RL_DEPS:
+            super(BatchedTradingEnv, self).__init__(n_envs, observation_space, action_space)
+        else:
+            self.num_envs = n_envs
+            self.observation_space = observation_space
+            self.action_space = action_space
+    
+    def _reset_slots(self, slots: np.ndarray):
+        """Start new episodes on a random dataset and time offset for the given slots"""
+        n = len(slots)
+        if n == 0:
+            return
+        
+        dataset_ids = self.rng.integers(0, len(self._lengths), size=n)
+        lengths = self._lengths[dataset_ids]
+        latest_start = np.maximum(self.lookback_window + 1,
+                                  lengths - 1 - self.min_episode_length)
+        starts = self.lookback_window + (self.rng.random(n) * (latest_start - self.lookback_window)).astype(np.int64)
+        
+        self.dataset_ids[slots] = dataset_ids
+        self.steps[slots] = np.minimum(starts, lengths - 2)
+        self.balance[slots] = self.initial_balance
+        self.shares_held[slots] = 0
+        self.net_worth[slots] = self.initial_balance
+        self.max_net_worth[slots] = self.initial_balance
+        self.prev_net_worth[slots] = np.nan
+    
+    def _observations(self) -> np.ndarray:
+        """Observation matrix for all slots"""
+        window_ids = self._bases[self.dataset_ids] + np.minimum(self.steps, self._lengths[self.dataset_ids])
+        windows = self._windows[window_ids].reshape(self.num_envs, -1)
+        if not self.include_portfolio_state:
+            return windows
+        
+        portfolio_state = np.column_stack([
+            self.balance / self.initial_balance,
+            self.shares_held,
+            self.net_worth / self.initial_balance
+        ])
+        return np.hstack([windows, portfolio_state]).astype(np.float32)
+    
+    def reset(self) -> np.ndarray:
+        self._reset_slots(np.arange(self.num_envs))
+        return self._observations()
+    
+    def step_async(self, actions: np.ndarray):
+        self._actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs)
+    
+    def step_wait(self):
+        actions = self._actions
+        price = self._close[self._bases[self.dataset_ids] + self.lookback_window + self.steps]
+        rewards = np.zeros(self.num_envs)
+        
+        # Buy: 20% of available balance
+        buy = actions == 1
+        shares_to_buy = self.balance * 0.2 / price
+        cost = shares_to_buy * price * (1 + self.transaction_cost)
+        buy_ok = buy & (cost <= self.balance)
+        self.balance = np.where(buy_ok, self.balance - cost, self.balance)
+        self.shares_held = np.where(buy_ok, self.shares_held + shares_to_buy, self.shares_held)
+        rewards += np.where(buy_ok, 1.0, np.where(buy, -1.0, 0.0))
+        
+        # Sell: 50% of holdings
+        sell = actions == 2
+        sell_ok = sell & (self.shares_held > 0)
+        shares_to_sell = self.shares_held * 0.5
+        sale_amount = shares_to_sell * price * (1 - self.transaction_cost)
+        self.balance = np.where(sell_ok, self.balance + sale_amount, self.balance)
+        self.shares_held = np.where(sell_ok, self.shares_held - shares_to_sell, self.shares_held)
+        rewards += np.where(sell_ok, 1.0, np.where(sell, -1.0, 0.0))
+        
+        # Portfolio return since the previous step of the same episode
+        self.net_worth = self.balance + self.shares_held * price
+        prev_net_worth = np.where(np.isnan(self.prev_net_worth), self.net_worth, self.prev_net_worth)
+        rewards += (self.net_worth - prev_net_worth) / prev_net_worth * 100  # Scale reward
+        self.prev_net_worth = self.net_worth.copy()
+        
+        # Penalty for excessive trading, bonus for new highs
+        rewards -= np.where(actions != 0, self.transaction_cost * 10, 0.0)
+        new_high = self.net_worth > self.max_net_worth
+        self.max_net_worth = np.where(new_high, self.net_worth, self.max_net_worth)
+        rewards += new_high
+        
+        self.steps += 1
+        dones = self.steps >= self._lengths[self.dataset_ids] - 1
+        
+        obs = self._observations()
+        infos = [{} for _ in range(self.num_envs)]
+        finished = np.flatnonzero(dones)
+        if len(finished):
+            for slot in finished:
+                infos[slot]['terminal_observation'] = obs[slot].copy()
+            self._reset_slots(finished)
+            obs[finished] = self._observations()[finished]
+        
+        return obs, rewards.astype(np.float32), dones, infos
+    
+    def seed(self, seed: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
+        return [seed] * self.num_envs
+    
+    def close(self):
+        pass
+    
+    def get_attr(self, attr_name: str, indices=None):
+        return [getattr(self, attr_name)] * len(self._indices(indices))
+    
+    def set_attr(self, attr_name: str, value, indices=None):
+        setattr(self, attr_name, value)
+    
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs):
+        return [getattr(self, method_name)(*method_args, **method_kwargs) for _ in self._indices(indices)]
+    
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False] * len(self._indices(indices))
+    
+    def _indices(self, indices) -> List[int]:
+        if indices is None:
+            return list(range(self.num_envs))
+        if isinstance(indices, int):
+            return [indices]
+        return list(indices)
+
+
+def make_training_env(datasets: List[pd.DataFrame], n_envs: int = 1, vec_env: str = 'batched',
+                      seed: Optional[int] = None, normalize: bool = False,
+                      include_portfolio_state: bool = True,
+                      observations: Optional[List[Optional[np.ndarray]]] = None):
+    """
+    Build the vectorized environment used for training
+    
+    Args:
+        datasets: Training data, e.g. one frame per symbol
+        n_envs: Number of parallel environments
+        vec_env: 'batched' (in-process array stepping) or 'subproc' (one process per env)
+        seed: Random seed for episode sampling
+        normalize: Use rolling-normalized market observations
+        include_portfolio_state: Append balance/holdings/net worth to observations
+        observations: Precomputed market rows per dataset (None entries are built
+            from the dataset), e.g. slices of a tensor normalized over a longer history
+        
+    Returns:
+        A stable-baselines3 VecEnv
+    """
+    env_kwargs = {'normalize': normalize, 'include_portfolio_state': include_portfolio_state}
+    observations = observations or [None] * len(datasets)
+    
+    if n_envs == 1 and len(datasets) == 1:
+        return DummyVecEnv([lambda: TradingEnvironment(datasets[0], observations=observations[0], **env_kwargs)])
+    
+    if vec_env == 'subproc':
+        # Round-robin datasets over worker processes
+        return SubprocVecEnv([
+            (lambda data=datasets[i % len(datasets)], rows=observations[i % len(datasets)]:
+                TradingEnvironment(data, observations=rows, **env_kwargs))
+            for i in range(n_envs)
+        ])
+    
+    return BatchedTradingEnv(datasets, n_envs=n_envs, seed=seed, observations=observations, **env_kwargs)
+
+
+def benchmark_environment(data: pd.DataFrame, steps: int = 10000, lookback_window: int = 20,
+                          seed: int = 0) -> Dict:
+    """
+    Measure raw TradingEnvironment throughput with random actions
+    
+    Args:
+        data: Historical data with technical indicators
+        steps: Number of environment steps to run
+        lookback_window: Observation window length
+        seed: Seed for the random actions
+        
+    Returns:
+        Dictionary with elapsed time and steps per second
+    """
+    env = TradingEnvironment(data, lookback_window=lookback_window)
+    actions = np.random.default_rng(seed).integers(0, 3, size=steps)
+    
+    env.reset()
+    started = time.perf_counter()
+    for action in actions:
+        _, _, done, _ = env.step(int(action))
+        if done:
+            env.reset()
+    elapsed = time.perf_counter() - started
+    
+    return {
+        'steps': steps,
+        'elapsed_seconds': elapsed,
+        'steps_per_second': steps / elapsed if elapsed > 0 else float('inf')
+    }
+
+
+class TrainingCheckpointCallback(BaseCallback if HAS_RL_DEPS else object):
+    """
+    Periodically checkpoint a training run so it can be resumed after preemption
+    
+    A checkpoint holds the model (policy and optimizer state), the replay buffer
+    for off-policy algorithms, and the training environment's episode RNG. Files
+    are written under temporary names and swapped in atomically, so a run killed
+    mid-save keeps its previous checkpoint.
+    """
+    
+    MODEL_FILE = 'model.zip'
+    REPLAY_BUFFER_FILE = 'replay_buffer.pkl'
+    STATE_FILE = 'state.joblib'
+    
+    def __init__(self, checkpoint_dir: str, checkpoint_freq: int = 10000, verbose: int = 0):
+        super(TrainingCheckpointCallback, self).__init__(verbose)
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_freq = checkpoint_freq
+        self._last_checkpoint = 0
+    
+    def _on_training_start(self):
+        self._last_checkpoint = self.num_timesteps
+    
+    def _on_step(self) -> bool:
+        if self.num_timesteps - self._last_checkpoint >= self.checkpoint_freq:
+            self.save_checkpoint()
+        return True
+    
+    def save_checkpoint(self, completed: bool = False):
+        """Write the current model, replay buffer and environment RNG to the checkpoint directory"""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        
+        model_path = os.path.join(self.checkpoint_dir, self.MODEL_FILE)
+        self.model.save(f"{model_path}.tmp.zip")
+        os.replace(f"{model_path}.tmp.zip", model_path)
+        
+        if hasattr(self.model, 'save_replay_buffer'):
+            buffer_path = os.path.join(self.checkpoint_dir, self.REPLAY_BUFFER_FILE)
+            self.model.save_replay_buffer(f"{buffer_path}.tmp")
+            os.replace(f"{buffer_path}.tmp", buffer_path)
+        
+        env_rng = getattr(self.training_env, 'rng', None)
+        state = {
+            'num_timesteps': self.num_timesteps,
+            'env_rng_state': env_rng.bit_generator.state if env_rng is not None else None,
+            'completed': completed,
+            'saved_at': datetime.now().isoformat()
+        }
+        state_path = os.path.join(self.checkpoint_dir, self.STATE_FILE)
+        joblib.dump(state, f"{state_path}.tmp")
+        os.replace(f"{state_path}.tmp", state_path)
+        
+        self._last_checkpoint = self.num_timesteps
+        if self.verbose:
+            print(f"Saved training checkpoint at {self.num_timesteps} timesteps to {self.checkpoint_dir}")
+    
+    @classmethod
+    def load_state(cls, checkpoint_dir: str) -> Optional[Dict]:
+        """Return the saved checkpoint state, or None if the directory holds no complete checkpoint"""
+        state_path = os.path.join(checkpoint_dir, cls.STATE_FILE)
+        model_path = os.path.join(checkpoint_dir, cls.MODEL_FILE)
+        if not (os.path.exists(state_path) and os.path.exists(model_path)):
+            return None
+        try:
+            return joblib.load(state_path)
+        except Exception as e:
+            print(f"Failed to read training checkpoint in {checkpoint_dir}: {e}")
+            return None
+
+
+def _init_segment_worker():
+    """Keep each training process single-threaded so workers don't oversubscribe cores"""
+    try:
+        import torch
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+
+
+def _train_segment_model(algorithm: str, train_data: pd.DataFrame, timesteps: int,
+                         model_path: str, normalize_observations: bool = True,
+                         position_independent: bool = False,
+                         observations: Optional[np.ndarray] = None) -> Tuple[str, Dict]:
+    """Process-pool task: train and save the model for one walk-forward segment"""
+    trader = ReinforcementLearningTrader(algorithm, normalize_observations=normalize_observations,
+                                         position_independent=position_independent)
+    training_results = trader.train_model(train_data, episodes=timesteps, save_path=model_path,
+                                          observations=observations)
+    return model_path, training_results
+
+
 class ReinforcementLearningTrader:
     """Advanced RL Trading Agent with Strategy Adaptation"""
     
-    def __init__(self, algorithm: str = 'PPO'):
+    def __init__(self, algorithm: str = 'PPO', normalize_observations: bool = True,
+                 position_independent: bool = False):
         self.algorithm = algorithm
         self.model = None
         self.scaler = StandardScaler()
+        
+        # Rolling-normalized observations replace per-feature scaling of raw prices
+        self.normalize_observations = normalize_observations
+        
+        # Policies that only see market data can be evaluated over a whole episode at once
+        self.position_independent = position_independent
         self.performance_history = []
         self.strategy_adaptations = []
         
     def train_model(self, data: pd.DataFrame, episodes: int = 10000, 
-                   save_path: str = None) -> Dict:
-        """Train the RL model on historical data"""
+                   save_path: str = None, n_envs: int = 1, vec_env: str = 'batched',
+                   extra_datasets: Optional[List[pd.DataFrame]] = None,
+                   checkpoint_dir: Optional[str] = None, checkpoint_freq: int = 10000,
+                   resume: bool = True, observations: Optional[np.ndarray] = None) -> Dict:
+        """
+        Train the RL model on historical data
+        
+        Args:
+            data: Historical data with technical indicators
+            episodes: Total training timesteps
+            save_path: Where to save the trained model
+            n_envs: Number of parallel environments collecting rollouts
+            vec_env: 'batched' (vectorized in-process) or 'subproc' (one process per env)
+            extra_datasets: Additional frames (e.g. other symbols) to sample episodes from
+            checkpoint_dir: Directory for periodic checkpoints (disabled if None)
+            checkpoint_freq: Timesteps between checkpoints
+            resume: Continue from an unfinished checkpoint in checkpoint_dir if one exists
+            observations: Precomputed market rows for data (a slice of a tensor
+                normalized over a longer history); built from data alone if None
+            
+        Returns:
+            Training results
+        """
         
         if not HAS_RL_DEPS:
             print("Warning: RL dependencies not available. Using fallback basic strategy.")
@@ -221,11 +672,23 @@ class ReinforcementLearningTrader:
             }
         
         # Create training environment
-        env = TradingEnvironment(data)
-        env = DummyVecEnv([lambda: env])
-        
-        # Initialize model based on algorithm
-        if self.algorithm == 'PPO':
+        env = make_training_env([data] + list(extra_datasets or []), n_envs=n_envs, vec_env=vec_env,
+                                normalize=self.normalize_observations,
+                                include_portfolio_state=not self.position_independent,
+                                observations=[observations] + [None] * len(extra_datasets or []))
+        
+        checkpoint_state = None
+        if checkpoint_dir and resume:
+            checkpoint_state = TrainingCheckpointCallback.load_state(checkpoint_dir)
+            # A finished run's checkpoint is a result, not a run to continue
+            if checkpoint_state is not None and checkpoint_state.get('completed'):
+                print(f"Checkpoint in {checkpoint_dir} is from a completed run; starting fresh training")
+                checkpoint_state = None
+
+        # Initialize model based on algorithm (or restore it from the checkpoint)
+        if checkpoint_state is not None:
+            self._resume_from_checkpoint(checkpoint_dir, checkpoint_state, env)
+        elif self.algorithm == 'PPO':
             self.model = PPO('MlpPolicy', env, verbose=1, 
                            learning_rate=0.0003, n_steps=2048)
         elif self.algorithm == 'A2C':
@@ -234,38 +697,92 @@ class ReinforcementLearningTrader:
             self.model = DQN('MlpPolicy', env, verbose=1, 
                            learning_rate=0.0001, buffer_size=50000)
         
-        # Train the model
-        print(f"Training {self.algorithm} model for {episodes} timesteps...")
-        self.model.learn(total_timesteps=episodes)
+        callback = None
+        if checkpoint_dir:
+            callback = TrainingCheckpointCallback(checkpoint_dir, checkpoint_freq, verbose=1)
+        
+        # Train the model (only the remaining timesteps when resuming)
+        remaining = episodes - self.model.num_timesteps if checkpoint_state is not None else episodes
+        if remaining > 0:
+            print(f"Training {self.algorithm} model for {remaining} timesteps on {env.num_envs} environment(s)...")
+            self.model.learn(total_timesteps=remaining, callback=callback,
+                             reset_num_timesteps=checkpoint_state is None)
+            if callback is not None:
+                callback.save_checkpoint(completed=True)
+        env.close()
         
         # Save model if path provided
         if save_path:
             self.model.save(save_path)
             joblib.dump(self.scaler, f"{save_path}_scaler.pkl")
+            joblib.dump({
+                'normalize_observations': self.normalize_observations,
+                'position_independent': self.position_independent
+            }, f"{save_path}_observations.pkl")
         
         # Evaluate training performance
-        train_results = self._evaluate_model(data)
+        train_results = self._evaluate_model(data, observations)
         
         return {
             'algorithm': self.algorithm,
             'training_episodes': episodes,
+            'parallel_envs': n_envs,
+            'resumed_from_timestep': checkpoint_state['num_timesteps'] if checkpoint_state else None,
             'final_return': train_results['total_return'],
             'sharpe_ratio': train_results['sharpe_ratio'],
             'max_drawdown': train_results['max_drawdown']
         }
     
-    def _evaluate_model(self, data: pd.DataFrame) -> Dict:
-        """Evaluate model performance on given data"""
-        env = TradingEnvironment(data)
+    def _resume_from_checkpoint(self, checkpoint_dir: str, checkpoint_state: Dict, env):
+        """Restore model, optimizer, replay buffer and environment RNG from a checkpoint"""
+        algorithms = {'PPO': PPO, 'A2C': A2C, 'DQN': DQN}
+        model_path = os.path.join(checkpoint_dir, TrainingCheckpointCallback.MODEL_FILE)
+        self.model = algorithms[self.algorithm].load(model_path, env=env)
+        
+        buffer_path = os.path.join(checkpoint_dir, TrainingCheckpointCallback.REPLAY_BUFFER_FILE)
+        if hasattr(self.model, 'load_replay_buffer') and os.path.exists(buffer_path):
+            self.model.load_replay_buffer(buffer_path)
+        
+        env_rng = getattr(env, 'rng', None)
+        if env_rng is not None and checkpoint_state.get('env_rng_state') is not None:
+            env_rng.bit_generator.state = checkpoint_state['env_rng_state']
+        
+        print(f"Resuming {self.algorithm} training from checkpoint at {checkpoint_state['num_timesteps']} timesteps")
+    
+    def _evaluate_model(self, data: pd.DataFrame, observations: Optional[np.ndarray] = None) -> Dict:
+        """
+        Evaluate model performance on given data
+        
+        Args:
+            data: Historical data with technical indicators
+            observations: Market observation rows for data, sliced from a tensor built
+                over a longer history (computed from data alone if None)
+            
+        Returns:
+            Performance metrics, portfolio values, trades and actions
+        """
+        env = TradingEnvironment(data, normalize=self.normalize_observations,
+                                 include_portfolio_state=not self.position_independent,
+                                 observations=observations)
         
         obs = env.reset()
         total_reward = 0
         done = False
         
-        while not done:
-            action, _states = self.model.predict(obs, deterministic=True)
-            obs, reward, done, info = env.step(action)
-            total_reward += reward
+        if self.position_independent:
+            # Observations don't depend on earlier actions: predict the whole episode
+            # in one forward pass, then replay the actions through the portfolio rules
+            actions, _ = self.predict_actions_batch(env.market_observations())
+            for action in actions:
+                obs, reward, done, info = env.step(int(action))
+                total_reward += reward
+                if done:
+                    break
+        else:
+            while not done:
+                action, _states = self.model.predict(obs, deterministic=True)
+                obs, reward, done, info = env.step(action)
+                total_reward += reward
         
         # Calculate performance metrics
         portfolio_values = env.portfolio_values
@@ -293,9 +810,22 @@ class ReinforcementLearningTrader:
             'actions': env.actions_taken
         }
     
-    def adaptive_backtest(self, data: pd.DataFrame, adaptation_frequency: int = 50) -> Dict:
-        """Run adaptive backtesting with real-time strategy updates"""
-        
+    def adaptive_backtest(self, data: pd.DataFrame, adaptation_frequency: int = 50,
+                          parallel: bool = False, max_workers: Optional[int] = None,
+                          timesteps: int = 2000) -> Dict:
+        """
+        Run adaptive backtesting with real-time strategy updates
+        
+        Args:
+            data: Historical data with technical indicators
+            adaptation_frequency: Bars per walk-forward segment
+            parallel: Train all segment models concurrently in a process pool
+            max_workers: Pool size (CPU count if None)
+            timesteps: Training timesteps per segment
+            
+        Returns:
+            Per-segment and overall backtest results
+        """
         total_length = len(data)
         adaptation_points = range(adaptation_frequency, total_length, adaptation_frequency)
         
@@ -306,33 +836,51 @@ class ReinforcementLearningTrader:
             'strategy_evolution': []
         }
         
+        # Walk-forward plan: every training and test window is known up front
+        segments = []
         current_start = 0
+        for i, adaptation_point in enumerate(adaptation_points):
+            test_end = min(adaptation_point + adaptation_frequency, total_length)
+            # Too little to train on: keep extending the window; too little to test: skip
+            if adaptation_point - current_start >= 20 and test_end - adaptation_point > 5:
+                segments.append((i, current_start, adaptation_point, test_end))
+                current_start = adaptation_point
+        
+        # Normalize over the whole history once; training and test segments slice the same
+        # tensor, so neither restarts the rolling window and both see one distribution
+        observations = build_observation_tensor(data, normalize=self.normalize_observations)
+        
+        model_dir = None
+        trained_segments = {}
         overall_portfolio_values = []
         overall_trades = []
         
-        for i, adaptation_point in enumerate(adaptation_points):
-            # Get data segment for training
-            train_data = data.iloc[current_start:adaptation_point]
-            
-            if len(train_data) < 20:  # Skip if not enough data
-                continue
-            
-            print(f"Adaptation {i+1}: Training on data from {current_start} to {adaptation_point}")
-            
-            # Retrain model on recent data
-            training_results = self.train_model(train_data, episodes=2000)
-            
-            # Test on next segment
-            test_start = adaptation_point
-            test_end = min(adaptation_point + adaptation_frequency, total_length)
-            test_data = data.iloc[test_start:test_end]
+        try:
+            if parallel and HAS_RL_DEPS and segments:
+                model_dir = tempfile.mkdtemp(prefix='rl_segments_')
+                trained_segments = self._train_segments_parallel(data, segments, timesteps, model_dir, max_workers,
+                                                                 observations=observations)
             
-            if len(test_data) > 5:
-                segment_results = self._evaluate_model(test_data)
+            for i, train_start, adaptation_point, test_end in segments:
+                if i in trained_segments:
+                    model_path, training_results = trained_segments[i]
+                    self.load_model(model_path)
+                else:
+                    print(f"Adaptation {i+1}: Training on data from {train_start} to {adaptation_point}")
+                    
+                    # Retrain model on recent data
+                    training_results = self.train_model(data.iloc[train_start:adaptation_point], episodes=timesteps,
+                                                        observations=observations[train_start:adaptation_point])
+                
+                # Test on next segment
+                test_start = adaptation_point
+                test_data = data.iloc[test_start:test_end]
+                
+                segment_results = self._evaluate_model(test_data, observations[test_start:test_end])
                 
                 adaptation_info = {
                     'adaptation_number': i + 1,
-                    'train_period': (current_start, adaptation_point),
+                    'train_period': (train_start, adaptation_point),
                     'test_period': (test_start, test_end),
                     'training_performance': training_results,
                     'test_performance': segment_results
@@ -352,8 +900,10 @@ class ReinforcementLearningTrader:
                 
                 overall_portfolio_values.extend(segment_results['portfolio_values'])
                 overall_trades.extend(segment_results['trades'])
-            
-            current_start = adaptation_point
+        finally:
+            # Segment models are temporary, also when a segment fails
+            if model_dir:
+                shutil.rmtree(model_dir, ignore_errors=True)
         
         # Calculate overall performance
         if overall_portfolio_values:
@@ -381,6 +931,24 @@ class ReinforcementLearningTrader:
         
         return results
     
+    def _train_segments_parallel(self, data: pd.DataFrame, segments: List[Tuple], timesteps: int,
+                                 model_dir: str, max_workers: Optional[int] = None,
+                                 observations: Optional[np.ndarray] = None) -> Dict:
+        """Train one model per walk-forward segment in a process pool, saving them to model_dir"""
+        print(f"Training {len(segments)} segment models in parallel...")
+        
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_segment_worker) as pool:
+            futures = {
+                i: pool.submit(_train_segment_model, self.algorithm,
+                               data.iloc[train_start:adaptation_point], timesteps,
+                               os.path.join(model_dir, f"segment_{i}"), self.normalize_observations,
+                               self.position_independent,
+                               observations[train_start:adaptation_point] if observations is not None else None)
+                for i, train_start, adaptation_point, _ in segments
+            }
+            return {i: future.result() for i, future in futures.items()}
+    
     def load_model(self, model_path: str):
         """Load a pre-trained model"""
         if self.algorithm == 'PPO':
@@ -390,6 +958,13 @@ class ReinforcementLearningTrader:
         elif self.algorithm == 'DQN':
             self.model = DQN.load(model_path)
         
+        # Observation settings the model was trained with; models saved without them
+        # predate normalization and always saw the portfolio state
+        settings_path = f"{model_path}_observations.pkl"
+        settings = joblib.load(settings_path) if os.path.exists(settings_path) else {}
+        self.normalize_observations = settings.get('normalize_observations', False)
+        self.position_independent = settings.get('position_independent', False)
+        
         # Load scaler if available
         scaler_path = f"{model_path}_scaler.pkl"
         if os.path.exists(scaler_path):
@@ -400,10 +975,36 @@ class ReinforcementLearningTrader:
         if self.model is None:
             raise ValueError("Model not trained or loaded")
         
-        action, _states = self.model.predict(observation, deterministic=True)
+        actions, confidences = self.predict_actions_batch(observation)
+        return int(actions[0]), float(confidences[0])
+    
+    def predict_actions_batch(self, observations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Deterministic actions for a matrix of observations in one forward pass
+        
+        Args:
+            observations: Array of shape (n, observation_size) or a single observation
+            
+        Returns:
+            Tuple of (actions, confidences), each of length n
+        """
+        if self.model is None:
+            raise ValueError("Model not trained or loaded")
+        
+        observations = np.asarray(observations, dtype=np.float32)
+        if observations.ndim == 1:
+            observations = observations[np.newaxis, :]
+        
+        policy = self.model.policy
+        policy.set_training_mode(False)
+        obs_tensor, _ = policy.obs_to_tensor(observations)
         
-        # Get confidence score (simplified)
-        action_probs = self.model.policy.get_distribution(observation).distribution.probs
-        confidence = float(np.max(action_probs))
+        with torch.no_grad():
+            if hasattr(policy, 'get_distribution'):
+                action_probs = policy.get_distribution(obs_tensor).distribution.probs
+            else:
+                # Value-based policies (DQN): softmax over Q-values, argmax is the greedy action
+                action_probs = torch.softmax(policy.q_net(obs_tensor), dim=1)
         
-        return int(action), confidence
\ No newline at end of file
+        action_probs = action_probs.cpu().numpy()
+        return action_probs.argmax(axis=1), action_probs.max(axis=1)
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Typed Trade Ledger with exponentially decayed per-strategy statistics
+"""
+import numpy as np
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Union
+
+
+class TradeLedger:
+    """
+    Append-only array ledger of closed trades, keeping decayed statistics per strategy
+
+    Trades decay by elapsed time: a trade's weight halves every half_life before
+    the latest close recorded, so a burst of trades on one day does not outweigh
+    weeks of history.
+    """
+
+    def __init__(self, strategies: List[str], half_life: Union[timedelta, float, None] = timedelta(days=10),
+                 capacity: int = 256):
+        """
+        Args:
+            strategies: Strategy names (their position is the strategy id)
+            half_life: Time after which a trade's weight halves, as a timedelta or in
+                timestamp units (seconds, or steps for numeric timestamps); None disables decay
+            capacity: Initial array capacity (grows by doubling)
+        """
+        self.strategies = list(strategies)
+        self.strategy_index = {name: i for i, name in enumerate(self.strategies)}
+        self.half_life = half_life.total_seconds() if isinstance(half_life, timedelta) else half_life
+        self.reference_time = None
+
+        self._strategy_ids = np.empty(capacity, dtype=np.int16)
+        self._pnl = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+        # Exponentially decayed statistics, updated incrementally as trades close
+        n_strategies = len(self.strategies)
+        self.decayed_count = np.zeros(n_strategies)
+        self.decayed_pnl = np.zeros(n_strategies)
+        self.decayed_wins = np.zeros(n_strategies)
+
+    @property
+    def strategy_ids(self) -> np.ndarray:
+        return self._strategy_ids[:self.size]
+
+    @property
+    def pnl(self) -> np.ndarray:
+        return self._pnl[:self.size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[:self.size]
+
+    def record(self, strategy: str, pnl: float, timestamp: Union[float, datetime, None] = None):
+        """
+        Record one closed trade and update the decayed statistics
+
+        Args:
+            strategy: Strategy the trade is attributed to
+            pnl: Realized profit/loss of the trade
+            timestamp: Close time (datetime or numeric step); defaults to now
+        """
+        self.record_many([strategy], [pnl], [timestamp])
+
+    def record_many(self, strategies: List[str], pnls: List[float], timestamps: Optional[List] = None):
+        """Record a batch of closed trades in order with one vectorized statistics update"""
+        n = len(pnls)
+        if n == 0:
+            return
+
+        ids = np.fromiter((self.strategy_index[s] for s in strategies), dtype=np.int16, count=n)
+        pnls = np.asarray(pnls, dtype=np.float64)
+        stamps = np.array([self._to_seconds(t) for t in (timestamps or [None] * n)], dtype=np.float64)
+
+        self._reserve(self.size + n)
+        self._strategy_ids[self.size:self.size + n] = ids
+        self._pnl[self.size:self.size + n] = pnls
+        self._timestamps[self.size:self.size + n] = stamps
+        self.size += n
+
+        # Statistics are kept decayed to the latest close time seen so far
+        reference = stamps.max() if self.reference_time is None else max(self.reference_time, stamps.max())
+        if self.half_life:
+            weights = 0.5 ** ((reference - stamps) / self.half_life)
+            carry = 0.5 ** ((reference - self.reference_time) / self.half_life) if self.reference_time is not None else 1.0
+        else:
+            weights, carry = np.ones(n), 1.0
+        self.reference_time = reference
+        n_strategies = len(self.strategies)
+
+        self.decayed_count = self.decayed_count * carry + np.bincount(ids, weights=weights, minlength=n_strategies)
+        self.decayed_pnl = self.decayed_pnl * carry + np.bincount(ids, weights=weights * pnls, minlength=n_strategies)
+        self.decayed_wins = self.decayed_wins * carry + np.bincount(ids, weights=weights * (pnls > 0), minlength=n_strategies)
+
+    def statistics(self) -> Dict[str, np.ndarray]:
+        """Decayed trade count, average profit and success rate per strategy, as of the latest close"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_profit = np.where(self.decayed_count > 0, self.decayed_pnl / self.decayed_count, 0.0)
+            success_rate = np.where(self.decayed_count > 0, self.decayed_wins / self.decayed_count, 0.0)
+
+        return {
+            'effective_count': self.decayed_count.copy(),
+            'avg_profit': avg_profit,
+            'success_rate': success_rate
+        }
+
+    def recent_pnl(self, n: int) -> float:
+        """Total profit/loss of the last n trades"""
+        return float(self.pnl[-n:].sum()) if self.size else 0.0
+
+    def reset(self):
+        """Drop all recorded trades and statistics"""
+        self.size = 0
+        self.reference_time = None
+        self.decayed_count[:] = 0
+        self.decayed_pnl[:] = 0
+        self.decayed_wins[:] = 0
+
+    def _reserve(self, required: int):
+        """Grow the backing arrays to hold at least `required` trades"""
+        capacity = len(self._pnl)
+        if required <= capacity:
+            return
+
+        while capacity < required:
+            capacity *= 2
+        self._strategy_ids = np.resize(self._strategy_ids, capacity)
+        self._pnl = np.resize(self._pnl, capacity)
+        self._timestamps = np.resize(self._timestamps, capacity)
+
+    @staticmethod
+    def _to_seconds(timestamp) -> float:
+        """Convert a datetime/numeric timestamp into a float"""
+        if timestamp is None:
+            return datetime.now().timestamp()
+        if hasattr(timestamp, 'timestamp'):
+            return timestamp.timestamp()
+        return float(timestamp)
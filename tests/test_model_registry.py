@@ -0,0 +1,56 @@
+"""
+Tests for versioning and retention in the model registry
+"""
+import os
+
+import pandas as pd
+
+from ml.model_registry import ModelRegistry
+
+
+def make_registry(tmp_path, **kwargs):
+    return ModelRegistry(root_dir=str(tmp_path), **kwargs)
+
+
+def test_versions_and_latest_bundle(tmp_path):
+    registry = make_registry(tmp_path)
+    assert registry.save('AAPL__window', {'weights': [1, 2]}, {'symbol': 'AAPL'}) == 1
+    assert registry.save('AAPL__window', {'weights': [3, 4]}) == 2
+
+    # A second instance reads from disk, not from the first one's memory cache
+    reader = make_registry(tmp_path)
+    assert reader.load('AAPL__window') == {'weights': [3, 4]}
+    assert reader.load('AAPL__window', version=1) == {'weights': [1, 2]}
+    assert reader.list_versions('AAPL__window')[0]['metadata'] == {'symbol': 'AAPL'}
+    assert reader.load('MSFT__window') is None
+
+
+def test_make_key_reflects_data_window():
+    data = pd.DataFrame({'Close': [1.0, 2.0, 3.0]}, index=pd.date_range('2024-01-01', periods=3))
+
+    assert ModelRegistry.make_key('brk.b', data) == 'BRK_B__202401010000_202401030000_3'
+    assert ModelRegistry.make_key('AAPL', data, variant='abc').endswith('__abc')
+    assert ModelRegistry.make_key('AAPL', data.head(2)) != ModelRegistry.make_key('AAPL', data)
+
+
+def test_old_versions_are_deleted(tmp_path):
+    registry = make_registry(tmp_path, max_versions=2)
+    for i in range(3):
+        registry.save('AAPL__window', {'i': i})
+
+    assert [info['version'] for info in registry.list_versions('AAPL__window')] == [2, 3]
+    assert not os.path.exists(tmp_path / 'AAPL__window' / 'v1.joblib')
+    assert os.path.exists(tmp_path / 'AAPL__window' / 'v3.joblib')
+
+
+def test_old_keys_of_a_symbol_are_deleted(tmp_path):
+    registry = make_registry(tmp_path, max_keys_per_symbol=2)
+    for key in ['AAPL__first', 'MSFT__only', 'AAPL__second', 'AAPL__third']:
+        registry.save(key, {'key': key})
+
+    registry.clear_cache()
+    assert registry.load('AAPL__first') is None
+    assert not os.path.exists(tmp_path / 'AAPL__first')
+    assert registry.load('AAPL__second') == {'key': 'AAPL__second'}
+    assert registry.load('MSFT__only') == {'key': 'MSFT__only'}
+    assert registry.latest_key_for_symbol('AAPL') == 'AAPL__third'
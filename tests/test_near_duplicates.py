@@ -0,0 +1,41 @@
+"""
+Tests for MinHash near-duplicate clustering of syndicated news
+"""
+from utils.near_duplicates import NearDuplicateDetector
+
+STORY = ("Apple reported quarterly revenue of 90 billion dollars, beating analyst expectations "
+         "as iPhone sales rose in every region and services reached a record high")
+
+
+def test_syndicated_copies_share_a_cluster():
+    detector = NearDuplicateDetector()
+    texts = [
+        STORY,
+        "Tesla recalls two million vehicles over autopilot safety concerns raised by regulators",
+        STORY + " according to the company",
+        "",
+        "",
+    ]
+
+    clusters = detector.cluster(texts)
+
+    assert clusters[0] == clusters[2] == 0
+    assert clusters[1] == 1
+    # Texts without shingles never merge, not even with each other
+    assert clusters[3] == 3 and clusters[4] == 4
+
+
+def test_deduplicate_keeps_first_article_and_counts_copies():
+    articles = [
+        {'title': STORY, 'summary': '', 'source': 'Reuters'},
+        {'title': 'Fed holds interest rates steady', 'summary': 'Markets rally on the decision', 'source': 'AP'},
+        {'title': STORY, 'summary': '', 'source': 'Yahoo'},
+    ]
+
+    representatives = NearDuplicateDetector().deduplicate(articles)
+
+    assert [article['source'] for article in representatives] == ['Reuters', 'AP']
+    assert representatives[0]['cluster_size'] == 2
+    assert representatives[0]['duplicate_sources'] == ['Yahoo']
+    assert representatives[1]['cluster_size'] == 1
+    assert 'cluster_size' not in articles[0]
@@ -0,0 +1,100 @@
+"""
+Tests for the news scraper's conditional requests against a local HTTP stub
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from utils import news_scraper
+from utils.news_scraper import NewsScraperFallback
+
+PAGE = b"<html><body><article><p>Apple beats earnings expectations.</p></article></body></html>"
+ETAG = '"v1"'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves one page with an ETag and answers matching If-None-Match with 304"""
+
+    requests_seen = []
+
+    def do_GET(self):
+        StubHandler.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    server = HTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StubHandler.requests_seen = []
+    yield f"http://127.0.0.1:{server.server_address[1]}/news"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    news_scraper.page_cache.clear()
+    news_scraper.extraction_cache.clear()
+
+    # Extraction itself runs in worker processes; only the HTTP/cache behaviour is under test
+    scraper = NewsScraperFallback()
+    monkeypatch.setattr(scraper, 'extract_text', lambda html: 'extracted: ' + html[:20])
+    return scraper
+
+
+def test_first_fetch_downloads_and_extracts(scraper, stub_url):
+    text = scraper.fetch_page_text(stub_url)
+
+    assert text == 'extracted: ' + PAGE.decode()[:20]
+    assert scraper.stats['extractions'] == 1
+    assert 'If-None-Match' not in StubHandler.requests_seen[0]
+
+
+def test_unchanged_page_revalidates_with_304(scraper, stub_url):
+    first = scraper.fetch_page_text(stub_url)
+    second = scraper.fetch_page_text(stub_url)
+
+    assert second == first
+    assert StubHandler.requests_seen[1].get('If-None-Match') == ETAG
+    assert scraper.stats['not_modified'] == 1
+    assert scraper.stats['extractions'] == 1
+
+
+def test_expired_extraction_refetches_without_validators(scraper, stub_url):
+    first = scraper.fetch_page_text(stub_url)
+    news_scraper.extraction_cache.clear()
+
+    text = scraper.fetch_page_text(stub_url)
+
+    assert text == first
+    assert 'If-None-Match' not in StubHandler.requests_seen[1]
+    assert scraper.stats['not_modified'] == 0
+    assert scraper.stats['extractions'] == 2
+
+
+def test_failed_extraction_is_not_cached(scraper, stub_url, monkeypatch):
+    monkeypatch.setattr(scraper, 'extract_text', lambda html: None)
+    assert scraper.fetch_page_text(stub_url) is None
+    assert len(news_scraper.extraction_cache) == 0
+
+    monkeypatch.setattr(scraper, 'extract_text', lambda html: 'extracted')
+    assert scraper.fetch_page_text(stub_url) == 'extracted'
+    assert 'If-None-Match' not in StubHandler.requests_seen[1]
+    assert scraper.stats['extractions'] == 2
@@ -0,0 +1,35 @@
+"""
+Tests for keyword and ticker matching in news relevance scoring
+"""
+import numpy as np
+
+from utils.news_sentiment import RelevanceMatcher
+
+
+def test_keywords_match_whole_words_and_inflections():
+    matcher = RelevanceMatcher([], keywords=['loss', 'ipo'])
+    keyword_counts, _ = matcher.match_counts([
+        'Quarterly LOSSES widen',
+        'New iPod launch',
+        'The IPO priced and the ipos that followed',
+    ])
+
+    np.testing.assert_array_equal(keyword_counts, [1, 0, 1])
+
+
+def test_symbols_match_tickers_and_cashtags_only():
+    matcher = RelevanceMatcher(['ON', 'AAPL'])
+    _, mentions = matcher.match_counts([
+        'Analysts turn on the charm',
+        'ON Semiconductor and $ON rally',
+        'Shares of AAPL rose; AAPLX and ^AAPL are other tickers',
+    ])
+
+    np.testing.assert_array_equal(mentions, [[0, 0], [2, 0], [0, 1]])
+
+
+def test_relevance_combines_mentions_and_keywords():
+    matcher = RelevanceMatcher(['MSFT'])
+    relevance = matcher.relevance_matrix(['MSFT earnings beat, revenue up', 'Weather report'])
+
+    np.testing.assert_allclose(relevance, [[0.5], [0.0]])
@@ -0,0 +1,66 @@
+"""
+Tests for decayed news sentiment joined onto price bars
+"""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from utils.signal_fusion import SentimentSignalFusion
+
+
+class StubSeries:
+    """In-memory stand-in for the sentiment bucket store"""
+
+    def __init__(self, buckets):
+        self.buckets = pd.DataFrame(
+            [{'weighted_score_sum': score * relevance, 'relevance_sum': relevance} for _, score, relevance in buckets],
+            index=pd.DatetimeIndex([start for start, _, _ in buckets])
+        )
+
+    def query(self, symbol, start=None, end=None, resolution='day'):
+        frame = self.buckets
+        return frame[(frame.index >= start) & (frame.index <= end)]
+
+
+def bars(*times):
+    return pd.DataFrame({'Close': range(len(times))}, index=pd.DatetimeIndex(times))
+
+
+@pytest.fixture
+def fusion():
+    return SentimentSignalFusion(StubSeries([(datetime(2024, 3, 1, 10), 0.8, 1.0)]), resolution='hour')
+
+
+def test_bars_only_see_closed_buckets(fusion):
+    result = fusion.add_news_signal(bars('2024-03-01 10:30', '2024-03-01 11:00'), 'AAPL')
+
+    assert list(result['news_signal']) == [0.0, pytest.approx(0.8)]
+    assert result['news_signal_mass'].iloc[1] == pytest.approx(1.0)
+
+
+def test_older_news_decays(fusion):
+    result = fusion.add_news_signal(bars('2024-03-02 11:00'), 'AAPL')
+
+    # The mean score is unchanged; the mass behind it halves after one 24h half-life
+    assert result['news_signal'].iloc[0] == pytest.approx(0.8)
+    assert result['news_signal_mass'].iloc[0] == pytest.approx(0.5)
+
+
+def test_live_cutoff_includes_the_open_bucket(fusion):
+    data = bars('2024-03-01 09:00', '2024-03-01 10:00')
+
+    historical = fusion.add_news_signal(data, 'AAPL')
+    live = fusion.add_news_signal(data, 'AAPL', live_cutoff=datetime(2024, 3, 1, 10, 20))
+
+    assert historical['news_signal'].iloc[-1] == 0.0
+    assert live['news_signal'].iloc[-1] == pytest.approx(0.8)
+    assert live['news_signal'].iloc[0] == 0.0
+
+
+def test_adjustment_ignores_thin_news(fusion):
+    assert fusion.adjustment(0.9, 0.1) == (0.0, None)
+
+    adjustment, reason = fusion.adjustment(-0.5, 6.0)
+    assert adjustment == pytest.approx(-0.75)
+    assert 'bearish' in reason
@@ -0,0 +1,47 @@
+"""
+Tests for the trade ledger's time-decayed per-strategy statistics
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from ml.trade_ledger import TradeLedger
+
+STRATEGIES = ['technical', 'momentum', 'mean_reversion', 'volatility']
+START = datetime(2024, 1, 1)
+
+
+def test_weight_halves_after_one_half_life():
+    ledger = TradeLedger(STRATEGIES, half_life=timedelta(days=10))
+    ledger.record('technical', 10.0, START)
+    ledger.record('technical', -5.0, START + timedelta(days=10))
+
+    stats = ledger.statistics()
+    assert stats['effective_count'][0] == pytest.approx(1.5)
+    assert stats['avg_profit'][0] == pytest.approx((10.0 * 0.5 - 5.0) / 1.5)
+    assert stats['success_rate'][0] == pytest.approx(0.5 / 1.5)
+
+
+def test_burst_of_trades_does_not_decay_other_history():
+    ledger = TradeLedger(STRATEGIES, half_life=timedelta(days=10))
+    ledger.record('momentum', 3.0, START)
+    ledger.record_many(['technical'] * 20, [1.0] * 20, [START] * 20)
+
+    stats = ledger.statistics()
+    assert stats['effective_count'][1] == pytest.approx(1.0)
+    assert stats['effective_count'][0] == pytest.approx(20.0)
+
+
+def test_batch_matches_one_by_one_recording():
+    trades = [('technical', 2.0, 0), ('momentum', -1.0, 5), ('technical', 4.0, 12), ('volatility', 1.0, 12)]
+    single = TradeLedger(STRATEGIES, half_life=7.0)
+    for strategy, pnl, step in trades:
+        single.record(strategy, pnl, step)
+    batch = TradeLedger(STRATEGIES, half_life=7.0)
+    batch.record_many(*map(list, zip(*trades)))
+
+    for name, values in single.statistics().items():
+        np.testing.assert_allclose(batch.statistics()[name], values)
+    assert batch.size == 4
+    assert batch.recent_pnl(2) == pytest.approx(5.0)
@@ -3,6 +3,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from utils.data_fetcher import StockDataFetcher
+from utils.signal_fusion import signal_fusion
 
 class BacktestingEngine:
     """Professional backtesting engine for trading strategies"""
@@ -32,6 +33,12 @@ class BacktestingEngine:
             # Calculate technical indicators
             data_with_indicators = self.data_fetcher.calculate_technical_indicators(historical_data.copy())
             
+            # Decayed news sentiment per bar from the stored history (no network access)
+            try:
+                data_with_indicators = signal_fusion.add_news_signal(data_with_indicators, symbol)
+            except Exception as e:
+                print(f"News sentiment unavailable for {symbol}: {e}")
+            
             # Generate signals for each day
             signals = self._generate_historical_signals(data_with_indicators)
             
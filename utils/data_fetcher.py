@@ -1,6 +1,9 @@
 import yfinance as yf
 import pandas as pd
+from datetime import datetime, timezone
 from typing import Dict, Optional, Any
+from utils.market_events import market_events
+from utils.signal_fusion import signal_fusion
 
 class StockDataFetcher:
     """Handles fetching stock data from Yahoo Finance"""
@@ -57,6 +60,9 @@ class StockDataFetcher:
             required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
             if not all(col in hist_data.columns for col in required_columns):
                 return None
+            
+            # Notify learning engines of bars they haven't seen yet
+            market_events.publish_bars(symbol, hist_data)
                 
             return hist_data
             
@@ -392,6 +398,13 @@ class StockDataFetcher:
                 except Exception as e:
                     print(f"Error getting buy/sell ratio: {e}")
             
+            # Fold in decayed news sentiment (precomputed per bar in backtests)
+            news_signal, news_mass = self._news_signal(data, symbol)
+            news_adjustment, news_reason = signal_fusion.adjustment(news_signal, news_mass)
+            if news_reason:
+                signals.append(news_reason)
+                signal_strength += news_adjustment
+            
             # Determine overall signal
             if signal_strength >= 3:
                 overall_signal = "STRONG BUY"
@@ -417,7 +430,9 @@ class StockDataFetcher:
                 'rsi': latest['RSI'],
                 'macd': latest['MACD'],
                 'price_vs_sma20': ((latest['Close'] - latest['SMA_20']) / latest['SMA_20']) * 100,
-                'buy_sell_data': buy_sell_data
+                'buy_sell_data': buy_sell_data,
+                'news_sentiment': news_signal,
+                'news_adjustment': news_adjustment
             }
             
         except Exception as e:
@@ -430,5 +445,31 @@ class StockDataFetcher:
                 'rsi': None,
                 'macd': None,
                 'price_vs_sma20': None,
-                'buy_sell_data': None
+                'buy_sell_data': None,
+                'news_sentiment': 0.0,
+                'news_adjustment': 0.0
             }
+    
+    def _news_signal(self, data: pd.DataFrame, symbol: Optional[str]) -> tuple:
+        """
+        Decayed news sentiment and its relevance mass for the latest bar
+        
+        Uses the news_signal columns when the caller precomputed them (backtests);
+        otherwise reads the stored sentiment history for the last bar only, using
+        news up to now rather than up to the bar's (session-open) timestamp.
+        
+        Returns:
+            Tuple of (news_signal, news_signal_mass), zeros when unavailable
+        """
+        if 'news_signal' not in data.columns:
+            if not symbol:
+                return 0.0, 0.0
+            try:
+                data = signal_fusion.add_news_signal(data.iloc[-1:], symbol,
+                                                     live_cutoff=datetime.now(timezone.utc).replace(tzinfo=None))
+            except Exception as e:
+                print(f"Error reading news sentiment history: {e}")
+                return 0.0, 0.0
+        
+        latest = data.iloc[-1]
+        return float(latest['news_signal']), float(latest['news_signal_mass'])
@@ -9,6 +9,8 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from ml.adaptive_strategy import AdaptiveStrategyEngine
 from database.models import get_db_session, BacktestResult, Trade, StrategyPerformance
+from utils.sentiment_series import sentiment_series
+from utils.signal_fusion import signal_fusion
 import json
 
 class EnhancedBacktestingEngine:
@@ -48,14 +50,24 @@ class EnhancedBacktestingEngine:
             # Portfolio state
             cash = self.initial_capital
             shares = 0
+            cost_basis = 0.0  # Total cost of the shares currently held
             portfolio_value = self.initial_capital
             peak_value = self.initial_capital
             
+            # Closed-trade outcomes feed the engine's ledger for this run only
+            self.adaptive_engine.trade_ledger.reset()
+            
+            # Decayed news sentiment per bar, fused into traditional signals
+            data = self._with_news_signal(symbol, data)
+            
             # ML Strategy initialization
             if use_ml:
+                # Stored news sentiment becomes model features (bars see only closed buckets)
+                data = self._with_sentiment_features(symbol, data)
+                
                 # Train initial model on first 50 days
                 initial_training_data = data.head(50)
-                training_result = self.adaptive_engine.train_models(initial_training_data)
+                training_result = self.adaptive_engine.train_models(initial_training_data, symbol=symbol)
                 adaptation_events.append({
                     'day': 0,
                     'event': 'Initial ML Training',
@@ -74,7 +86,7 @@ class EnhancedBacktestingEngine:
                 signal_info = None
                 if use_ml and len(historical_data) >= 20:
                     try:
-                        signal_info = self.adaptive_engine.generate_adaptive_signals(historical_data)
+                        signal_info = self.adaptive_engine.generate_adaptive_signals(historical_data, symbol=symbol)
                         # Enhance signal strength for more active trading
                         if signal_info.get('confidence', 0) > 0.1:  # Very low threshold for more trades
                             signal_info['strength'] = min(5, signal_info.get('strength', 0) * 2.0)  # More aggressive enhancement
@@ -95,6 +107,16 @@ class EnhancedBacktestingEngine:
                 )
                 
                 if trade_executed:
+                    if trade_executed['action'] == 'BUY':
+                        cost_basis += trade_executed['value'] + trade_executed['commission']
+                    elif shares > 0:
+                        # Realized profit/loss against the average cost of the shares sold
+                        sold_cost = cost_basis * trade_executed['shares'] / shares
+                        cost_basis -= sold_cost
+                        trade_executed['profit_loss'] = trade_executed['value'] - sold_cost
+                        if use_ml:
+                            self.adaptive_engine.record_trade_outcome(trade_executed['profit_loss'], current_date)
+                    
                     cash = trade_executed['new_cash']
                     shares = trade_executed['new_shares']
                     trades_executed.append(trade_executed)
@@ -129,22 +151,9 @@ class EnhancedBacktestingEngine:
                 
                 # Enhanced adaptive retraining - More frequent and aggressive
                 if use_ml and i % adaptation_frequency == 0:
-                    # Adapt strategy based on recent performance
+                    # Adapt strategy from the decayed statistics of closed trades
                     if len(trades_executed) >= 3:  # Lower threshold for faster adaptation
-                        recent_trades = trades_executed[-15:] if len(trades_executed) >= 15 else trades_executed
-                        
-                        # Add profit/loss to recent trades
-                        for trade in recent_trades:
-                            if 'profit_loss' not in trade:
-                                # Calculate profit/loss for completed trades
-                                if trade['action'] == 'BUY':
-                                    # For buy trades, profit is current price - buy price
-                                    trade['profit_loss'] = (current_price - trade['price']) * trade['shares']
-                                else:
-                                    # For sell trades, profit was already realized
-                                    trade['profit_loss'] = trade.get('value', 0) - (trade['shares'] * trade['price'])
-                        
-                        adaptation_result = self.adaptive_engine.adapt_strategy(recent_trades)
+                        adaptation_result = self.adaptive_engine.adapt_strategy()
                         
                         if adaptation_result.get('adaptations'):
                             adaptation_events.append({
@@ -152,14 +161,14 @@ class EnhancedBacktestingEngine:
                                 'event': 'Real-time Strategy Adaptation',
                                 'adaptations': adaptation_result['adaptations'],
                                 'new_weights': adaptation_result['new_weights'],
-                                'performance_improvement': sum([t.get('profit_loss', 0) for t in recent_trades[-5:]])
+                                'performance_improvement': self.adaptive_engine.trade_ledger.recent_pnl(5)
                             })
                     
                     # More frequent model retraining for continuous learning
                     if i % (adaptation_frequency * 2) == 0:  # Every 2 adaptation cycles
                         recent_data = data.iloc[max(0, i-150):i+1]  # Last 150 days
                         if len(recent_data) >= 50:
-                            retrain_result = self.adaptive_engine.train_models(recent_data)
+                            retrain_result = self.adaptive_engine.train_models(recent_data, symbol=symbol)
                             adaptation_events.append({
                                 'day': i,
                                 'event': 'Continuous Learning Update',
@@ -247,6 +256,13 @@ class EnhancedBacktestingEngine:
             strength -= 0.5
             reasons.append('MACD bearish crossover')
         
+        # News sentiment fusion (columns precomputed once per backtest)
+        if 'news_signal' in data.columns:
+            news_adjustment, news_reason = signal_fusion.adjustment(latest['news_signal'], latest['news_signal_mass'])
+            if news_reason:
+                strength += news_adjustment
+                reasons.append(news_reason)
+        
         # Determine final signal
         if strength > 1:
             final_signal = 'STRONG BUY'
@@ -654,6 +670,22 @@ class EnhancedBacktestingEngine:
         except Exception as e:
             print(f"Failed to save to database: {e}")
     
+    def _with_news_signal(self, symbol: str, data: pd.DataFrame) -> pd.DataFrame:
+        """Attach decayed news sentiment from the stored history, leaving data unchanged on failure"""
+        try:
+            return signal_fusion.add_news_signal(data, symbol)
+        except Exception as e:
+            print(f"News sentiment unavailable for {symbol}: {e}")
+            return data
+    
+    def _with_sentiment_features(self, symbol: str, data: pd.DataFrame) -> pd.DataFrame:
+        """Join stored news sentiment onto the price data, leaving it unchanged on failure"""
+        try:
+            return sentiment_series.add_sentiment_features(data, symbol)
+        except Exception as e:
+            print(f"Sentiment features unavailable for {symbol}: {e}")
+            return data
+    
     def _empty_result(self, message: str) -> Dict:
         """Return empty result structure"""
         return {
@@ -0,0 +1,117 @@
+"""
+Import-Time Budget Report for the dashboard's server processes
+
+Run with: python -m utils.import_budget
+"""
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from config import config
+
+# Modules app.py imports at start-up (news modules are imported on first use)
+APP_IMPORTS = [
+    'streamlit', 'pandas', 'numpy',
+    'utils.data_fetcher', 'utils.chart_generator', 'utils.enhanced_backtesting',
+    'utils.help_system', 'ml.adaptive_strategy', 'database.models'
+]
+
+# Deferred modules, reported separately so their cost stays visible
+DEFERRED_IMPORTS = ['utils.news_sentiment', 'utils.news_ingestion', 'utils.news_scraper']
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)")
+
+
+def measure_import_time(module: str, python: Optional[str] = None) -> Dict:
+    """
+    Cold import cost of one module, measured in a fresh interpreter with -X importtime
+
+    Args:
+        module: Dotted module name
+        python: Interpreter to use (the current one if None)
+
+    Returns:
+        Dictionary with cumulative seconds and the slowest top-level dependencies,
+        or an 'error' entry if the import failed
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=project_root
+    )
+    if completed.returncode != 0:
+        last_line = completed.stderr.strip().splitlines()[-1:] or ['unknown error']
+        return {'module': module, 'error': last_line[0]}
+
+    cumulative = {}
+    top_level = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, total_us, indent, name = match.groups()
+        cumulative[name] = int(total_us) / 1e6
+        if len(indent) <= 1:
+            top_level.append((name, int(total_us) / 1e6))
+
+    return {
+        'module': module,
+        'seconds': cumulative.get(module, sum(seconds for _, seconds in top_level)),
+        'slowest_dependencies': sorted(top_level, key=lambda item: item[1], reverse=True)[:5]
+    }
+
+
+def import_budget_report(modules: Optional[List[str]] = None, budget: Optional[float] = None) -> Dict:
+    """
+    Measure start-up imports against the configured budget
+
+    Each module is measured cold in its own interpreter, so shared dependencies are
+    included in every module's time.
+
+    Args:
+        modules: Modules to measure (APP_IMPORTS if None)
+        budget: Allowed seconds for the slowest single import (IMPORT_TIME_BUDGET if None)
+
+    Returns:
+        Per-module measurements, deferred-module costs and whether the budget holds
+    """
+    budget = config.IMPORT_TIME_BUDGET if budget is None else budget
+    results = [measure_import_time(module) for module in (modules or APP_IMPORTS)]
+    deferred = [measure_import_time(module) for module in DEFERRED_IMPORTS]
+
+    measured = [result['seconds'] for result in results if 'seconds' in result]
+    slowest = max(measured, default=0.0)
+    return {
+        'budget_seconds': budget,
+        'slowest_import_seconds': slowest,
+        # A module that fails to import can't be shown to meet the budget
+        'within_budget': slowest <= budget and len(measured) == len(results),
+        'modules': results,
+        'deferred': deferred
+    }
+
+
+def print_report(report: Dict):
+    """Print an import budget report as a table"""
+    print(f"Import-time budget: {report['budget_seconds']:.2f}s per module")
+    for title, rows in [('Start-up imports', report['modules']), ('Deferred imports', report['deferred'])]:
+        print(f"\n{title}")
+        for row in sorted(rows, key=lambda item: item.get('seconds', -1), reverse=True):
+            if 'error' in row:
+                print(f"  {row['module']:<32} failed: {row['error']}")
+                continue
+            heaviest = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in row['slowest_dependencies'][:3])
+            print(f"  {row['module']:<32} {row['seconds']:6.2f}s  ({heaviest})")
+
+    failed = sum('error' in row for row in report['modules'])
+    status = 'within budget' if report['within_budget'] else (
+        f'{failed} failed' if failed else 'OVER BUDGET')
+    print(f"\nSlowest start-up import: {report['slowest_import_seconds']:.2f}s ({status})")
+
+
+if __name__ == '__main__':
+    budget_report = import_budget_report()
+    print_report(budget_report)
+    sys.exit(0 if budget_report['within_budget'] else 1)
@@ -0,0 +1,98 @@
+"""
+Market Event Bus publishing new-bar events from the data layer
+"""
+import threading
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+# Subscriber signature: callback(symbol, new_bars)
+BarCallback = Callable[[str, pd.DataFrame], None]
+
+# Columns compared to detect that the latest (still forming) bar has changed
+BAR_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+class MarketEventBus:
+    """Tracks the last bar seen per symbol and notifies subscribers when new or updated bars arrive"""
+
+    def __init__(self):
+        self._subscribers: Dict[Optional[str], List[BarCallback]] = {}
+        self._last_bar = {}
+        self._last_values = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: BarCallback, symbol: Optional[str] = None):
+        """
+        Register a callback for new bars
+
+        Args:
+            callback: Called as callback(symbol, new_bars) from the publishing thread;
+                the first bar may repeat the last published timestamp with updated values
+            symbol: Only receive bars for this symbol (all symbols if None)
+        """
+        key = symbol.upper() if symbol else None
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, callback: BarCallback, symbol: Optional[str] = None):
+        """Remove a previously registered callback"""
+        key = symbol.upper() if symbol else None
+        with self._lock:
+            callbacks = self._subscribers.get(key, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish_bars(self, symbol: str, data: pd.DataFrame) -> int:
+        """
+        Publish the bars of a freshly fetched frame that are newer than any seen before
+
+        The last published bar is republished as an update when its values have
+        changed, e.g. today's daily bar while the session is still trading.
+
+        Args:
+            symbol: Stock ticker symbol
+            data: Time-indexed OHLCV frame
+
+        Returns:
+            Number of new or updated bars published
+        """
+        if data is None or data.empty:
+            return 0
+
+        key = symbol.upper()
+        columns = [column for column in BAR_COLUMNS if column in data.columns]
+        with self._lock:
+            last_bar = self._last_bar.get(key)
+            new_bars = data if last_bar is None else data[data.index >= last_bar]
+            if len(new_bars) and new_bars.index[0] == last_bar and \
+                    self._bar_values(new_bars, columns) == self._last_values.get(key):
+                new_bars = new_bars.iloc[1:]
+            if new_bars.empty:
+                return 0
+            self._last_bar[key] = new_bars.index[-1]
+            self._last_values[key] = self._bar_values(new_bars.iloc[-1:], columns)
+            callbacks = self._subscribers.get(key, []) + self._subscribers.get(None, [])
+
+        # Callbacks run outside the lock so they may (un)subscribe
+        for callback in callbacks:
+            try:
+                callback(key, new_bars)
+            except Exception as e:
+                print(f"Market event subscriber error for {key}: {e}")
+
+        return len(new_bars)
+
+    @staticmethod
+    def _bar_values(bars: pd.DataFrame, columns: List[str]) -> tuple:
+        """Values of the first bar in a frame, comparable across fetches"""
+        return tuple(bars[columns].iloc[0].tolist())
+
+    def last_bar(self, symbol: str):
+        """Timestamp of the newest bar published for a symbol"""
+        with self._lock:
+            return self._last_bar.get(symbol.upper())
+
+
+# Global market event bus shared by the data layer and learning engines
+market_events = MarketEventBus()
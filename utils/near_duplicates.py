@@ -0,0 +1,157 @@
+"""
+Near-Duplicate Detection for syndicated news using MinHash with LSH banding
+"""
+import re
+import zlib
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Mersenne prime modulus for the universal hash family; hashes are always below it,
+# so the prime itself marks the signature of a text without shingles
+_PRIME = np.uint64((1 << 61) - 1)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def shingle_hashes(text: str, k: int = 3) -> np.ndarray:
+    """
+    32-bit hashes of the word k-grams of a text
+
+    Args:
+        text: Article text
+        k: Words per shingle (texts shorter than k form one shingle)
+
+    Returns:
+        Array of unique shingle hashes
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if not tokens:
+        return np.zeros(0, dtype=np.uint64)
+    grams = {' '.join(tokens[i:i + k]) for i in range(max(len(tokens) - k + 1, 1))}
+    return np.fromiter((zlib.crc32(gram.encode()) for gram in grams), dtype=np.uint64, count=len(grams))
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path halving and union by size"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i == root_j:
+            return
+        if self.size[root_i] < self.size[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        self.size[root_i] += self.size[root_j]
+
+
+class NearDuplicateDetector:
+    """Clusters near-identical texts in linear expected time"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.6,
+                 shingle_size: int = 3, seed: int = 42):
+        """
+        Args:
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must divide evenly); more bands catch lower similarity
+            threshold: Minimum estimated Jaccard similarity for two texts to be merged
+            shingle_size: Words per shingle
+            seed: Seed for the hash permutations
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        # a*x + b stays below 2**63 for 32-bit x, so uint64 arithmetic never overflows
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """MinHash signatures, one row per text"""
+        signatures = np.full((len(texts), self.num_perm), _PRIME, dtype=np.uint64)
+        for i, text in enumerate(texts):
+            hashes = shingle_hashes(text, self.shingle_size)
+            if len(hashes):
+                signatures[i] = ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+        return signatures
+
+    def cluster(self, texts: List[str]) -> List[int]:
+        """
+        Assign every text to a cluster of near-duplicates
+
+        Args:
+            texts: Texts to cluster
+
+        Returns:
+            Cluster id per text: the index of the cluster's first text
+        """
+        signatures = self.signatures(texts)
+        union_find = UnionFind(len(texts))
+
+        # Texts sharing any band are candidates; confirm with the signature agreement
+        for band in range(self.bands):
+            columns = slice(band * self.rows, (band + 1) * self.rows)
+            buckets: Dict[bytes, int] = {}
+            for i in range(len(texts)):
+                if signatures[i, 0] == _PRIME:
+                    continue
+                key = signatures[i, columns].tobytes()
+                first = buckets.setdefault(key, i)
+                if first != i and union_find.find(first) != union_find.find(i):
+                    if np.mean(signatures[first] == signatures[i]) >= self.threshold:
+                        union_find.union(first, i)
+
+        roots = [union_find.find(i) for i in range(len(texts))]
+        first_member = {}
+        for i, root in enumerate(roots):
+            first_member.setdefault(root, i)
+        return [first_member[root] for root in roots]
+
+    def deduplicate(self, articles: List[Dict],
+                    text_of: Optional[Callable[[Dict], str]] = None) -> List[Dict]:
+        """
+        Keep the first article of each near-duplicate cluster
+
+        Args:
+            articles: Articles in display order
+            text_of: Text to compare (title + summary if None)
+
+        Returns:
+            Representative articles (copies) with 'cluster_size' and 'duplicate_sources'
+        """
+        if not articles:
+            return []
+
+        text_of = text_of or (lambda article: f"{article.get('title', '')} {article.get('summary', '')}")
+        clusters = self.cluster([text_of(article) for article in articles])
+
+        representatives = {}
+        for article, cluster_id in zip(articles, clusters):
+            if cluster_id not in representatives:
+                representatives[cluster_id] = {**article, 'cluster_size': 0, 'duplicate_sources': []}
+            representative = representatives[cluster_id]
+            representative['cluster_size'] += 1
+            if article is not articles[cluster_id]:
+                representative['duplicate_sources'].append(article.get('source'))
+
+        return list(representatives.values())
+
+
+# Shared detector for news feeds
+near_duplicate_detector = NearDuplicateDetector()
@@ -0,0 +1,342 @@
+"""
+Background News Ingestion Pipeline for watchlist symbols
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from config import config
+from database.models import Base, NewsArticle, NewsMention, SentimentBucket, create_engine_and_session
+from utils.near_duplicates import near_duplicate_detector
+from utils.news_sentiment import NewsSentimentAnalyzer, get_relevance_matcher
+from utils.sentiment_series import SentimentTimeSeries, sentiment_series
+
+
+class NewsStore:
+    """Local table of scored news articles and the symbols they are relevant to"""
+
+    # Attempts per batch when another process stores the same articles concurrently
+    MAX_SAVE_ATTEMPTS = 3
+
+    def __init__(self, series: Optional[SentimentTimeSeries] = None):
+        self.engine, self.SessionLocal = create_engine_and_session()
+        Base.metadata.create_all(bind=self.engine, tables=[NewsArticle.__table__, NewsMention.__table__,
+                                                           SentimentBucket.__table__])
+        self.series = series or sentiment_series
+        self._lock = threading.Lock()
+
+    def existing_articles(self, article_keys: List[str]) -> Dict[str, int]:
+        """Map the already stored article keys to their row ids"""
+        if not article_keys:
+            return {}
+
+        session = self.SessionLocal()
+        try:
+            rows = session.query(NewsArticle.article_key, NewsArticle.id).filter(
+                NewsArticle.article_key.in_(article_keys)
+            ).all()
+            return dict(rows)
+        finally:
+            session.close()
+
+    def save(self, articles: List[Dict], mentions: List[Tuple[str, str, float]]) -> int:
+        """
+        Insert new articles and any article/symbol mentions not stored yet
+
+        Each new mention is also added to the symbol's sentiment buckets in the
+        same transaction, so the aggregates never count an article twice. Other
+        processes (dashboard workers, the learning process) may insert the same
+        articles between the caller's key check and this insert; the batch is then
+        retried without the articles they stored.
+
+        Args:
+            articles: New scored articles (NewsArticle column values)
+            mentions: (article_key, symbol, relevance) triples
+
+        Returns:
+            Number of articles inserted
+        """
+        with self._lock:
+            for attempt in range(self.MAX_SAVE_ATTEMPTS):
+                try:
+                    return self._save_batch(articles, mentions)
+                except IntegrityError:
+                    if attempt == self.MAX_SAVE_ATTEMPTS - 1:
+                        raise
+                    stored = self.existing_articles([article['article_key'] for article in articles])
+                    articles = [article for article in articles if article['article_key'] not in stored]
+
+    def _save_batch(self, articles: List[Dict], mentions: List[Tuple[str, str, float]]) -> int:
+        """Insert one batch in a single transaction, rolling back on any error"""
+        session = self.SessionLocal()
+        try:
+            rows = [NewsArticle(**article) for article in articles]
+            session.add_all(rows)
+            session.flush()
+
+            article_ids = {row.article_key: row.id for row in rows}
+            article_ids.update(dict(session.query(NewsArticle.article_key, NewsArticle.id).filter(
+                NewsArticle.article_key.in_(list({key for key, _, _ in mentions} - set(article_ids)))
+            ).all()))
+            scored = {
+                article_id: (published, score, label)
+                for article_id, published, score, label in session.query(
+                    NewsArticle.id, NewsArticle.published,
+                    NewsArticle.sentiment_score, NewsArticle.sentiment_label
+                ).filter(NewsArticle.id.in_(list(article_ids.values()))).all()
+            }
+
+            new_mentions = []
+            stored_mentions = set(session.query(NewsMention.article_id, NewsMention.symbol).filter(
+                NewsMention.article_id.in_(list(article_ids.values()))
+            ).all())
+            for article_key, symbol, relevance in mentions:
+                article_id = article_ids.get(article_key)
+                if article_id is None or (article_id, symbol) in stored_mentions:
+                    continue
+                published, score, label = scored[article_id]
+                session.add(NewsMention(article_id=article_id, symbol=symbol, relevance=relevance,
+                                        published=published))
+                stored_mentions.add((article_id, symbol))
+                new_mentions.append((symbol, published, score or 0.0, label, relevance))
+
+            self.series.record(session, new_mentions)
+            session.commit()
+            return len(rows)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def get_news(self, symbol: str, limit: int = 15) -> List[Dict]:
+        """
+        Latest stored articles for a symbol, in the format of NewsSentimentAnalyzer.get_stock_news
+
+        Args:
+            symbol: Stock ticker symbol
+            limit: Maximum number of articles
+
+        Returns:
+            List of analyzed news articles, newest first, with syndicated copies
+            collapsed into one article carrying a cluster_size
+        """
+        session = self.SessionLocal()
+        try:
+            rows = session.query(NewsArticle, NewsMention.relevance).join(
+                NewsMention, NewsMention.article_id == NewsArticle.id
+            ).filter(NewsMention.symbol == symbol.upper()).order_by(
+                NewsMention.published.desc()
+            ).limit(limit * 3).all()
+
+            articles = [
+                {
+                    'title': article.title,
+                    'summary': article.summary,
+                    'link': article.link,
+                    'published': article.published.strftime("%Y-%m-%d %H:%M"),
+                    'source': article.source,
+                    'sentiment_score': article.sentiment_score,
+                    'sentiment_label': article.sentiment_label,
+                    'relevance': relevance
+                }
+                for article, relevance in rows
+            ]
+            return near_duplicate_detector.deduplicate(articles)[:limit]
+        finally:
+            session.close()
+
+
+class NewsIngestionPipeline:
+    """Polls news for all watchlist symbols in the background and stores each article once"""
+
+    def __init__(self, symbols: Optional[List[str]] = None, interval: Optional[int] = None,
+                 max_workers: Optional[int] = None, store: Optional[NewsStore] = None,
+                 analyzer: Optional[NewsSentimentAnalyzer] = None, max_extra_symbols: Optional[int] = None,
+                 symbol_idle_seconds: Optional[int] = None):
+        self.symbols = list(dict.fromkeys(symbol.upper() for symbol in (symbols or config.NEWS_WATCHLIST)))
+        self.interval = interval or config.NEWS_REFRESH_INTERVAL
+        self.max_workers = max_workers or config.NEWS_INGESTION_WORKERS
+
+        # Symbols added on demand, least recently requested first; they expire when idle
+        self.extra_symbols = OrderedDict()
+        self.max_extra_symbols = config.NEWS_MAX_EXTRA_SYMBOLS if max_extra_symbols is None else max_extra_symbols
+        self.symbol_idle_seconds = symbol_idle_seconds or config.NEWS_SYMBOL_IDLE_SECONDS
+
+        # Store and analyzer are created on first use so importing this module stays cheap
+        self._store = store
+        self._analyzer = analyzer
+
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.last_run = None
+        self.last_result = {}
+
+    @property
+    def store(self) -> NewsStore:
+        with self._lock:
+            if self._store is None:
+                self._store = NewsStore()
+            return self._store
+
+    @property
+    def analyzer(self) -> NewsSentimentAnalyzer:
+        with self._lock:
+            if self._analyzer is None:
+                self._analyzer = NewsSentimentAnalyzer()
+            return self._analyzer
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_symbol(self, symbol: str) -> bool:
+        """
+        Watch a symbol on demand (e.g. because the dashboard is showing it)
+
+        Requested symbols beyond the configured watchlist expire after
+        symbol_idle_seconds without a request; at max_extra_symbols the least
+        recently requested one is dropped.
+
+        Returns:
+            False if the symbol was already watched
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            if symbol in self.symbols:
+                return False
+
+            is_new = symbol not in self.extra_symbols
+            self.extra_symbols[symbol] = time.monotonic()
+            self.extra_symbols.move_to_end(symbol)
+            while len(self.extra_symbols) > self.max_extra_symbols:
+                self.extra_symbols.popitem(last=False)
+            return is_new
+
+    def watched_symbols(self) -> List[str]:
+        """Configured watchlist plus requested symbols that have not gone idle"""
+        cutoff = time.monotonic() - self.symbol_idle_seconds
+        with self._lock:
+            for symbol in [symbol for symbol, requested in self.extra_symbols.items() if requested < cutoff]:
+                del self.extra_symbols[symbol]
+            return self.symbols + list(self.extra_symbols)
+
+    def start(self):
+        """Start background ingestion (no-op if already running)"""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name='news-ingestion', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop background ingestion after the current cycle"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run_loop(self):
+        """Ingest every interval until stopped"""
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"News ingestion error: {e}")
+            self._stop_event.wait(self.interval)
+
+    def _fetch(self, symbol: str) -> List[Dict]:
+        """Fetch raw news for one symbol, swallowing provider errors"""
+        try:
+            return self.analyzer.fetch_raw_news(symbol)
+        except Exception as e:
+            print(f"Error fetching news for {symbol}: {e}")
+            return []
+
+    def run_once(self) -> Dict:
+        """
+        Run one ingestion cycle over the whole watchlist
+
+        Returns:
+            Counts of fetched, unique and newly stored articles
+        """
+        symbols = self.watched_symbols()
+        if not symbols:
+            return {}
+
+        # Fetch all symbols concurrently (network bound)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols))) as pool:
+            raw_news = dict(zip(symbols, pool.map(self._fetch, symbols)))
+
+        # Deduplicate articles shared across tickers
+        articles, returned_for = {}, {}
+        for symbol, items in raw_news.items():
+            for item in items:
+                parsed = self.analyzer.parse_article(item)
+                if parsed is None or not parsed['article_id']:
+                    continue
+                article_key = parsed['article_id'][:255]
+                articles.setdefault(article_key, parsed)
+                returned_for.setdefault(article_key, set()).add(symbol)
+
+        article_keys = list(articles)
+        known = self.store.existing_articles(article_keys)
+        new_keys = [key for key in article_keys if key not in known]
+
+        # Score each new article once
+        sentiments = self.analyzer.analyze_sentiment_batch([articles[key]['text'] for key in new_keys])
+        new_articles = [
+            {
+                'article_key': key,
+                'title': articles[key]['title'],
+                'summary': articles[key]['summary'],
+                'link': articles[key]['link'],
+                'source': articles[key]['source'],
+                'published': self._parse_published(articles[key]['published']),
+                'sentiment_score': score,
+                'sentiment_label': label
+            }
+            for key, (score, label) in zip(new_keys, sentiments)
+        ]
+
+        # Relevance of every article against the whole watchlist in one pass per text
+        matcher = get_relevance_matcher(tuple(symbols))
+        keyword_counts, symbol_mentions = matcher.match_counts([articles[key]['text'] for key in article_keys])
+        relevance = matcher.relevance_from_counts(keyword_counts, symbol_mentions)
+
+        mentions = [
+            (key, symbol, float(relevance[i, j]))
+            for i, key in enumerate(article_keys)
+            for j, symbol in enumerate(matcher.symbols)
+            if symbol in returned_for[key] or symbol_mentions[i, j] > 0
+        ]
+
+        stored = self.store.save(new_articles, mentions)
+
+        self.last_run = datetime.now()
+        self.last_result = {
+            'symbols': len(symbols),
+            'fetched': sum(len(items) for items in raw_news.values()),
+            'unique_articles': len(article_keys),
+            'new_articles': stored,
+            'mentions': len(mentions)
+        }
+        return self.last_result
+
+    @staticmethod
+    def _parse_published(published: str) -> datetime:
+        """Parse the analyzer's published string (UTC) back into a naive UTC datetime"""
+        try:
+            return datetime.strptime(published, "%Y-%m-%d %H:%M")
+        except (TypeError, ValueError):
+            return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Global news ingestion pipeline (started by the dashboard)
+news_pipeline = NewsIngestionPipeline()
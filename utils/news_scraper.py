@@ -1,20 +1,236 @@
 """
 News scraper fallback for additional news sources
 """
-import requests
-import trafilatura
-from datetime import datetime
-from typing import List, Dict
+import hashlib
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 import re
-from textblob import TextBlob
+from config import config
+from utils.ttl_cache import TTLCache
+
+# requests, trafilatura and textblob are imported where first used to keep module import cheap
+if TYPE_CHECKING:
+    import requests
+
+# Validators (ETag/Last-Modified) and content hash of the last response per URL
+page_cache = TTLCache(timedelta(hours=6), max_size=512)
+
+# Extracted text keyed by SHA-1 of the raw page, so unchanged pages skip trafilatura
+extraction_cache = TTLCache(timedelta(hours=6), max_size=512)
+
+class ExtractionTimeout(Exception):
+    """Raised inside an extraction worker when its CPU budget runs out"""
+
+def _raise_extraction_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+def _extract_with_cpu_limit(html: str, cpu_seconds: float) -> Optional[str]:
+    """
+    Extract the main text of a page, giving up after cpu_seconds of CPU time
+    
+    Runs in an extraction worker process, where it owns the process's profiling
+    timer (ITIMER_PROF counts CPU time, so waiting on I/O does not use the budget).
+    ExtractionTimeout propagates to the caller, so a page without text (None) can
+    be told apart from one that ran out of time.
+    """
+    import trafilatura
+    
+    limited = cpu_seconds > 0 and hasattr(signal, 'setitimer') and hasattr(signal, 'SIGPROF')
+    if limited:
+        signal.signal(signal.SIGPROF, _raise_extraction_timeout)
+        signal.setitimer(signal.ITIMER_PROF, cpu_seconds)
+    try:
+        return trafilatura.extract(html)
+    finally:
+        if limited:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+
+_extraction_pool = None
+_extraction_pool_lock = threading.Lock()
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Shared pool of extraction worker processes (created on first use)"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(max_workers=config.SCRAPER_EXTRACT_WORKERS,
+                                                   mp_context=multiprocessing.get_context('spawn'))
+        return _extraction_pool
+
+def _reset_extraction_pool(terminate: bool = False):
+    """
+    Drop the pool so the next extraction starts fresh workers
+    
+    Args:
+        terminate: Also kill the workers; a running task can't be cancelled, so
+            this is the only way to free a worker stuck past its wall-clock limit
+    """
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is not None:
+            workers = list((getattr(_extraction_pool, '_processes', None) or {}).values())
+            _extraction_pool.shutdown(wait=False, cancel_futures=True)
+            _extraction_pool = None
+            if terminate:
+                for worker in workers:
+                    if worker.is_alive():
+                        worker.terminate()
+
+def build_session(pool_size: int = 10, headers: Optional[Dict] = None) -> 'requests.Session':
+    """
+    Create a keep-alive HTTP session with a connection pool
+    
+    Args:
+        pool_size: Connections kept open per host
+        headers: Default headers for every request
+        
+    Returns:
+        Configured requests session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
 
 class NewsScraperFallback:
     """Fallback news scraper using web scraping"""
     
-    def __init__(self):
+    def __init__(self, session: Optional['requests.Session'] = None, timeout: float = 10,
+                 max_bytes: Optional[int] = None, extract_cpu_seconds: Optional[float] = None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # One pooled session reuses TCP/TLS connections across calls
+        self.session = session or build_session(headers=self.headers)
+        self.timeout = timeout
+        self.max_bytes = max_bytes or config.SCRAPER_MAX_BYTES
+        self.extract_cpu_seconds = (config.SCRAPER_EXTRACT_CPU_SECONDS if extract_cpu_seconds is None
+                                    else extract_cpu_seconds)
+        self.stats = {'requests': 0, 'not_modified': 0, 'extractions': 0, 'extraction_cache_hits': 0,
+                      'truncated': 0, 'extraction_timeouts': 0}
+    
+    def _read_limited(self, response: 'requests.Response') -> Tuple[bytes, bool]:
+        """
+        Read a streamed response body up to the byte budget
+        
+        Returns:
+            Tuple of (body, whether it was cut off at max_bytes)
+        """
+        chunks, size = [], 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                return b''.join(chunks)[:self.max_bytes], True
+        return b''.join(chunks), False
+    
+    def extract_text(self, html: str) -> Optional[str]:
+        """
+        Extract article text in the worker pool within the CPU budget
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            Extracted text, or None if extraction failed or ran out of time
+        """
+        # Wall-clock guard for workers stuck without burning CPU
+        wall_timeout = self.extract_cpu_seconds * 4 + 5
+        future = get_extraction_pool().submit(_extract_with_cpu_limit, html, self.extract_cpu_seconds)
+        try:
+            return future.result(timeout=wall_timeout)
+        except ExtractionTimeout:
+            self.stats['extraction_timeouts'] += 1
+            return None
+        except FutureTimeoutError:
+            print(f"Extraction exceeded {wall_timeout:.0f}s wall-clock time, restarting pool")
+            self.stats['extraction_timeouts'] += 1
+            _reset_extraction_pool(terminate=True)
+            return None
+        except BrokenProcessPool as e:
+            print(f"Extraction pool failed, restarting: {e}")
+            _reset_extraction_pool()
+            return None
+    
+    def fetch_page_text(self, url: str) -> Optional[str]:
+        """
+        Fetch a page and extract its main text, revalidating with the server when possible
+        
+        Sends If-None-Match/If-Modified-Since from the previous response; on 304, or
+        when the body hashes to content already extracted, the cached text is reused.
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            Extracted text, or None if the page could not be fetched or extracted
+        """
+        cached = page_cache.get(url)
+        if cached and cached['content_hash'] not in extraction_cache:
+            # Validators are only useful while the text they vouch for is still cached
+            page_cache.pop(url)
+            cached = None
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        self.stats['requests'] += 1
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304 and cached:
+                text_content = extraction_cache.get(cached['content_hash'])
+                if text_content is not None:
+                    self.stats['not_modified'] += 1
+                    page_cache.set(url, cached)
+                    extraction_cache.set(cached['content_hash'], text_content)
+                    return text_content
+            
+            if response.status_code == 304:
+                # Extraction expired since the check above: refetch without validators
+                page_cache.pop(url)
+                return self.fetch_page_text(url) if cached else None
+            
+            if response.status_code != 200:
+                return None
+            
+            # Stop reading at the byte budget; the extractor copes with truncated HTML
+            body, truncated = self._read_limited(response)
+            encoding = response.encoding or 'utf-8'
+        
+        if truncated:
+            self.stats['truncated'] += 1
+        
+        content_hash = hashlib.sha1(body).hexdigest()
+        page_cache.set(url, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash
+        })
+        
+        if content_hash in extraction_cache:
+            self.stats['extraction_cache_hits'] += 1
+            return extraction_cache.get(content_hash)
+        
+        self.stats['extractions'] += 1
+        text_content = self.extract_text(body.decode(encoding, errors='replace'))
+        # Failed extractions (timeouts, pool restarts) are retried on the next fetch
+        if text_content is not None:
+            extraction_cache.set(content_hash, text_content)
+        return text_content
     
     def get_stock_news_fallback(self, symbol: str, limit: int = 10) -> List[Dict]:
         """
@@ -32,25 +248,21 @@ class NewsScraperFallback:
             url = f"https://finance.yahoo.com/quote/{symbol}/news"
             
             # This is a basic implementation - in production you'd want more robust scraping
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                # Extract text content
-                text_content = trafilatura.extract(response.text)
+            text_content = self.fetch_page_text(url)
+            if text_content:
+                # Create a basic news entry from the scraped content
+                sentiment_score, sentiment_label = self._analyze_sentiment(text_content)
                 
-                if text_content:
-                    # Create a basic news entry from the scraped content
-                    sentiment_score, sentiment_label = self._analyze_sentiment(text_content)
-                    
-                    return [{
-                        'title': f"{symbol} Market News Summary",
-                        'summary': text_content[:200] + "..." if len(text_content) > 200 else text_content,
-                        'link': url,
-                        'published': datetime.now().strftime("%Y-%m-%d %H:%M"),
-                        'source': 'Yahoo Finance',
-                        'sentiment_score': sentiment_score,
-                        'sentiment_label': sentiment_label,
-                        'relevance': 0.8
-                    }]
+                return [{
+                    'title': f"{symbol} Market News Summary",
+                    'summary': text_content[:200] + "..." if len(text_content) > 200 else text_content,
+                    'link': url,
+                    'published': datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    'source': 'Yahoo Finance',
+                    'sentiment_score': sentiment_score,
+                    'sentiment_label': sentiment_label,
+                    'relevance': 0.8
+                }]
             
             return []
             
@@ -69,6 +281,8 @@ class NewsScraperFallback:
             Tuple of (sentiment_score, sentiment_label)
         """
         try:
+            from textblob import TextBlob
+            
             # Clean the text
             cleaned_text = re.sub(r'[^a-zA-Z\s]', '', text)
             
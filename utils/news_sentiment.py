@@ -1,17 +1,107 @@
-import requests
-import yfinance as yf
-from textblob import TextBlob
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pandas as pd
-from typing import List, Dict, Optional
+import numpy as np
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import re
+import hashlib
+from utils.ttl_cache import TTLCache
+from utils.sentiment_scoring import get_sentiment_scorer
+from utils.near_duplicates import near_duplicate_detector
+
+# Module-level caches, shared by every analyzer (and so every Streamlit session) in the process
+news_cache = TTLCache(ttl=timedelta(minutes=30), max_size=256)         # (symbol, limit) -> analyzed news list
+article_cache = TTLCache(ttl=timedelta(hours=24), max_size=5000)       # article id/URL -> analyzed article
+sentiment_cache = TTLCache(ttl=timedelta(hours=24), max_size=20000)    # (scorer, normalized text hash) -> (score, label)
+
+# Fields that depend on the feed an article was fetched in, not on the article itself
+PER_FEED_FIELDS = ('relevance', 'cluster_size', 'duplicate_sources')
+
+# Keywords that make an article relevant to trading decisions
+FINANCIAL_KEYWORDS = [
+    'earnings', 'revenue', 'profit', 'loss', 'growth', 'dividend',
+    'merger', 'acquisition', 'ipo', 'buyback', 'partnership',
+    'contract', 'deal', 'investment', 'expansion', 'lawsuit'
+]
+
+class RelevanceMatcher:
+    """
+    Scores article relevance against many symbols with one precompiled regex
+    
+    Keywords match case-insensitively as whole words, allowing plain inflections
+    ('loss' counts 'losses' but 'ipo' does not count 'ipod'); ticker symbols match
+    as whole upper-case tokens, optionally as $cashtags, which keeps short tickers
+    like 'A' or 'ON' from matching ordinary words.
+    """
+    
+    def __init__(self, symbols: List[str], keywords: Optional[List[str]] = None):
+        self.symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        self.keywords = [keyword.lower() for keyword in (keywords or FINANCIAL_KEYWORDS)]
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        
+        def alternation(terms):
+            return '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+        
+        parts = [rf"\b(?i:(?P<keyword>{alternation(self.keywords)})(?:s|es|ed|ing)?)\b"]
+        if self.symbols:
+            parts.append(rf"(?<![\w.^])(?P<symbol>{alternation(self.symbols)})(?![\w])")
+        self.pattern = re.compile('|'.join(parts))
+    
+    def match_counts(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scan each text once for keywords and symbol mentions
+        
+        Args:
+            texts: Article texts
+            
+        Returns:
+            Tuple of (distinct keywords per text, mentions per text and symbol)
+        """
+        keyword_counts = np.zeros(len(texts))
+        symbol_mentions = np.zeros((len(texts), len(self.symbols)))
+        
+        for i, text in enumerate(texts):
+            keywords_seen = set()
+            for match in self.pattern.finditer(text):
+                keyword = match.group('keyword')
+                if keyword is not None:
+                    keywords_seen.add(keyword.lower())
+                else:
+                    symbol_mentions[i, self.symbol_index[match.group('symbol')]] += 1
+            keyword_counts[i] = len(keywords_seen)
+        
+        return keyword_counts, symbol_mentions
+    
+    def relevance_matrix(self, texts: List[str]) -> np.ndarray:
+        """Relevance score (0-1) of every text for every symbol, shape (len(texts), len(symbols))"""
+        return self.relevance_from_counts(*self.match_counts(texts))
+    
+    @staticmethod
+    def relevance_from_counts(keyword_counts: np.ndarray, symbol_mentions: np.ndarray) -> np.ndarray:
+        """Combine keyword and symbol-mention counts into relevance scores (0-1)"""
+        relevance = np.minimum(1.0, symbol_mentions * 0.3 + keyword_counts[:, np.newaxis] * 0.1)
+        return np.round(relevance, 2)
+
+
+@lru_cache(maxsize=64)
+def get_relevance_matcher(symbols: Tuple[str, ...]) -> RelevanceMatcher:
+    """Compiled matcher for a symbol set, built once per process"""
+    return RelevanceMatcher(list(symbols))
 
 class NewsSentimentAnalyzer:
     """Analyzes news sentiment for stocks using multiple sources"""
     
-    def __init__(self):
-        self.sentiment_cache = {}
-        self.cache_expiry = timedelta(minutes=30)
+    def __init__(self, scorer: str = 'lexicon'):
+        """
+        Args:
+            scorer: Registered sentiment scorer name (see utils.sentiment_scoring)
+        """
+        self.scorer = get_sentiment_scorer(scorer)
+        self.news_cache = news_cache
+        self.article_cache = article_cache
+        self.sentiment_cache = sentiment_cache
+        self.duplicate_detector = near_duplicate_detector
+        self.cache_expiry = timedelta(seconds=news_cache.ttl)
     
     def get_stock_news(self, symbol: str, limit: int = 10) -> List[Dict]:
         """
@@ -24,82 +114,137 @@ class NewsSentimentAnalyzer:
         Returns:
             List of news articles with sentiment analysis
         """
+        cache_key = (symbol.upper(), limit)
+        cached_news = self.news_cache.get(cache_key)
+        if cached_news is not None:
+            return [dict(article) for article in cached_news]
+        
         try:
-            # Get news from Yahoo Finance
-            ticker = yf.Ticker(symbol)
-            news = ticker.news
+            news = self.fetch_raw_news(symbol)
             
             if not news:
                 print(f"No news found for {symbol}")
                 return []
             
-            analyzed_news = []
+            parsed_news = []
             for article in news[:limit]:
                 try:
-                    # Extract data from the new Yahoo Finance API structure
-                    content = article.get('content', article)
-                    
-                    title = content.get('title', '')
-                    summary = content.get('summary', content.get('description', ''))
-                    
-                    # Skip if both title and summary are empty
-                    if not title and not summary:
-                        continue
-                    
-                    # Get link from various possible locations
-                    link = ''
-                    if 'canonicalUrl' in content:
-                        link = content['canonicalUrl'].get('url', '')
-                    elif 'clickThroughUrl' in content:
-                        link = content['clickThroughUrl'].get('url', '')
-                    elif 'link' in article:
-                        link = article['link']
-                    
-                    # Get source
-                    source = 'Yahoo Finance'
-                    if 'provider' in content:
-                        source = content['provider'].get('displayName', source)
-                    elif 'publisher' in article:
-                        source = article['publisher']
-                    
-                    # Get publish date
-                    published = datetime.now().strftime("%Y-%m-%d %H:%M")
-                    if 'pubDate' in content:
-                        try:
-                            pub_date = datetime.fromisoformat(content['pubDate'].replace('Z', '+00:00'))
-                            published = pub_date.strftime("%Y-%m-%d %H:%M")
-                        except:
-                            pass
-                    elif 'providerPublishTime' in article:
-                        published = self._format_timestamp(article['providerPublishTime'])
-                    
-                    # Combine title and summary for sentiment analysis
-                    text_for_analysis = f"{title} {summary}"
-                    
-                    # Perform sentiment analysis
-                    sentiment_score, sentiment_label = self._analyze_sentiment(text_for_analysis)
-                    
+                    parsed = self.parse_article(article)
+                    if parsed is not None:
+                        parsed_news.append(parsed)
+                except Exception as e:
+                    print(f"Error processing article: {e}")
+                    continue
+            
+            # Syndicated copies of a story collapse into one representative
+            parsed_news = self.duplicate_detector.deduplicate(parsed_news, text_of=lambda item: item['text'])
+            
+            analyzed_news = []
+            unscored = []  # (article_id, analyzed article, text) scored together after the loop
+            for parsed in parsed_news:
+                article_id, text_for_analysis = parsed.pop('article_id'), parsed.pop('text')
+                
+                # Articles already analyzed (e.g. for another symbol) are reused as-is
+                cached_article = self.article_cache.get(article_id) if article_id else None
+                if cached_article is not None:
                     analyzed_news.append({
-                        'title': title,
-                        'summary': summary,
-                        'link': link,
-                        'published': published,
-                        'source': source,
-                        'sentiment_score': sentiment_score,
-                        'sentiment_label': sentiment_label,
+                        **cached_article,
+                        'cluster_size': parsed['cluster_size'],
+                        'duplicate_sources': parsed['duplicate_sources'],
                         'relevance': self._calculate_relevance(text_for_analysis, symbol)
                     })
-                    
-                except Exception as e:
-                    print(f"Error processing article: {e}")
                     continue
+                
+                unscored.append((article_id, parsed, text_for_analysis))
+                
+                analyzed_news.append(parsed)
+                parsed['relevance'] = self._calculate_relevance(text_for_analysis, symbol)
+            
+            # Perform sentiment analysis for all new articles in one batch
+            sentiments = self.analyze_sentiment_batch([text for _, _, text in unscored])
+            for (article_id, analyzed_article, _), (sentiment_score, sentiment_label) in zip(unscored, sentiments):
+                analyzed_article['sentiment_score'] = sentiment_score
+                analyzed_article['sentiment_label'] = sentiment_label
+                if article_id:
+                    self.article_cache.set(article_id, {
+                        key: value for key, value in analyzed_article.items() if key not in PER_FEED_FIELDS
+                    })
             
-            return analyzed_news
+            self.news_cache.set(cache_key, analyzed_news)
+            return [dict(article) for article in analyzed_news]
             
         except Exception as e:
             print(f"Error fetching news for {symbol}: {e}")
             return []
     
+    def fetch_raw_news(self, symbol: str) -> List[Dict]:
+        """Raw news items for a symbol from Yahoo Finance"""
+        import yfinance as yf
+        ticker = yf.Ticker(symbol)
+        return ticker.news or []
+    
+    def parse_article(self, article: Dict) -> Optional[Dict]:
+        """
+        Extract the displayed fields from a raw Yahoo Finance news item
+        
+        Args:
+            article: Raw news item
+            
+        Returns:
+            Dictionary with title, summary, link, published, source, plus the
+            'article_id' used for deduplication and the 'text' to analyze;
+            None if the item has no title or summary
+        """
+        # Extract data from the new Yahoo Finance API structure
+        content = article.get('content', article)
+        
+        title = content.get('title', '')
+        summary = content.get('summary', content.get('description', ''))
+        
+        # Skip if both title and summary are empty
+        if not title and not summary:
+            return None
+        
+        # Get link from various possible locations
+        link = ''
+        if 'canonicalUrl' in content:
+            link = content['canonicalUrl'].get('url', '')
+        elif 'clickThroughUrl' in content:
+            link = content['clickThroughUrl'].get('url', '')
+        elif 'link' in article:
+            link = article['link']
+        
+        # Get source
+        source = 'Yahoo Finance'
+        if 'provider' in content:
+            source = content['provider'].get('displayName', source)
+        elif 'publisher' in article:
+            source = article['publisher']
+        
+        # Get publish date (always UTC, so sentiment buckets line up with bar times)
+        published = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+        if 'pubDate' in content:
+            try:
+                pub_date = datetime.fromisoformat(content['pubDate'].replace('Z', '+00:00'))
+                if pub_date.tzinfo is not None:
+                    pub_date = pub_date.astimezone(timezone.utc)
+                published = pub_date.strftime("%Y-%m-%d %H:%M")
+            except:
+                pass
+        elif 'providerPublishTime' in article:
+            published = self._format_timestamp(article['providerPublishTime'])
+        
+        return {
+            'title': title,
+            'summary': summary,
+            'link': link,
+            'published': published,
+            'source': source,
+            'article_id': content.get('id') or article.get('uuid') or link,
+            # Combine title and summary for sentiment analysis
+            'text': f"{title} {summary}"
+        }
+    
     def _analyze_sentiment(self, text: str) -> tuple:
         """
         Analyze sentiment of given text
@@ -110,27 +255,42 @@ class NewsSentimentAnalyzer:
         Returns:
             Tuple of (sentiment_score, sentiment_label)
         """
-        try:
-            # Clean the text
-            cleaned_text = re.sub(r'[^a-zA-Z\s]', '', text)
-            
-            # Use TextBlob for sentiment analysis
-            blob = TextBlob(cleaned_text)
-            polarity = blob.sentiment.polarity
-            
-            # Convert polarity to label
-            if polarity > 0.1:
-                label = "Positive"
-            elif polarity < -0.1:
-                label = "Negative"
-            else:
-                label = "Neutral"
-            
-            return round(polarity, 3), label
+        return self.analyze_sentiment_batch([text])[0]
+    
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[tuple]:
+        """
+        Analyze sentiment of many texts with one scorer call
+        
+        Args:
+            texts: Texts to analyze
             
+        Returns:
+            List of (sentiment_score, sentiment_label) tuples in input order
+        """
+        # Identical text (e.g. a headline syndicated by several sources) is scored once
+        keys = [
+            (self.scorer.name, hashlib.sha1(' '.join(text.lower().split()).encode()).hexdigest())
+            for text in texts
+        ]
+        results = [self.sentiment_cache.get(key) for key in keys]
+        
+        missing = {}
+        for i, (key, result) in enumerate(zip(keys, results)):
+            if result is None:
+                missing.setdefault(key, i)
+        if not missing:
+            return results
+        
+        try:
+            scores, labels = self.scorer.score_batch([texts[i] for i in missing.values()])
+            scored = {key: (float(score), str(label)) for key, score, label in zip(missing, scores, labels)}
         except Exception as e:
             print(f"Error analyzing sentiment: {e}")
-            return 0.0, "Neutral"
+            return [result or (0.0, "Neutral") for result in results]
+        
+        for key, result in scored.items():
+            self.sentiment_cache.set(key, result)
+        return [result or scored[key] for key, result in zip(keys, results)]
     
     def _calculate_relevance(self, text: str, symbol: str) -> float:
         """
@@ -144,29 +304,24 @@ class NewsSentimentAnalyzer:
             Relevance score (0-1)
         """
         try:
-            text_lower = text.lower()
-            symbol_lower = symbol.lower()
-            
-            # Count mentions of symbol
-            symbol_mentions = text_lower.count(symbol_lower)
-            
-            # Look for financial keywords
-            financial_keywords = [
-                'earnings', 'revenue', 'profit', 'loss', 'growth', 'dividend',
-                'merger', 'acquisition', 'ipo', 'buyback', 'partnership',
-                'contract', 'deal', 'investment', 'expansion', 'lawsuit'
-            ]
-            
-            keyword_score = sum(1 for keyword in financial_keywords if keyword in text_lower)
-            
-            # Calculate relevance score
-            relevance = min(1.0, (symbol_mentions * 0.3 + keyword_score * 0.1))
-            
-            return round(relevance, 2)
-            
+            return float(get_relevance_matcher((symbol.upper(),)).relevance_matrix([text])[0, 0])
         except Exception:
             return 0.5  # Default relevance
     
+    def calculate_relevance_matrix(self, texts: List[str], symbols: List[str]) -> pd.DataFrame:
+        """
+        Relevance of many articles to a whole watchlist in one pass over each text
+        
+        Args:
+            texts: Article texts
+            symbols: Stock symbols
+            
+        Returns:
+            DataFrame of relevance scores (0-1), one row per text and one column per symbol
+        """
+        matcher = get_relevance_matcher(tuple(symbol.upper() for symbol in symbols))
+        return pd.DataFrame(matcher.relevance_matrix(texts), columns=matcher.symbols)
+    
     def _format_timestamp(self, timestamp: int) -> str:
         """
         Format timestamp to readable string
@@ -175,11 +330,11 @@ class NewsSentimentAnalyzer:
             timestamp: Unix timestamp
             
         Returns:
-            Formatted date string
+            Formatted UTC date string
         """
         try:
             if timestamp:
-                dt = datetime.fromtimestamp(timestamp)
+                dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                 return dt.strftime("%Y-%m-%d %H:%M")
             return "Unknown"
         except Exception:
@@ -190,7 +345,8 @@ class NewsSentimentAnalyzer:
         Calculate overall sentiment from news list
         
         Args:
-            news_list: List of analyzed news articles
+            news_list: List of analyzed news articles (deduplicated articles
+                carry a 'cluster_size' weight)
             
         Returns:
             Dictionary with overall sentiment metrics
@@ -202,13 +358,19 @@ class NewsSentimentAnalyzer:
                 'positive_count': 0,
                 'negative_count': 0,
                 'neutral_count': 0,
-                'total_articles': 0
+                'total_articles': 0,
+                'syndicated_copies': 0
             }
         
-        scores = [article['sentiment_score'] for article in news_list]
+        scores = np.array([article['sentiment_score'] for article in news_list], dtype=np.float64)
         labels = [article['sentiment_label'] for article in news_list]
         
-        overall_score = sum(scores) / len(scores)
+        # A story carried by several providers counts more, but sub-linearly so that
+        # syndication alone cannot dominate the overall score
+        cluster_sizes = np.array([article.get('cluster_size', 1) for article in news_list], dtype=np.float64)
+        weights = 1.0 + np.log(cluster_sizes)
+        
+        overall_score = float(np.dot(scores, weights) / weights.sum())
         
         if overall_score > 0.1:
             overall_label = "Positive"
@@ -223,7 +385,8 @@ class NewsSentimentAnalyzer:
             'positive_count': labels.count('Positive'),
             'negative_count': labels.count('Negative'),
             'neutral_count': labels.count('Neutral'),
-            'total_articles': len(news_list)
+            'total_articles': len(news_list),
+            'syndicated_copies': int((cluster_sizes - 1).sum())
         }
     
     def get_sentiment_impact_on_price(self, sentiment_score: float) -> Dict:
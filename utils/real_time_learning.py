@@ -6,73 +6,326 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import json
+import queue
 import threading
 import time
+import multiprocessing
+from config import config
 from utils.enhanced_backtesting import EnhancedBacktestingEngine
+from utils.data_fetcher import StockDataFetcher
+from utils.market_events import MarketEventBus, market_events
+from utils.sentiment_series import sentiment_series
 from ml.adaptive_strategy import AdaptiveStrategyEngine
 
+def _learning_process_main(jobs, results):
+    """Learning process entry point: run adaptation jobs and publish models to the registry"""
+    engines = {}
+    
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        
+        symbol = job['symbol']
+        try:
+            if symbol not in engines:
+                engines[symbol] = RealTimeLearningEngine()
+            engine = engines[symbol]
+            adaptation_event = engine._perform_adaptation(symbol, job['data'], trigger=job['trigger'])
+            version = engine.adaptive_engine.publish_models(symbol, {'trigger': job['trigger']})
+            results.put({
+                'symbol': symbol,
+                'status': 'success',
+                'adaptation_event': adaptation_event,
+                'registry_key': engine.adaptive_engine.registry_key,
+                'model_version': version
+            })
+        except Exception as e:
+            results.put({'symbol': symbol, 'status': 'error', 'message': str(e)})
+
+
+class LearningProcess:
+    """
+    Separate process that runs adaptation and training jobs
+    
+    Training never competes with the UI process for the GIL. Jobs go in over a
+    bounded queue; updated models come back through the model registry, and
+    only a small result message is returned per job.
+    """
+    
+    def __init__(self, max_pending: int = 8):
+        self.max_pending = max_pending
+        self._context = multiprocessing.get_context('spawn')
+        self._jobs = None
+        self._results = None
+        self._process = None
+        self._undelivered = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+    
+    def start(self):
+        """Start the learning process if it is not running"""
+        if self.is_alive:
+            return
+        
+        self._jobs = self._context.Queue(maxsize=self.max_pending)
+        self._results = self._context.Queue()
+        self._process = self._context.Process(
+            target=_learning_process_main, args=(self._jobs, self._results),
+            name='learning-process', daemon=True
+        )
+        self._process.start()
+    
+    def stop(self, timeout: float = 10.0):
+        """Ask the learning process to exit after its current job, terminating it on timeout"""
+        if self._process is None:
+            return
+        
+        try:
+            self._jobs.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+    
+    def submit(self, symbol: str, data: pd.DataFrame, trigger: str) -> bool:
+        """
+        Queue an adaptation job without blocking
+        
+        Args:
+            symbol: Stock ticker symbol
+            data: Learning window with technical indicators
+            trigger: Reason for the adaptation
+            
+        Returns:
+            False when the job queue is full (the caller should retry later)
+        """
+        if not self.is_alive:
+            self.start()
+        
+        try:
+            self._jobs.put_nowait({'symbol': symbol, 'data': data, 'trigger': trigger})
+            return True
+        except queue.Full:
+            return False
+    
+    def poll_results(self, symbol: str) -> List[Dict]:
+        """Collect finished job results for a symbol without blocking"""
+        with self._lock:
+            while self._results is not None:
+                try:
+                    result = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                self._undelivered.setdefault(result['symbol'], []).append(result)
+            
+            return self._undelivered.pop(symbol, [])
+
+
 class RealTimeLearningEngine:
     """Continuous learning system that adapts strategies in real-time"""
     
-    def __init__(self):
+    def __init__(self, event_bus: Optional[MarketEventBus] = None, process_isolated: bool = False,
+                 learning_process: Optional[LearningProcess] = None):
         self.adaptive_engine = AdaptiveStrategyEngine()
         self.performance_history = []
         self.learning_sessions = []
         self.is_learning = False
         self.last_adaptation = datetime.now()
-        self.adaptation_interval = timedelta(minutes=30)  # Adapt every 30 minutes
+        self.adaptation_interval = timedelta(minutes=30)  # Adapt at least this often while bars arrive
+        
+        # Adaptation triggers evaluated on every new-bar event
+        self.bar_threshold = 5            # New bars since the last adaptation
+        self.price_move_threshold = 0.02  # Absolute close-to-close move since the last adaptation
+        self.max_history = 500            # Bars kept in the rolling learning window
+        
+        self.event_bus = event_bus if event_bus is not None else market_events
+        self.data_fetcher = StockDataFetcher()
+        self._events = queue.Queue()
+        self._stop_event = threading.Event()
+        self._symbol = None
+        self._data = None
+        self._bars_since_adaptation = 0
+        self._adaptation_price = None
+        self.learning_thread = None
+        
+        # Optionally run adaptation in a separate process and only load its published models here
+        self._owns_process = learning_process is None and process_isolated
+        self.learning_process = learning_process or (LearningProcess() if process_isolated else None)
         
     def start_continuous_learning(self, symbol: str, data: pd.DataFrame):
-        """Start background continuous learning process"""
+        """Start background continuous learning process driven by new-bar events"""
         if self.is_learning:
             return "Learning already in progress"
         
         self.is_learning = True
+        self.initialize_window(symbol, data)
+        self._stop_event.clear()
+        self._events = queue.Queue()
+        
+        if self._owns_process:
+            self.learning_process.start()
+        
+        self.event_bus.subscribe(self._on_new_bars, self._symbol)
         self.learning_thread = threading.Thread(
             target=self._continuous_learning_loop,
-            args=(symbol, data),
+            args=(self._symbol,),
             daemon=True
         )
         self.learning_thread.start()
         
         return "Continuous learning started"
     
-    def stop_continuous_learning(self):
-        """Stop the continuous learning process"""
+    def stop_continuous_learning(self, timeout: float = 5.0):
+        """Stop the continuous learning process immediately"""
+        if self._symbol:
+            self.event_bus.unsubscribe(self._on_new_bars, self._symbol)
+        
         self.is_learning = False
+        self._stop_event.set()
+        self._events.put(None)  # Wake the worker if it is waiting for bars
+        
+        if self.learning_thread is not None and self.learning_thread is not threading.current_thread():
+            self.learning_thread.join(timeout)
+        if self._owns_process:
+            self.learning_process.stop(timeout)
         return "Continuous learning stopped"
     
-    def _continuous_learning_loop(self, symbol: str, data: pd.DataFrame):
-        """Main continuous learning loop"""
-        while self.is_learning:
+    def initialize_window(self, symbol: str, data: pd.DataFrame):
+        """Set the symbol and starting data window that new bars are appended to"""
+        self._symbol = symbol.upper()
+        self._data = data.tail(self.max_history).copy()
+        self._bars_since_adaptation = 0
+        self._adaptation_price = float(data['Close'].iloc[-1]) if len(data) else None
+    
+    def process_bars(self, new_bars: pd.DataFrame) -> Optional[Dict]:
+        """
+        Ingest new bars and adapt if a trigger threshold is crossed
+        
+        Args:
+            new_bars: Bars newer than the current learning window (or an update of its last bar)
+            
+        Returns:
+            The adaptation event, or None if no adaptation happened
+        """
+        self._ingest_bars(new_bars)
+        if self.learning_process is not None:
+            self.collect_process_results()
+        
+        trigger = self._adaptation_trigger()
+        if not trigger:
+            return None
+        
+        if self.learning_process is not None:
+            # Hand the job to the learning process; a full queue retries on the next bar
+            if self.learning_process.submit(self._symbol, self._data.copy(), trigger):
+                self._mark_adapted()
+            return None
+        
+        adaptation_event = self._perform_adaptation(self._symbol, self._data, trigger=trigger)
+        self._mark_adapted()
+        return adaptation_event
+    
+    def collect_process_results(self) -> int:
+        """Record finished learning-process jobs and load the newest published models"""
+        if self.learning_process is None or not self._symbol:
+            return 0
+        
+        results = self.learning_process.poll_results(self._symbol)
+        for result in results:
+            if result['status'] != 'success':
+                print(f"Learning process error for {self._symbol}: {result.get('message')}")
+            elif result.get('adaptation_event'):
+                self.learning_sessions.append(result['adaptation_event'])
+        
+        if any(result['status'] == 'success' for result in results):
+            self.adaptive_engine.refresh_models(self._symbol)
+        return len(results)
+    
+    def _on_new_bars(self, symbol: str, new_bars: pd.DataFrame):
+        """Event bus callback: hand new bars to the learning thread"""
+        if not self._stop_event.is_set():
+            self._events.put(new_bars.copy())
+    
+    def _continuous_learning_loop(self, symbol: str):
+        """Main continuous learning loop: sleeps until new bars arrive or learning stops"""
+        while not self._stop_event.is_set():
+            new_bars = self._events.get()
+            if new_bars is None or self._stop_event.is_set():
+                break
+            
             try:
-                # Check if it's time for adaptation
-                if datetime.now() - self.last_adaptation >= self.adaptation_interval:
-                    self._perform_adaptation(symbol, data)
-                    self.last_adaptation = datetime.now()
-                
-                # Sleep for 1 minute before next check
-                time.sleep(60)
+                self.process_bars(new_bars)
                 
             except Exception as e:
                 print(f"Continuous learning error: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
+                # Back off before handling further bars, but wake immediately on stop
+                self._stop_event.wait(300)
+    
+    def _ingest_bars(self, new_bars: pd.DataFrame):
+        """Append unseen bars (replacing an updated latest bar) and refresh the window's indicators"""
+        new_bars = new_bars[new_bars.index >= self._data.index[-1]] if len(self._data) else new_bars
+        if new_bars.empty:
+            return
+        
+        raw_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        existing = self._data[raw_columns]
+        updated = existing.index.isin(new_bars.index)
+        combined = pd.concat([existing[~updated], new_bars[raw_columns]]).tail(self.max_history)
+        self._data = self.data_fetcher.calculate_technical_indicators(combined.copy())
+        self._bars_since_adaptation += len(new_bars) - int(updated.sum())
     
-    def _perform_adaptation(self, symbol: str, data: pd.DataFrame):
+    def _adaptation_trigger(self) -> Optional[str]:
+        """Name of the threshold crossed by the bars seen since the last adaptation, if any"""
+        if self._bars_since_adaptation == 0:
+            return None
+        
+        if self._bars_since_adaptation >= self.bar_threshold:
+            return 'New Bar Threshold'
+        
+        if self._adaptation_price:
+            price_move = abs(float(self._data['Close'].iloc[-1]) / self._adaptation_price - 1)
+            if price_move >= self.price_move_threshold:
+                return 'Price Move Threshold'
+        
+        if datetime.now() - self.last_adaptation >= self.adaptation_interval:
+            return 'Adaptation Interval Elapsed'
+        
+        return None
+    
+    def _mark_adapted(self):
+        """Reset trigger counters after an adaptation"""
+        self.last_adaptation = datetime.now()
+        self._bars_since_adaptation = 0
+        self._adaptation_price = float(self._data['Close'].iloc[-1])
+    
+    def _perform_adaptation(self, symbol: str, data: pd.DataFrame,
+                            trigger: str = 'Real-time Performance Decline'):
         """Perform real-time strategy adaptation"""
         try:
+            # Join stored news sentiment so the models see the same features as in backtests
+            try:
+                data = sentiment_series.add_sentiment_features(data, symbol)
+            except Exception as e:
+                print(f"Sentiment features unavailable for {symbol}: {e}")
+            
             # Get latest market data
             latest_data = data.tail(100)  # Last 100 data points
             
-            # Generate signals with current strategy
-            current_signals = []
-            for i in range(20, len(latest_data)):
-                historical_slice = latest_data.iloc[:i+1]
-                signal = self.adaptive_engine.generate_adaptive_signals(historical_slice)
-                current_signals.append(signal)
+            # Reuse a registry model instead of predicting with untrained models
+            if not self.adaptive_engine.is_trained and not self.adaptive_engine.load_latest_models(symbol):
+                self.adaptive_engine.train_models(data, symbol=symbol)
+            
+            # Score bars 20..end with one prediction call per model
+            current_signals = self.adaptive_engine.generate_adaptive_signals_batch(latest_data, start=20, symbol=symbol)
             
             # Evaluate recent performance
-            recent_performance = self._evaluate_recent_performance(current_signals, latest_data)
+            recent_performance = self._evaluate_recent_performance(current_signals, latest_data, start=20)
             
             # Adapt strategy if performance is declining
             if recent_performance['needs_adaptation']:
@@ -82,7 +335,7 @@ class RealTimeLearningEngine:
                 adaptation_event = {
                     'timestamp': datetime.now().isoformat(),
                     'symbol': symbol,
-                    'trigger': 'Real-time Performance Decline',
+                    'trigger': trigger,
                     'adaptations': adaptation_result.get('adaptations', []),
                     'new_weights': adaptation_result.get('new_weights', {}),
                     'performance_metrics': recent_performance['metrics']
@@ -92,7 +345,7 @@ class RealTimeLearningEngine:
                 
                 # Retrain models if significant adaptation occurred
                 if len(adaptation_result.get('adaptations', [])) > 2:
-                    self.adaptive_engine.retrain_if_needed(latest_data)
+                    self.adaptive_engine.retrain_if_needed(latest_data, symbol=symbol)
                 
                 return adaptation_event
             
@@ -100,23 +353,25 @@ class RealTimeLearningEngine:
             print(f"Adaptation error: {e}")
             return None
     
-    def _evaluate_recent_performance(self, signals: List[Dict], data: pd.DataFrame) -> Dict:
-        """Evaluate recent trading performance"""
+    def _evaluate_recent_performance(self, signals: Dict, data: pd.DataFrame, start: int = 20) -> Dict:
+        """Evaluate recent trading performance from batch signals (row i is the bar at start + i)"""
+        
+        actions = signals['signal']
+        prices = data['Close'].to_numpy(dtype=np.float64)[start:start + len(actions)]
         
         # Simulate trades based on recent signals
-        portfolio_value = 10000
         cash = 10000
         shares = 0
         trades = []
         
-        for i, signal in enumerate(signals):
-            if i + 20 >= len(data):
-                break
-                
-            current_price = data.iloc[i + 20]['Close']
+        # Only bars with a BUY/SELL signal can change the position
+        for i in np.flatnonzero(actions[:len(prices)] != 'HOLD'):
+            i = int(i)
+            current_price = prices[i]
+            signal = actions[i]
             
             # Simple trading logic
-            if signal.get('signal') == 'BUY' and cash > current_price:
+            if signal == 'BUY' and cash > current_price:
                 shares_to_buy = min(100, cash // current_price)
                 if shares_to_buy > 0:
                     cash -= shares_to_buy * current_price
@@ -128,7 +383,7 @@ class RealTimeLearningEngine:
                         'timestamp': i
                     })
             
-            elif signal.get('signal') == 'SELL' and shares > 0:
+            elif signal == 'SELL' and shares > 0:
                 shares_to_sell = min(shares, 50)
                 cash += shares_to_sell * current_price
                 shares -= shares_to_sell
@@ -163,11 +418,16 @@ class RealTimeLearningEngine:
     
     def get_learning_status(self) -> Dict:
         """Get current learning status and statistics"""
+        self.collect_process_results()
         return {
             'is_learning': self.is_learning,
+            'symbol': self._symbol,
             'last_adaptation': self.last_adaptation.isoformat() if self.last_adaptation else None,
             'total_adaptations': len(self.learning_sessions),
-            'next_adaptation_in': str(self.adaptation_interval - (datetime.now() - self.last_adaptation)),
+            'bars_since_adaptation': self._bars_since_adaptation,
+            'pending_events': self._events.qsize(),
+            'process_isolated': self.learning_process is not None,
+            'next_adaptation_in': str(max(timedelta(0), self.adaptation_interval - (datetime.now() - self.last_adaptation))),
             'recent_sessions': self.learning_sessions[-5:] if self.learning_sessions else []
         }
     
@@ -185,5 +445,260 @@ class RealTimeLearningEngine:
         self.performance_history = []
         return "Learning history reset"
 
+
+class SymbolLearningState:
+    """Per-symbol learning engine plus the bars waiting to be processed"""
+    
+    def __init__(self, symbol: str, engine: RealTimeLearningEngine):
+        self.symbol = symbol
+        self.engine = engine
+        self.pending_bars = []
+        self.scheduled = False
+        self.jobs_completed = 0
+        self.last_error = None
+
+
+class LearningWorkerPool:
+    """
+    Continuous learning for many symbols on a fixed set of worker threads
+    
+    New-bar events are buffered per symbol and at most one adaptation job per
+    symbol is queued or running, so bursts of bars coalesce into a single job.
+    The job queue is bounded: when it is full, new-bar events never wait (they run
+    on the publisher's thread) and the symbol is deferred until a worker frees a
+    slot; explicit submit calls wait up to submit_timeout first.
+    """
+    
+    def __init__(self, max_workers: int = 4, max_queue: int = 32, submit_timeout: float = 0.5,
+                 event_bus: Optional[MarketEventBus] = None, process_isolated: bool = False):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.submit_timeout = submit_timeout
+        self.event_bus = event_bus if event_bus is not None else market_events
+        
+        # Shared learning process: workers only hand jobs over and load published models
+        self.learning_process = LearningProcess(max_pending=max_queue) if process_isolated else None
+        
+        self._states: Dict[str, SymbolLearningState] = {}
+        self._deferred = []
+        self._jobs = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._workers = []
+        self.rejected_jobs = 0
+        self.is_running = False
+    
+    def start(self):
+        """Start the worker threads and listen for new bars"""
+        if self.is_running:
+            return "Worker pool already running"
+        
+        self.is_running = True
+        if self.learning_process is not None:
+            self.learning_process.start()
+        self.event_bus.subscribe(self._on_new_bars)
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"learning-worker-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        
+        return f"Worker pool started with {self.max_workers} workers"
+    
+    def stop(self, timeout: float = 5.0):
+        """Stop listening, drop queued jobs and shut the workers down"""
+        self.event_bus.unsubscribe(self._on_new_bars)
+        self.is_running = False
+        
+        with self._lock:
+            self._deferred = []
+            for state in self._states.values():
+                state.pending_bars = []
+                state.scheduled = False
+        
+        while True:
+            try:
+                self._jobs.get_nowait()
+                self._jobs.task_done()
+            except queue.Empty:
+                break
+        
+        for _ in self._workers:
+            self._jobs.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+        
+        if self.learning_process is not None:
+            self.learning_process.stop(timeout)
+        
+        return "Worker pool stopped"
+    
+    def add_symbol(self, symbol: str, data: pd.DataFrame) -> str:
+        """Start continuous learning for a symbol from its current data window"""
+        symbol = symbol.upper()
+        
+        with self._lock:
+            if symbol in self._states:
+                return f"{symbol} is already learning"
+            
+            engine = RealTimeLearningEngine(event_bus=self.event_bus, learning_process=self.learning_process)
+            engine.initialize_window(symbol, data)
+            engine.is_learning = True
+            self._states[symbol] = SymbolLearningState(symbol, engine)
+        
+        return f"Continuous learning started for {symbol}"
+    
+    def remove_symbol(self, symbol: str) -> str:
+        """Stop learning for a symbol (a job already running for it completes)"""
+        symbol = symbol.upper()
+        
+        with self._lock:
+            state = self._states.pop(symbol, None)
+            if symbol in self._deferred:
+                self._deferred.remove(symbol)
+        
+        if state is None:
+            return f"{symbol} is not learning"
+        
+        state.engine.is_learning = False
+        return f"Continuous learning stopped for {symbol}"
+    
+    @property
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return list(self._states)
+    
+    def engine_for(self, symbol: str) -> Optional[RealTimeLearningEngine]:
+        """Learning engine holding the state of one symbol"""
+        state = self._states.get(symbol.upper())
+        return state.engine if state else None
+    
+    def _on_new_bars(self, symbol: str, new_bars: pd.DataFrame):
+        """Event bus callback: buffer bars and schedule an adaptation job for the symbol"""
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None or not self.is_running:
+                return
+            state.pending_bars.append(new_bars.copy())
+        
+        # Runs on the publisher's (request) thread: never block on a full queue
+        self._schedule(symbol)
+    
+    def submit(self, symbol: str) -> bool:
+        """
+        Schedule an adaptation pass for a symbol, waiting up to submit_timeout for queue room
+        
+        Args:
+            symbol: Stock ticker symbol already added to the pool
+            
+        Returns:
+            False if the queue stayed full and the symbol was deferred
+        """
+        return self._schedule(symbol.upper(), timeout=self.submit_timeout)
+    
+    def _schedule(self, symbol: str, timeout: Optional[float] = None) -> bool:
+        """Queue a job for a symbol unless one is already queued or running"""
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None or state.scheduled:
+                return True
+            state.scheduled = True
+        
+        try:
+            if timeout:
+                self._jobs.put(symbol, timeout=timeout)
+            else:
+                self._jobs.put_nowait(symbol)
+            return True
+        except queue.Full:
+            with self._lock:
+                state.scheduled = False
+                if symbol not in self._deferred:
+                    self._deferred.append(symbol)
+                self.rejected_jobs += 1
+            return False
+    
+    def _schedule_deferred(self):
+        """Move deferred symbols into the queue while there is room"""
+        while True:
+            with self._lock:
+                if not self._deferred or self._jobs.full():
+                    return
+                symbol = self._deferred.pop(0)
+            if not self._schedule(symbol):
+                return
+    
+    def _worker_loop(self):
+        """Worker thread: run adaptation jobs until a stop sentinel arrives"""
+        while True:
+            symbol = self._jobs.get()
+            try:
+                if symbol is None:
+                    break
+                self._run_job(symbol)
+            except Exception as e:
+                print(f"Learning worker error for {symbol}: {e}")
+            finally:
+                self._jobs.task_done()
+            
+            self._schedule_deferred()
+    
+    def _run_job(self, symbol: str):
+        """Process every bar buffered for a symbol in one adaptation pass"""
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None:
+                return
+            pending_bars, state.pending_bars = state.pending_bars, []
+        
+        try:
+            if pending_bars:
+                new_bars = pd.concat(pending_bars)
+                new_bars = new_bars[~new_bars.index.duplicated(keep='last')].sort_index()
+                state.engine.process_bars(new_bars)
+            state.last_error = None
+        except Exception as e:
+            state.last_error = str(e)
+            raise
+        finally:
+            with self._lock:
+                state.scheduled = False
+                state.jobs_completed += 1
+                has_more = bool(state.pending_bars)
+            
+            # Bars that arrived while the job ran get their own job
+            if has_more and self.is_running:
+                self._schedule(symbol)
+    
+    def get_status(self) -> Dict:
+        """Pool load and per-symbol learning status"""
+        with self._lock:
+            states = list(self._states.values())
+            deferred = list(self._deferred)
+        
+        return {
+            'is_running': self.is_running,
+            'workers': len(self._workers),
+            'queue_depth': self._jobs.qsize(),
+            'max_queue': self.max_queue,
+            'deferred_symbols': deferred,
+            'rejected_jobs': self.rejected_jobs,
+            'symbols': {
+                state.symbol: {
+                    'pending_bars': sum(len(bars) for bars in state.pending_bars),
+                    'scheduled': state.scheduled,
+                    'jobs_completed': state.jobs_completed,
+                    'last_error': state.last_error,
+                    'total_adaptations': len(state.engine.learning_sessions),
+                    'last_adaptation': state.engine.last_adaptation.isoformat()
+                }
+                for state in states
+            }
+        }
+
 # Global real-time learning engine
-real_time_engine = RealTimeLearningEngine()
\ No newline at end of file
+real_time_engine = RealTimeLearningEngine(process_isolated=config.LEARNING_PROCESS_ISOLATED)
+
+# Global multi-symbol learning pool (started on demand)
+learning_pool = LearningWorkerPool(process_isolated=config.LEARNING_PROCESS_ISOLATED)
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Batch Sentiment Scoring for news articles with pluggable scorers
+"""
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Polarity of finance-oriented terms (-1 very negative .. +1 very positive)
+FINANCIAL_LEXICON = {
+    # Positive
+    'beat': 0.6, 'beats': 0.6, 'surge': 0.7, 'surges': 0.7, 'surged': 0.7, 'soar': 0.8, 'soars': 0.8,
+    'soared': 0.8, 'rally': 0.6, 'rallies': 0.6, 'rallied': 0.6, 'gain': 0.5, 'gains': 0.5, 'gained': 0.5,
+    'jump': 0.5, 'jumps': 0.5, 'jumped': 0.5, 'rise': 0.4, 'rises': 0.4, 'rose': 0.4, 'climb': 0.4,
+    'climbs': 0.4, 'record': 0.4, 'strong': 0.5, 'stronger': 0.5, 'robust': 0.5, 'growth': 0.4,
+    'grow': 0.4, 'grows': 0.4, 'profit': 0.4, 'profitable': 0.5, 'upgrade': 0.6, 'upgraded': 0.6,
+    'upgrades': 0.6, 'outperform': 0.6, 'outperforms': 0.6, 'bullish': 0.7, 'optimistic': 0.5,
+    'boost': 0.5, 'boosts': 0.5, 'boosted': 0.5, 'exceed': 0.5, 'exceeds': 0.5, 'exceeded': 0.5,
+    'raise': 0.3, 'raises': 0.3, 'raised': 0.3, 'expand': 0.3, 'expands': 0.3, 'expansion': 0.3,
+    'win': 0.5, 'wins': 0.5, 'won': 0.5, 'approval': 0.5, 'approved': 0.5, 'breakthrough': 0.7,
+    'dividend': 0.2, 'buyback': 0.3, 'positive': 0.5, 'good': 0.4, 'great': 0.6, 'best': 0.6,
+    'success': 0.6, 'successful': 0.6, 'improve': 0.4, 'improves': 0.4, 'improved': 0.4,
+    'recovery': 0.4, 'rebound': 0.4, 'rebounds': 0.4, 'momentum': 0.3, 'opportunity': 0.3,
+    # Negative
+    'miss': -0.6, 'misses': -0.6, 'missed': -0.6, 'plunge': -0.8, 'plunges': -0.8, 'plunged': -0.8,
+    'tumble': -0.7, 'tumbles': -0.7, 'tumbled': -0.7, 'slump': -0.7, 'slumps': -0.7, 'crash': -0.9,
+    'fall': -0.4, 'falls': -0.4, 'fell': -0.4, 'drop': -0.4, 'drops': -0.4, 'dropped': -0.4,
+    'decline': -0.4, 'declines': -0.4, 'declined': -0.4, 'loss': -0.5, 'losses': -0.5, 'weak': -0.5,
+    'weaker': -0.5, 'downgrade': -0.6, 'downgraded': -0.6, 'downgrades': -0.6, 'underperform': -0.6,
+    'bearish': -0.7, 'pessimistic': -0.5, 'cut': -0.4, 'cuts': -0.4, 'layoffs': -0.6, 'lawsuit': -0.5,
+    'sued': -0.5, 'probe': -0.4, 'investigation': -0.4, 'fraud': -0.9, 'recall': -0.5, 'warning': -0.5,
+    'warns': -0.5, 'risk': -0.2, 'risks': -0.2, 'concern': -0.4, 'concerns': -0.4, 'fear': -0.5,
+    'fears': -0.5, 'volatile': -0.3, 'volatility': -0.2, 'selloff': -0.6, 'bankruptcy': -0.9,
+    'default': -0.7, 'debt': -0.2, 'negative': -0.5, 'bad': -0.5, 'worst': -0.7, 'fail': -0.6,
+    'fails': -0.6, 'failed': -0.6, 'slowdown': -0.5, 'recession': -0.7, 'inflation': -0.2,
+    'delay': -0.3, 'delays': -0.3, 'delayed': -0.3, 'shortfall': -0.6, 'uncertainty': -0.4
+}
+
+# Same cut-offs the analyzer has always used for labels
+POSITIVE_THRESHOLD = 0.1
+NEGATIVE_THRESHOLD = -0.1
+
+
+def label_scores(scores: np.ndarray) -> np.ndarray:
+    """Map polarity scores to Positive/Negative/Neutral labels"""
+    return np.where(scores > POSITIVE_THRESHOLD, 'Positive',
+                    np.where(scores < NEGATIVE_THRESHOLD, 'Negative', 'Neutral')).astype(object)
+
+
+class LexiconSentimentScorer:
+    """Scores many texts at once against a precompiled term-polarity lexicon"""
+
+    name = 'lexicon'
+
+    def __init__(self, lexicon: Optional[Dict[str, float]] = None, fallback: Optional['TextBlobSentimentScorer'] = None):
+        """
+        Args:
+            lexicon: Term polarities (FINANCIAL_LEXICON if None)
+            fallback: Scorer for texts that contain no lexicon term (they score 0.0 if None)
+        """
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        self.lexicon = lexicon or FINANCIAL_LEXICON
+        self.fallback = fallback
+
+        # Fixed vocabulary: tokenization and counting run as one sparse-matrix pass
+        terms = sorted(self.lexicon)
+        self.vectorizer = CountVectorizer(vocabulary=terms, lowercase=True,
+                                          token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z]+\b")
+        self.weights = np.array([self.lexicon[term] for term in terms], dtype=np.float64)
+
+    def score_batch(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a batch of texts
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            Tuple of (scores in [-1, 1], labels)
+        """
+        if not texts:
+            return np.zeros(0), np.zeros(0, dtype=object)
+
+        counts = self.vectorizer.transform(texts)
+        matched = np.asarray(counts.sum(axis=1)).ravel()
+        polarity = counts @ self.weights
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(matched > 0, polarity / np.maximum(matched, 1), 0.0)
+
+        if self.fallback is not None:
+            unmatched = np.flatnonzero(matched == 0)
+            if len(unmatched):
+                fallback_scores, _ = self.fallback.score_batch([texts[i] for i in unmatched])
+                scores[unmatched] = fallback_scores
+
+        scores = np.round(np.clip(scores, -1.0, 1.0), 3)
+        return scores, label_scores(scores)
+
+
+class TextBlobSentimentScorer:
+    """Per-text TextBlob polarity (the analyzer's original scorer)"""
+
+    name = 'textblob'
+
+    def __init__(self):
+        from textblob import TextBlob
+        self._textblob = TextBlob
+        self._clean = re.compile(r'[^a-zA-Z\s]')
+
+    def score_batch(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Score a batch of texts one TextBlob at a time"""
+        scores = np.array([
+            self._textblob(self._clean.sub('', text)).sentiment.polarity for text in texts
+        ], dtype=np.float64)
+        scores = np.round(scores, 3)
+        return scores, label_scores(scores)
+
+
+def _lexicon_with_fallback():
+    """Lexicon scorer that defers to TextBlob for texts without lexicon terms"""
+    try:
+        fallback = TextBlobSentimentScorer()
+    except ImportError:
+        fallback = None
+    return LexiconSentimentScorer(fallback=fallback)
+
+
+# Registered scorer factories; register_scorer adds custom ones
+SENTIMENT_SCORERS: Dict[str, Callable] = {
+    'lexicon': _lexicon_with_fallback,
+    'lexicon_only': LexiconSentimentScorer,
+    'textblob': TextBlobSentimentScorer
+}
+
+
+def register_scorer(name: str, factory: Callable):
+    """Register a scorer factory; the scorer must provide score_batch(texts) -> (scores, labels)"""
+    SENTIMENT_SCORERS[name] = factory
+
+
+def get_sentiment_scorer(name: str = 'lexicon'):
+    """Build a registered scorer, falling back to TextBlob if it can't be created"""
+    try:
+        return SENTIMENT_SCORERS[name]()
+    except Exception as e:
+        print(f"Sentiment scorer '{name}' unavailable, using TextBlob: {e}")
+        return TextBlobSentimentScorer()
+
+
+def benchmark_scorers(texts: List[str], names: Optional[List[str]] = None, repeats: int = 3) -> Dict[str, Dict]:
+    """
+    Measure scoring throughput of registered scorers
+
+    Args:
+        texts: Sample article texts
+        names: Scorers to benchmark (all registered if None)
+        repeats: Runs per scorer (the fastest is reported)
+
+    Returns:
+        Per-scorer elapsed seconds and articles per second
+    """
+    results = {}
+    for name in names or list(SENTIMENT_SCORERS):
+        try:
+            scorer = SENTIMENT_SCORERS[name]()
+        except Exception as e:
+            results[name] = {'error': str(e)}
+            continue
+
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            scorer.score_batch(texts)
+            timings.append(time.perf_counter() - started)
+
+        elapsed = min(timings)
+        results[name] = {
+            'articles': len(texts),
+            'elapsed_seconds': elapsed,
+            'articles_per_second': len(texts) / elapsed if elapsed > 0 else float('inf')
+        }
+
+    return results
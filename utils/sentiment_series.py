@@ -0,0 +1,180 @@
+"""
+News Sentiment Time Series aggregated per symbol into hourly and daily buckets
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from database.models import Base, SentimentBucket, create_engine_and_session
+
+# Bucket widths by resolution name
+RESOLUTIONS = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1)
+}
+
+# Columns added to price data by add_sentiment_features
+SENTIMENT_FEATURES = ['news_sentiment', 'news_volume']
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """Start of the bucket containing a timestamp (timestamps are naive UTC)"""
+    if resolution == 'hour':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class SentimentTimeSeries:
+    """Incrementally maintained sentiment aggregates with range queries and price-data joins"""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+
+    @property
+    def session_factory(self):
+        with self._lock:
+            if self._session_factory is None:
+                engine, self._session_factory = create_engine_and_session()
+                Base.metadata.create_all(bind=engine, tables=[SentimentBucket.__table__])
+            return self._session_factory
+
+    def record(self, session, entries: List[Tuple[str, datetime, float, str, float]]):
+        """
+        Add scored articles to their hourly and daily buckets
+
+        Runs inside the caller's session so bucket updates commit together with
+        the articles; the caller commits.
+
+        Args:
+            session: Open SQLAlchemy session
+            entries: (symbol, published, sentiment_score, sentiment_label, relevance)
+                per new article mention
+        """
+        increments: Dict[Tuple[str, str, datetime], np.ndarray] = {}
+        for symbol, published, score, label, relevance in entries:
+            # count, score_sum, positive, negative, relevance_sum, weighted_score_sum
+            increment = np.array([1, score, label == 'Positive', label == 'Negative', relevance, relevance * score],
+                                 dtype=np.float64)
+            for resolution in RESOLUTIONS:
+                key = (symbol.upper(), resolution, bucket_start(published, resolution))
+                increments[key] = increments[key] + increment if key in increments else increment
+
+        if not increments:
+            return
+
+        existing = {
+            (row.symbol, row.resolution, row.bucket_start): row
+            for row in session.query(SentimentBucket).filter(
+                SentimentBucket.symbol.in_(list({symbol for symbol, _, _ in increments})),
+                SentimentBucket.bucket_start.in_(list({start for _, _, start in increments}))
+            ).all()
+        }
+
+        for (symbol, resolution, start), increment in increments.items():
+            count, total, positive, negative, relevance, weighted = increment.tolist()
+            row = existing.get((symbol, resolution, start))
+            if row is None:
+                row = SentimentBucket(symbol=symbol, resolution=resolution, bucket_start=start,
+                                      article_count=0, score_sum=0.0, positive_count=0, negative_count=0,
+                                      relevance_sum=0.0, weighted_score_sum=0.0)
+                session.add(row)
+            row.article_count += int(count)
+            row.score_sum += total
+            row.positive_count += int(positive)
+            row.negative_count += int(negative)
+            row.relevance_sum += relevance
+            row.weighted_score_sum += weighted
+
+    def query(self, symbol: str, start: Optional[datetime] = None, end: Optional[datetime] = None,
+              resolution: str = 'day') -> pd.DataFrame:
+        """
+        Aggregated sentiment for a symbol over a time range
+
+        Args:
+            symbol: Stock ticker symbol
+            start: First bucket start to include (unbounded if None)
+            end: Last bucket start to include (unbounded if None)
+            resolution: 'hour' or 'day'
+
+        Returns:
+            DataFrame indexed by bucket_start with article_count, mean_score,
+            positive_count, negative_count, relevance_sum and weighted_score_sum
+        """
+        session = self.session_factory()
+        try:
+            query = session.query(
+                SentimentBucket.bucket_start, SentimentBucket.article_count, SentimentBucket.score_sum,
+                SentimentBucket.positive_count, SentimentBucket.negative_count,
+                SentimentBucket.relevance_sum, SentimentBucket.weighted_score_sum
+            ).filter(SentimentBucket.symbol == symbol.upper(), SentimentBucket.resolution == resolution)
+            if start is not None:
+                query = query.filter(SentimentBucket.bucket_start >= start)
+            if end is not None:
+                query = query.filter(SentimentBucket.bucket_start <= end)
+            rows = query.order_by(SentimentBucket.bucket_start).all()
+        finally:
+            session.close()
+
+        frame = pd.DataFrame(rows, columns=['bucket_start', 'article_count', 'score_sum',
+                                            'positive_count', 'negative_count',
+                                            'relevance_sum', 'weighted_score_sum'])
+        frame['mean_score'] = frame['score_sum'] / frame['article_count'].where(frame['article_count'] > 0)
+        return frame.drop(columns='score_sum').set_index('bucket_start')
+
+    def add_sentiment_features(self, data: pd.DataFrame, symbol: str, resolution: str = 'day',
+                               max_staleness: timedelta = timedelta(days=3)) -> pd.DataFrame:
+        """
+        Join sentiment aggregates onto price bars as model features
+
+        Each bar gets the most recent bucket that closed at or before the bar's
+        timestamp (no look-ahead); bars without a bucket within max_staleness get 0.
+
+        Args:
+            data: Time-indexed price data
+            symbol: Stock ticker symbol
+            resolution: Bucket resolution to join
+            max_staleness: Oldest bucket end still carried forward onto a bar
+
+        Returns:
+            Copy of data with news_sentiment and news_volume columns
+        """
+        result = data.copy()
+        result['news_sentiment'] = 0.0
+        result['news_volume'] = 0.0
+        if len(data) == 0:
+            return result
+
+        bar_times = pd.DatetimeIndex(data.index)
+        if bar_times.tz is not None:
+            bar_times = bar_times.tz_convert('UTC').tz_localize(None)
+
+        width = RESOLUTIONS[resolution]
+        buckets = self.query(symbol, start=bar_times.min().to_pydatetime() - max_staleness - width,
+                             end=bar_times.max().to_pydatetime(), resolution=resolution)
+        if buckets.empty:
+            return result
+
+        bucket_frame = pd.DataFrame({
+            'bucket_end': pd.DatetimeIndex(buckets.index) + width,
+            'news_sentiment': buckets['mean_score'].fillna(0.0).to_numpy(),
+            'news_volume': np.log1p(buckets['article_count'].to_numpy(dtype=np.float64))
+        })
+        bars = pd.DataFrame({'bar_time': bar_times.astype('datetime64[ns]'), 'position': np.arange(len(data))})
+
+        joined = pd.merge_asof(
+            bars.sort_values('bar_time'), bucket_frame.astype({'bucket_end': 'datetime64[ns]'}),
+            left_on='bar_time', right_on='bucket_end', direction='backward',
+            tolerance=pd.Timedelta(max_staleness)
+        ).sort_values('position')
+
+        result['news_sentiment'] = joined['news_sentiment'].fillna(0.0).to_numpy()
+        result['news_volume'] = joined['news_volume'].fillna(0.0).to_numpy()
+        return result
+
+
+# Global sentiment time series backed by the application database
+sentiment_series = SentimentTimeSeries()
@@ -0,0 +1,131 @@
+"""
+Sentiment-Weighted Signal Fusion from the stored news sentiment history
+"""
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.sentiment_series import RESOLUTIONS, SentimentTimeSeries, sentiment_series
+
+# Columns added to price data by add_news_signal
+NEWS_SIGNAL_COLUMNS = ['news_signal', 'news_signal_mass']
+
+
+class SentimentSignalFusion:
+    """Folds time-decayed, relevance-weighted news sentiment into technical signal strength"""
+
+    def __init__(self, series: Optional[SentimentTimeSeries] = None, resolution: str = 'hour',
+                 half_life: timedelta = timedelta(hours=24), lookback: timedelta = timedelta(days=7),
+                 max_adjustment: float = 1.5, saturation: float = 3.0, min_mass: float = 0.25):
+        """
+        Args:
+            series: Sentiment bucket store (the global sentiment_series if None)
+            resolution: Bucket resolution the decay runs over
+            half_life: Age at which a bucket's weight halves
+            lookback: Oldest bucket that still contributes
+            max_adjustment: Largest change to signal strength from news
+            saturation: Decayed relevance mass at which news gets its full weight
+            min_mass: Decayed relevance mass below which news is ignored
+        """
+        self.series = series or sentiment_series
+        self.resolution = resolution
+        self.width = RESOLUTIONS[resolution]
+        self.max_adjustment = max_adjustment
+        self.saturation = saturation
+        self.min_mass = min_mass
+
+        # Decay weight per bucket age (0 = the most recently closed bucket), computed once
+        self.lookback_buckets = max(int(lookback / self.width), 1)
+        self.decay_weights = 0.5 ** (np.arange(self.lookback_buckets) / (half_life / self.width))
+
+    def add_news_signal(self, data: pd.DataFrame, symbol: str,
+                        live_cutoff: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Attach the decayed news sentiment to every bar
+
+        The decayed sums are computed once over the bucket grid, so each bar is a
+        single index lookup. Historical bars only see buckets that closed at or
+        before their timestamp (the session open for daily bars).
+
+        Args:
+            data: Time-indexed price data
+            symbol: Stock ticker symbol
+            live_cutoff: For a live signal, the time (naive UTC) up to which the
+                latest bar may use news, including the still-open bucket; earlier
+                bars keep the bar-time cutoff
+
+        Returns:
+            Copy of data with news_signal (relevance-weighted mean score in [-1, 1])
+            and news_signal_mass (decayed relevance mass) columns
+        """
+        result = data.copy()
+        result['news_signal'] = 0.0
+        result['news_signal_mass'] = 0.0
+        if len(data) == 0:
+            return result
+
+        # Buckets are stored in naive UTC; bring bar times onto the same clock
+        bar_times = pd.DatetimeIndex(data.index)
+        if bar_times.tz is not None:
+            bar_times = bar_times.tz_convert('UTC').tz_localize(None)
+
+        cutoffs = bar_times.to_numpy(dtype='datetime64[ns]').copy()
+        if live_cutoff is not None:
+            cutoffs[-1] = max(cutoffs[-1], np.datetime64(pd.Timestamp(live_cutoff), 'ns'))
+        cutoffs = pd.DatetimeIndex(cutoffs)
+
+        width = pd.Timedelta(self.width)
+        grid_start = cutoffs.min().floor(width) - width * self.lookback_buckets
+        buckets = self.series.query(symbol, start=grid_start.to_pydatetime(),
+                                    end=cutoffs.max().to_pydatetime(), resolution=self.resolution)
+        if buckets.empty:
+            return result
+
+        # Relevance-weighted score and relevance per grid slot
+        slots = int((cutoffs.max() - grid_start) // width) + 1
+        positions = ((pd.DatetimeIndex(buckets.index) - grid_start) // width).to_numpy()
+        weighted_scores = np.zeros(slots)
+        relevance = np.zeros(slots)
+        np.add.at(weighted_scores, positions, buckets['weighted_score_sum'].to_numpy(dtype=np.float64))
+        np.add.at(relevance, positions, buckets['relevance_sum'].to_numpy(dtype=np.float64))
+
+        # Causal convolution with the decay weights: decayed sums ending at every slot
+        decayed_scores = np.convolve(weighted_scores, self.decay_weights)[:slots]
+        decayed_mass = np.convolve(relevance, self.decay_weights)[:slots]
+
+        # Last bucket fully closed at each bar's cutoff
+        last_closed = ((cutoffs - grid_start) // width).to_numpy() - 1
+        if live_cutoff is not None:
+            # Everything in the still-open bucket was published before the live cutoff
+            last_closed[-1] += 1
+        mass = np.where(last_closed >= 0, decayed_mass[np.clip(last_closed, 0, None)], 0.0)
+        scores = np.where(last_closed >= 0, decayed_scores[np.clip(last_closed, 0, None)], 0.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['news_signal'] = np.where(mass > 0, np.clip(scores / mass, -1.0, 1.0), 0.0)
+        result['news_signal_mass'] = mass
+        return result
+
+    def adjustment(self, news_signal: float, mass: float) -> Tuple[float, Optional[str]]:
+        """
+        Signal-strength adjustment for one bar's decayed news sentiment
+
+        Args:
+            news_signal: Relevance-weighted mean sentiment in [-1, 1]
+            mass: Decayed relevance mass behind it
+
+        Returns:
+            Tuple of (strength adjustment, reason or None when news is too thin)
+        """
+        if not np.isfinite(mass) or mass < self.min_mass or news_signal == 0:
+            return 0.0, None
+
+        adjustment = self.max_adjustment * news_signal * min(1.0, mass / self.saturation)
+        tone = 'bullish' if adjustment > 0 else 'bearish'
+        return adjustment, f"News sentiment {news_signal:+.2f} ({tone})"
+
+
+# Global sentiment fusion over the application's stored sentiment history
+signal_fusion = SentimentSignalFusion()